@@ -7,10 +7,25 @@ import re
 
 from jobseeker_agent.utils.paths import load_prompt, load_cv_template
 from jobseeker_agent.utils.llm import get_llm
+from jobseeker_agent.utils.fake_llm import register_field_values
 from jobseeker_agent.utils.paths import get_data_path, get_ranking_report_path
 
 load_dotenv()
 
+# Text found in an experience block of the .tex -> key of the experience in the ranking
+EXPERIENCE_MARKERS = {
+    "\\textbf{Thales DMS}": "Thales DMS",
+    "Job-Seeking Agentic Workflow": "JobseekerAgent",
+    "Camera Calibration for Autonomous Vehicle": "CameraCalibration",
+    "\\textbf{IBM France}": "IBM France",
+}
+# Skill category in the ranking -> category name in the .tex
+SKILL_CATEGORIES = {
+    "expertise": "Expertise",
+    "programming_language": "Programming Languages",
+    "technologies": "Technologies",
+}
+
 class SkillRanking(TypedDict):
     """Response structure for skill ranking."""
     expertise: Annotated[List[str], ..., "Expertise part of the skills section to rank."]
@@ -78,11 +93,7 @@ def reorder_experiences(tex_content: str, ranked_experiences: List[str], hidden_
 
     entry_map = {}
     for block in entries:
-        key = "Unknown"
-        if "\\textbf{Thales DMS}" in block: key = "Thales DMS"
-        elif "Job-Seeking Agentic Workflow" in block: key = "JobseekerAgent"
-        elif "Camera Calibration for Autonomous Vehicle" in block: key = "CameraCalibration"
-        elif "\\textbf{IBM France}" in block: key = "IBM France"
+        key = next((key for marker, key in EXPERIENCE_MARKERS.items() if marker in block), "Unknown")
         entry_map[key] = block
 
     # Build the new section
@@ -108,22 +119,33 @@ def reorder_experiences(tex_content: str, ranked_experiences: List[str], hidden_
 
     return tex_content # Fallback
 
+def _skill_category_pattern(tex_category: str) -> re.Pattern:
+    # This more flexible pattern should find the category regardless of minor spacing issues
+    return re.compile(f"(\\{{\\\\sl\\s*{re.escape(tex_category)}:}})(.*?)(?=\\\\\\\\)", re.IGNORECASE)
+
+
+def _experiences_in(text: str) -> List[str]:
+    """Keys of the experiences present in a resume (or a prompt containing it)."""
+    return [key for marker, key in EXPERIENCE_MARKERS.items() if marker in text]
+
+
+def _skills_in(tex_category: str):
+    """Extractor of the skills listed under a category of a resume."""
+    def extract(text: str) -> List[str]:
+        match = _skill_category_pattern(tex_category).search(text)
+        if not match:
+            return []
+        return [skill.strip() for skill in re.split(r"[,;]", match.group(2)) if skill.strip()]
+    return extract
+
+
 def reorder_skills(tex_content: str, ranked_skills: Dict[str, List[str]]) -> str:
     """
     Reorders the skills within each category in the resume's .tex file content.
     """
-    # Map des noms de catégories internes vers les noms .tex
-    category_map = {
-        "expertise": "Expertise",
-        "programming_language": "Programming Languages",
-        "technologies": "Technologies"
-    }
-    
     for internal_name, skills in ranked_skills.items():
-        tex_category = category_map.get(internal_name, internal_name)
-
-        # This more flexible pattern should find the category regardless of minor spacing issues
-        pattern = re.compile(f"(\\{{\\\\sl\\s*{re.escape(tex_category)}:}})(.*?)(?=\\\\\\\\)", re.IGNORECASE)
+        tex_category = SKILL_CATEGORIES.get(internal_name, internal_name)
+        pattern = _skill_category_pattern(tex_category)
         
         def replacer(match):
             prefix = match.group(1)
@@ -136,6 +158,12 @@ def reorder_skills(tex_content: str, ranked_skills: Dict[str, List[str]]) -> str
             
     return tex_content
 
+# fake: models rank the experiences and skills of the resume found in the prompt
+register_field_values("experience_ranking", _experiences_in)
+for _internal_name, _tex_category in SKILL_CATEGORIES.items():
+    register_field_values(_internal_name, _skills_in(_tex_category))
+
+
 if __name__ == "__main__":
     from jobseeker_agent.scraper.extract_job_details import extract_job_details
     from jobseeker_agent.utils.paths import load_raw_jobs
@@ -1,19 +1,22 @@
 import json
 import markdown
 import re
-import threading
 from flask import (
     Blueprint,
+    redirect,
     render_template,
     send_from_directory,
     jsonify,
     request,
+    url_for,
 )
-from jobseeker_agent.interface import state
+from jobseeker_agent.interface import progress, sessions
+from jobseeker_agent.interface.sessions import get_session, latest_session, open_session
+from jobseeker_agent.interface.utils import build as build_utils
 from jobseeker_agent.interface.utils import compile as compile_utils
 from jobseeker_agent.interface.tasks import customizer_tasks
+from jobseeker_agent.interface.tasks.manager import get_task_manager
 from jobseeker_agent.utils.paths import (
-    get_data_path,
     load_prompt,
     load_cv_template,
     load_reviews,
@@ -24,23 +27,23 @@ bp = Blueprint("customizer", __name__)
 
 @bp.route("/apply/<int:job_id>")
 def apply_for_job(job_id: int):
-    """Sets the job_id for the customizer interface and renders the dashboard."""
+    """Opens the customizer session of a job and renders its dashboard."""
     print(f"--- Customizer: Received request to apply for job_id: {job_id} ---")
-    state.JOB_ID = job_id
-    print(f"Customizer state JOB_ID set to: {state.JOB_ID}")
-    return render_template("customizer/dashboard.html")
+    open_session(job_id)
+    return render_template("customizer/dashboard.html", job_id=job_id)
 
 
-@bp.route("/save-highlights", methods=["POST"])
-def save_highlights():
+@bp.route("/<int:job_id>/save-highlights", methods=["POST"])
+def save_highlights(job_id: int):
     """Saves the highlighted texts to a JSON file."""
+    session = get_session(job_id)
     data = request.get_json()
     highlight_list = data.get("highlights")
     if highlight_list is None:
         return jsonify({"success": False, "error": "No data provided"}), 400
 
     try:
-        output_file = get_data_path() / "resume" / str(state.JOB_ID) / "highlights.json"
+        output_file = session.job_dir / "highlights.json"
         
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(highlight_list, f, indent=4, ensure_ascii=False)
@@ -52,8 +55,17 @@ def save_highlights():
 
 @bp.route("/")
 def dashboard():
-    """Renders the main dashboard HTML."""
-    return render_template("customizer/dashboard.html")
+    """Reopens the last customizer session, or goes back to the reviewer without one."""
+    session = latest_session()
+    if session is None:
+        return redirect(url_for("reviewer.dashboard"))
+    return redirect(url_for("customizer.apply_for_job", job_id=session.job_id))
+
+
+@bp.route("/sessions")
+def list_sessions():
+    """Open customizer sessions, most recently opened first."""
+    return jsonify({"sessions": [session.to_dict() for session in sessions.list_sessions()]})
 
 
 @bp.route("/favicon.ico")
@@ -61,18 +73,19 @@ def favicon():
     return "", 204
 
 
-@bp.route("/save-tex", methods=["POST"])
-def save_tex():
+@bp.route("/<int:job_id>/save-tex", methods=["POST"])
+def save_tex(job_id: int):
     """Saves the edited TeX content and recompiles."""
+    session = get_session(job_id)
     data = request.get_json()
     content = data.get("content")
     if content is None:
         return jsonify({"success": False, "error": "No content provided"}), 400
 
-    tex_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+    tex_file = session.job_dir / "resume.tex"
     try:
         tex_file.write_text(content, encoding="utf-8")
-        success, error_log = compile_utils.compile_tex()
+        success, error_log = compile_utils.compile_tex(job_id)
         if success:
             return jsonify({"success": True})
         else:
@@ -83,11 +96,11 @@ def save_tex():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/recompile-tex", methods=["POST"])
-def recompile_tex():
+@bp.route("/<int:job_id>/recompile-tex", methods=["POST"])
+def recompile_tex(job_id: int):
     """Just recompiles the existing TeX file."""
     try:
-        success, error_log = compile_utils.compile_tex()
+        success, error_log = compile_utils.compile_tex(job_id)
         if success:
             return jsonify({"success": True})
         else:
@@ -98,15 +111,16 @@ def recompile_tex():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/reinitialize-tex", methods=["POST"])
-def reinitialize_tex():
+@bp.route("/<int:job_id>/reinitialize-tex", methods=["POST"])
+def reinitialize_tex(job_id: int):
     """Resets the TeX file to the original template and recompiles."""
+    session = get_session(job_id)
     try:
         template_content = load_cv_template()
-        tex_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        tex_file = session.job_dir / "resume.tex"
         tex_file.write_text(template_content, encoding="utf-8")
 
-        success, error_log = compile_utils.compile_tex()
+        success, error_log = compile_utils.compile_tex(job_id)
         if success:
             return jsonify({"success": True, "content": template_content})
         else:
@@ -117,16 +131,17 @@ def reinitialize_tex():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/update-title", methods=["POST"])
-def update_title():
+@bp.route("/<int:job_id>/update-title", methods=["POST"])
+def update_title(job_id: int):
     """Finds and replaces the title in the resume.tex file."""
+    session = get_session(job_id)
     data = request.get_json()
     new_title = data.get("title")
     if not new_title:
         return jsonify({"success": False, "error": "No title provided"}), 400
 
     try:
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         content = resume_file.read_text(encoding="utf-8")
 
         new_content, count = re.subn(
@@ -148,7 +163,7 @@ def update_title():
             )
         resume_file.write_text(new_content, encoding="utf-8")
 
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             resume_file.write_text(content, encoding="utf-8")
             return (
@@ -163,12 +178,13 @@ def update_title():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/run-executor", methods=["POST"])
-def run_executor():
+@bp.route("/<int:job_id>/run-executor", methods=["POST"])
+def run_executor(job_id: int):
     """Runs the keyword executor script."""
+    session = get_session(job_id)
     try:
         print("Running keyword executor...")
-        job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+        job_dir = session.job_dir
         report_file = job_dir / "insertion_report.json"
         tex_output_file = job_dir / "resume_with_insertion.tex"
 
@@ -191,7 +207,7 @@ def run_executor():
             model = "gpt-5-mini"
 
             response = customizer_tasks.execute_keywords(
-                state.JOB_DESCRIPTION,
+                session.job_description,
                 profil_pro,
                 resume_content,
                 instructions,
@@ -209,7 +225,7 @@ def run_executor():
         resume_file = job_dir / "resume.tex"
         resume_file.write_text(new_resume, encoding="utf-8")
 
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             # If compilation fails, add the error to the report instead of raising
             report.append("--- PDF COMPILATION FAILED ---")
@@ -235,32 +251,32 @@ def run_executor():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/start-extraction", methods=["POST"])
-def start_extraction():
-    """Starts the keyword extraction in a background thread."""
-    job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+@bp.route("/<int:job_id>/start-extraction", methods=["POST"])
+def start_extraction(job_id: int):
+    """Starts the keyword extraction as a background task."""
+    session = get_session(job_id)
+    job_dir = session.job_dir
     titles_file = job_dir / "titles.json"
     keywords_file = job_dir / "keywords.json"
 
     if titles_file.exists() and keywords_file.exists():
         print("✅ Keyword and title files already exist. Skipping extraction.")
-        state.EXTRACTION_STATUS = {"status": "complete", "error": None}
+        progress.set_status("extraction", job_id, status="complete", error=None)
         return jsonify({"status": "complete"})
 
-    if state.EXTRACTION_THREAD is None or not state.EXTRACTION_THREAD.is_alive():
-        print("Starting keyword extraction thread...")
-        state.EXTRACTION_THREAD = threading.Thread(target=customizer_tasks.run_keyword_extraction_task)
-        state.EXTRACTION_THREAD.daemon = True
-        state.EXTRACTION_THREAD.start()
+    if not get_task_manager().is_active("extraction", job_id):
+        print("Starting keyword extraction...")
+        get_task_manager().submit("extraction", customizer_tasks.run_keyword_extraction_task, job_id, params={"job_id": job_id})
         return jsonify({"status": "started"})
     else:
         return jsonify({"status": "already_running"})
 
 
-@bp.route("/extraction-status")
-def extraction_status():
+@bp.route("/<int:job_id>/extraction-status")
+def extraction_status(job_id: int):
     """Checks the status of the keyword extraction."""
-    job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+    session = get_session(job_id)
+    job_dir = session.job_dir
     keywords_file = job_dir / "keywords.json"
     titles_file = job_dir / "titles.json"
     
@@ -269,38 +285,38 @@ def extraction_status():
         return jsonify({"status": "complete", "error": None})
     
     # Files don't exist - check status in memory (pending, failed, or idle)
-    return jsonify(state.EXTRACTION_STATUS)
+    return jsonify(session.statuses["extraction"])
 
 
-@bp.route("/start-initial-load", methods=["POST"])
-def start_initial_load():
-    """Starts the initial data loading in a background thread."""
-    if state.DATA_LOADING_THREAD is None or not state.DATA_LOADING_THREAD.is_alive():
+@bp.route("/<int:job_id>/start-initial-load", methods=["POST"])
+def start_initial_load(job_id: int):
+    """Starts the initial data loading as a background task."""
+    session = get_session(job_id)
+    if not get_task_manager().is_active("data_loading", job_id):
         # Check if file exists for current job
-        job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+        job_dir = session.job_dir
         job_details_file = job_dir / "job_details.json"
         
         if job_details_file.exists():
-            print(f"✅ job_details.json already exists for job {state.JOB_ID}. Skipping initial load.")
+            print(f"✅ job_details.json already exists for job {job_id}. Skipping initial load.")
             return jsonify({"status": "complete"})
 
         # File doesn't exist - check if already running
-        if state.DATA_LOADING_STATUS["status"] == "pending":
+        if session.statuses["data_loading"]["status"] == "pending":
             return jsonify({"status": "already_running"})
 
-        print("Starting initial data load thread...")
-        state.DATA_LOADING_THREAD = threading.Thread(target=customizer_tasks.run_initial_load_task)
-        state.DATA_LOADING_THREAD.daemon = True
-        state.DATA_LOADING_THREAD.start()
+        print("Starting initial data load...")
+        get_task_manager().submit("data_loading", customizer_tasks.run_initial_load_task, job_id, params={"job_id": job_id})
         return jsonify({"status": "started"})
     else:
         return jsonify({"status": "already_running"})
 
 
-@bp.route("/initial-load-status")
-def initial_load_status():
+@bp.route("/<int:job_id>/initial-load-status")
+def initial_load_status(job_id: int):
     """Checks the status of the initial data load."""
-    job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+    session = get_session(job_id)
+    job_dir = session.job_dir
     job_details_file = job_dir / "job_details.json"
     
     # If file exists, it's complete (regardless of status in memory)
@@ -308,7 +324,7 @@ def initial_load_status():
         try:
             with open(job_details_file, "r", encoding="utf-8") as f:
                 job_details = json.load(f)
-            job_details["id"] = state.JOB_ID
+            job_details["id"] = job_id
 
             # Convert description from Markdown to HTML
             if "description" in job_details and job_details["description"]:
@@ -326,71 +342,66 @@ def initial_load_status():
             )
     
     # File doesn't exist - check status in memory (pending or failed)
-    return jsonify(state.DATA_LOADING_STATUS)
-
-
-@bp.route("/start-ranking", methods=["POST"])
-def start_ranking():
-    """Starts the ranking in a background thread."""
-    if state.RANKING_THREAD is None or not state.RANKING_THREAD.is_alive():
-        print("Starting ranking thread...")
-        state.RANKING_STATUS = {"status": "idle", "error": None}
-        state.RANKING_THREAD = threading.Thread(target=customizer_tasks.run_ranker_task)
-        state.RANKING_THREAD.daemon = True
-        state.RANKING_THREAD.start()
+    return jsonify(session.statuses["data_loading"])
+
+
+@bp.route("/<int:job_id>/start-ranking", methods=["POST"])
+def start_ranking(job_id: int):
+    """Starts the ranking as a background task."""
+    if not get_task_manager().is_active("ranking", job_id):
+        print("Starting ranking...")
+        progress.set_status("ranking", job_id, status="idle", error=None)
+        get_task_manager().submit("ranking", customizer_tasks.run_ranker_task, job_id, params={"job_id": job_id})
         return jsonify({"status": "started"})
     else:
         return jsonify({"status": "already_running"})
 
 
-@bp.route("/ranking-status")
-def ranking_status():
+@bp.route("/<int:job_id>/ranking-status")
+def ranking_status(job_id: int):
     """Checks the status of the ranking."""
-    return jsonify(state.RANKING_STATUS)
+    return jsonify(get_session(job_id).statuses["ranking"])
 
 
-@bp.route("/start-introduction", methods=["POST"])
-def start_introduction():
-    """Starts the introduction suggestion in a background thread."""
-    if state.INTRODUCTION_THREAD is None or not state.INTRODUCTION_THREAD.is_alive():
-        print("Starting introduction suggestion thread...")
-        state.INTRODUCTION_THREAD = threading.Thread(target=customizer_tasks.run_introducer_task)
-        state.INTRODUCTION_THREAD.daemon = True
-        state.INTRODUCTION_THREAD.start()
+@bp.route("/<int:job_id>/start-introduction", methods=["POST"])
+def start_introduction(job_id: int):
+    """Starts the introduction suggestion as a background task."""
+    if not get_task_manager().is_active("introduction", job_id):
+        print("Starting introduction suggestion...")
+        get_task_manager().submit("introduction", customizer_tasks.run_introducer_task, job_id, params={"job_id": job_id})
         return jsonify({"status": "started"})
     else:
         return jsonify({"status": "already_running"})
 
 
-@bp.route("/introduction-status")
-def introduction_status():
+@bp.route("/<int:job_id>/introduction-status")
+def introduction_status(job_id: int):
     """Checks the status of the introduction suggestion."""
-    return jsonify(state.INTRODUCTION_STATUS)
+    return jsonify(get_session(job_id).statuses["introduction"])
 
 
-@bp.route("/start-cover-letter", methods=["POST"])
-def start_cover_letter():
-    """Starts the cover letter generation in a background thread."""
-    if state.COVER_LETTER_THREAD is None or not state.COVER_LETTER_THREAD.is_alive():
-        print("Starting cover letter generation thread...")
-        state.COVER_LETTER_THREAD = threading.Thread(target=customizer_tasks.run_cover_letter_task)
-        state.COVER_LETTER_THREAD.daemon = True
-        state.COVER_LETTER_THREAD.start()
+@bp.route("/<int:job_id>/start-cover-letter", methods=["POST"])
+def start_cover_letter(job_id: int):
+    """Starts the cover letter generation as a background task."""
+    if not get_task_manager().is_active("cover_letter", job_id):
+        print("Starting cover letter generation...")
+        get_task_manager().submit("cover_letter", customizer_tasks.run_cover_letter_task, job_id, params={"job_id": job_id})
         return jsonify({"status": "started"})
     else:
         return jsonify({"status": "already_running"})
 
 
-@bp.route("/cover-letter-status")
-def cover_letter_status():
+@bp.route("/<int:job_id>/cover-letter-status")
+def cover_letter_status(job_id: int):
     """Checks the status of the cover letter generation."""
-    return jsonify(state.COVER_LETTER_STATUS)
+    return jsonify(get_session(job_id).statuses["cover_letter"])
 
 
-@bp.route("/cover-letter-content")
-def get_cover_letter_content():
+@bp.route("/<int:job_id>/cover-letter-content")
+def get_cover_letter_content(job_id: int):
     """Gets the cover letter content from the file."""
-    cover_letter_file = get_data_path() / "resume" / str(state.JOB_ID) / "cover-letter.md"
+    session = get_session(job_id)
+    cover_letter_file = session.job_dir / "cover-letter.md"
     try:
         if cover_letter_file.exists():
             content = cover_letter_file.read_text(encoding="utf-8")
@@ -401,30 +412,32 @@ def get_cover_letter_content():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/save-cover-letter", methods=["POST"])
-def save_cover_letter():
+@bp.route("/<int:job_id>/save-cover-letter", methods=["POST"])
+def save_cover_letter(job_id: int):
     """Saves the cover letter content to the file."""
+    session = get_session(job_id)
     data = request.get_json()
     content = data.get("content")
     if content is None:
         return jsonify({"success": False, "error": "No content provided"}), 400
 
     try:
-        cover_letter_file = get_data_path() / "resume" / str(state.JOB_ID) / "cover-letter.md"
+        cover_letter_file = session.job_dir / "cover-letter.md"
         cover_letter_file.write_text(content, encoding="utf-8")
         return jsonify({"success": True, "message": "Cover letter saved successfully"})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/convert-cover-letter-to-pdf", methods=["POST"])
-def convert_cover_letter_to_pdf():
+@bp.route("/<int:job_id>/convert-cover-letter-to-pdf", methods=["POST"])
+def convert_cover_letter_to_pdf(job_id: int):
     """Converts the markdown cover letter to LaTeX and compiles it to PDF."""
+    session = get_session(job_id)
     try:
         from jobseeker_agent.customizer.agents.cover_letter.md_to_tex import markdown_to_latex_cover_letter
         from jobseeker_agent.interface.utils import compile as compile_utils
         
-        job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+        job_dir = session.job_dir
         markdown_file = job_dir / "cover-letter.md"
         tex_file = job_dir / "cover-letter.tex"
         
@@ -438,7 +451,7 @@ def convert_cover_letter_to_pdf():
         
         # Compile to PDF
         print("[CONVERT] Compiling LaTeX to PDF...")
-        success, log = compile_utils.compile_cover_letter_tex()
+        success, log = compile_utils.compile_cover_letter_tex(job_id)
         
         if not success:
             return jsonify({"success": False, "error": "PDF compilation failed", "log": log}), 500
@@ -452,28 +465,41 @@ def convert_cover_letter_to_pdf():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/introduction-report")
-def get_introduction_report():
+@bp.route("/<int:job_id>/build-pdfs", methods=["POST"])
+def build_pdfs(job_id: int):
+    """Builds the final resume and cover letter PDFs of the job concurrently."""
+    try:
+        results = build_utils.build_job_pdfs(job_id)
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+    if not results:
+        return jsonify({"success": False, "error": "No document to build"}), 404
+    documents = {name: {"success": success, "log": log} for name, (success, log) in results.items()}
+    return jsonify({"success": all(success for success, _ in results.values()), "documents": documents})
+
+
+@bp.route("/<int:job_id>/introduction-report")
+def get_introduction_report(job_id: int):
     """Serves the introduction report JSON file."""
-    report_file = (
-        get_data_path() / "resume" / str(state.JOB_ID) / "opening_lines.json"
-    )
+    session = get_session(job_id)
+    report_file = session.job_dir / "opening_lines.json"
     try:
         return send_from_directory(report_file.parent, report_file.name)
     except FileNotFoundError:
         return jsonify({"error": "Introduction report file not found"}), 404
 
 
-@bp.route("/save-introduction", methods=["POST"])
-def save_introduction():
+@bp.route("/<int:job_id>/save-introduction", methods=["POST"])
+def save_introduction(job_id: int):
     """Saves the selected introduction to the resume.tex file."""
+    session = get_session(job_id)
     data = request.get_json()
     introduction_text = data.get("introduction")
     if not introduction_text:
         return jsonify({"success": False, "error": "No introduction provided"}), 400
 
     try:
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         content = resume_file.read_text(encoding="utf-8")
 
         # The new introduction text, wrapped in LaTeX formatting
@@ -506,7 +532,7 @@ def save_introduction():
 
         resume_file.write_text(new_content, encoding="utf-8")
 
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             # Revert the change if compilation fails
             resume_file.write_text(content, encoding="utf-8")
@@ -525,11 +551,12 @@ def save_introduction():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/delete-publications", methods=["POST"])
-def delete_publications():
+@bp.route("/<int:job_id>/delete-publications", methods=["POST"])
+def delete_publications(job_id: int):
     """Deletes the publications section from the resume.tex file."""
+    session = get_session(job_id)
     try:
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         content = resume_file.read_text(encoding="utf-8")
 
         # Pattern to match the entire Publications section
@@ -554,7 +581,7 @@ def delete_publications():
 
         resume_file.write_text(new_content, encoding="utf-8")
 
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             # Revert the change if compilation fails
             resume_file.write_text(content, encoding="utf-8")
@@ -573,9 +600,10 @@ def delete_publications():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/apply-manual-ranking", methods=["POST"])
-def apply_manual_ranking():
+@bp.route("/<int:job_id>/apply-manual-ranking", methods=["POST"])
+def apply_manual_ranking(job_id: int):
     """Applies a manual ranking of experiences to the resume."""
+    session = get_session(job_id)
     data = request.get_json()
     experience_order = data.get("experience_order")
     hidden_experiences = data.get("hidden_experiences", [])
@@ -586,7 +614,7 @@ def apply_manual_ranking():
     try:
         from jobseeker_agent.customizer.agents.ranker import reorder_experiences
         
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         
         # Apply the reordering (with hidden experiences)
@@ -594,7 +622,7 @@ def apply_manual_ranking():
         resume_file.write_text(updated_content, encoding="utf-8")
         
         # Recompile the PDF
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             # Revert the change if compilation fails
             resume_file.write_text(resume_content, encoding="utf-8")
@@ -613,11 +641,12 @@ def apply_manual_ranking():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/get-current-experience-order", methods=["GET"])
-def get_current_experience_order():
+@bp.route("/<int:job_id>/get-current-experience-order", methods=["GET"])
+def get_current_experience_order(job_id: int):
     """Parses and returns the current order of experiences from the resume."""
+    session = get_session(job_id)
     try:
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         
         # Experience names and their markers in the .tex file
@@ -666,11 +695,12 @@ def get_current_experience_order():
         return jsonify({"error": str(e)}), 500
 
 
-@bp.route("/get-current-skills", methods=["GET"])
-def get_current_skills():
+@bp.route("/<int:job_id>/get-current-skills", methods=["GET"])
+def get_current_skills(job_id: int):
     """Parses and returns the current skills from the resume."""
+    session = get_session(job_id)
     try:
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         
         skills = {
@@ -706,9 +736,10 @@ def get_current_skills():
         return jsonify({"error": str(e)}), 500
 
 
-@bp.route("/apply-manual-skill-ranking", methods=["POST"])
-def apply_manual_skill_ranking():
+@bp.route("/<int:job_id>/apply-manual-skill-ranking", methods=["POST"])
+def apply_manual_skill_ranking(job_id: int):
     """Applies a manual ranking of skills to the resume."""
+    session = get_session(job_id)
     data = request.get_json()
     skill_ranking = data.get("skill_ranking")
     
@@ -718,7 +749,7 @@ def apply_manual_skill_ranking():
     try:
         from jobseeker_agent.customizer.agents.ranker import reorder_skills
         
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         
         # Apply the reordering
@@ -726,7 +757,7 @@ def apply_manual_skill_ranking():
         resume_file.write_text(updated_content, encoding="utf-8")
         
         # Recompile the PDF
-        compile_success, compile_log = compile_utils.compile_tex()
+        compile_success, compile_log = compile_utils.compile_tex(job_id)
         if not compile_success:
             # Revert the change if compilation fails
             resume_file.write_text(resume_content, encoding="utf-8")
@@ -745,45 +776,47 @@ def apply_manual_skill_ranking():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/ranking-report")
-def get_ranking_report():
+@bp.route("/<int:job_id>/ranking-report")
+def get_ranking_report(job_id: int):
     """Serves the ranking report JSON file."""
-    report_file = get_data_path() / "resume" / str(state.JOB_ID) / "ranking_report.json"
+    session = get_session(job_id)
+    report_file = session.job_dir / "ranking_report.json"
     try:
         return send_from_directory(report_file.parent, report_file.name)
     except FileNotFoundError:
         return jsonify({"error": "Ranking report file not found"}), 404
 
 
-@bp.route("/job-description")
-def get_job_description():
+@bp.route("/<int:job_id>/job-description")
+def get_job_description(job_id: int):
     """Serves the job description text."""
-    if state.JOB_DESCRIPTION:
-        return jsonify({"description": state.JOB_DESCRIPTION})
+    session = get_session(job_id)
+    if session.job_description:
+        return jsonify({"description": session.job_description})
     else:
         return jsonify({"error": "Job description not loaded"}), 404
 
 
-@bp.route("/job-details")
-def get_job_details():
+@bp.route("/<int:job_id>/job-details")
+def get_job_details(job_id: int):
     """Serves the full job details."""
+    session = get_session(job_id)
     print(f"Serving job details")
-    if state.JOB_DETAILS:
-        return jsonify(state.JOB_DETAILS)
+    if session.job_details:
+        return jsonify(session.job_details)
     else:
         return jsonify({"error": "Job details not loaded"}), 404
 
 
-@bp.route("/save-validated-keywords", methods=["POST"])
-def save_validated_keywords():
+@bp.route("/<int:job_id>/save-validated-keywords", methods=["POST"])
+def save_validated_keywords(job_id: int):
     """Saves the validated keywords to a new JSON file."""
+    session = get_session(job_id)
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "No data provided"}), 400
 
-    output_file = (
-        get_data_path() / "resume" / str(state.JOB_ID) / "keywords_validated.json"
-    )
+    output_file = session.job_dir / "keywords_validated.json"
     try:
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
@@ -792,10 +825,11 @@ def save_validated_keywords():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@bp.route("/keywords")
-def get_keywords():
+@bp.route("/<int:job_id>/keywords")
+def get_keywords(job_id: int):
     """Serves the keywords JSON file (validated version if available)."""
-    job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+    session = get_session(job_id)
+    job_dir = session.job_dir
     
     # Check for validated keywords first
     validated_file = job_dir / "keywords_validated.json"
@@ -815,20 +849,22 @@ def get_keywords():
         return jsonify({"error": "Keywords file not found"}), 404
 
 
-@bp.route("/titles")
-def get_titles():
+@bp.route("/<int:job_id>/titles")
+def get_titles(job_id: int):
     """Serves the titles JSON file."""
-    titles_file = get_data_path() / "resume" / str(state.JOB_ID) / "titles.json"
+    session = get_session(job_id)
+    titles_file = session.job_dir / "titles.json"
     try:
         return send_from_directory(titles_file.parent, titles_file.name)
     except FileNotFoundError:
         return jsonify({"error": "Titles file not found"}), 404
 
 
-@bp.route("/tex")
-def serve_tex():
+@bp.route("/<int:job_id>/tex")
+def serve_tex(job_id: int):
     """Serves the raw TeX file content."""
-    tex_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+    session = get_session(job_id)
+    tex_file = session.job_dir / "resume.tex"
     try:
         content = tex_file.read_text(encoding="utf-8")
         return jsonify({"content": content})
@@ -836,10 +872,11 @@ def serve_tex():
         return jsonify({"error": "TeX file not found"}), 404
 
 
-@bp.route("/cover-letter-tex")
-def serve_cover_letter_tex():
+@bp.route("/<int:job_id>/cover-letter-tex")
+def serve_cover_letter_tex(job_id: int):
     """Serves the raw cover-letter.tex file content."""
-    tex_file = get_data_path() / "resume" / str(state.JOB_ID) / "cover-letter.tex"
+    session = get_session(job_id)
+    tex_file = session.job_dir / "cover-letter.tex"
     try:
         content = tex_file.read_text(encoding="utf-8")
         return jsonify({"content": content})
@@ -847,10 +884,11 @@ def serve_cover_letter_tex():
         return jsonify({"error": "Cover letter TeX file not found"}), 404
 
 
-@bp.route("/pdf/<path:filename>")
-def serve_pdf(filename: str):
+@bp.route("/<int:job_id>/pdf/<path:filename>")
+def serve_pdf(job_id: int, filename: str):
     """Serves the generated PDF."""
-    pdf_directory = get_data_path() / "resume" / str(state.JOB_ID)
+    session = get_session(job_id)
+    pdf_directory = session.job_dir
     response = send_from_directory(pdf_directory, filename)
     response.headers['Content-Disposition'] = 'inline'
     response.headers['X-Frame-Options'] = 'SAMEORIGIN'
@@ -0,0 +1,16 @@
+from flask import Blueprint, Response, request, stream_with_context
+
+from jobseeker_agent.interface import progress
+
+bp = Blueprint("events", __name__)
+
+
+@bp.route("/events")
+def events():
+    """Server-sent events stream of task progress and review results."""
+    last_event_id = progress.parse_last_event_id(request.headers.get("Last-Event-ID"))
+    return Response(
+        stream_with_context(progress.stream(last_event_id)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,11 +1,11 @@
 from datetime import date
 from flask import Blueprint, jsonify, render_template, request
 import markdown
-import threading
 
 from jobseeker_agent.utils.paths import (
     load_reviews,
-    load_raw_jobs,
+    load_criteria_weights,
+    save_criteria_weights,
     load_job_statuses,
     save_job_statuses,
     load_scraping_destinations,
@@ -15,110 +15,102 @@ from jobseeker_agent.utils.paths import (
     save_processed_jobs,
 )
 from jobseeker_agent.scraper.extract_job_details import extract_job_details, extract_full_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
 from jobseeker_agent.scraper.run_scraper import run_scraping
 from jobseeker_agent.scraper.update_job_statuses import update_job_statuses
 from jobseeker_agent.scraper.job_manager import add_new_job, load_raw_jobs as load_raw_jobs_manager, save_raw_jobs
 from jobseeker_agent.reviewer.review_batch import JobReviewer
 from jobseeker_agent.reviewer.agents.reviewer import review as review_agent
-from jobseeker_agent.interface import state
+from jobseeker_agent.reviewer.synthesis import render_synthesis
+from jobseeker_agent.reviewer.scoring import (
+    apply_saved_weights,
+    apply_weights,
+    get_criteria_weights,
+    get_default_weights,
+    what_if,
+)
+from jobseeker_agent.utils.events import JOB_ADDED, JOB_STATUS_CHANGED, REVIEW_SAVED, publish
+from jobseeker_agent.interface.dashboard_view import get_dashboard_view
+from jobseeker_agent.interface import progress
+from jobseeker_agent.interface.tasks.manager import TaskCancelled, check_cancelled, get_task_manager
 
 bp = Blueprint("reviewer", __name__)
 
-# Data loaded at module level (will be loaded when blueprint is imported)
-print("--- Loading reviewer data ---")
-reviews = load_reviews()
-raw_jobs = load_raw_jobs()
-print(f"Loaded {len(reviews)} reviews and {len(raw_jobs)} raw jobs.")
-
-reviews_map = {int(e["id"]): e for e in reviews}
-raw_jobs_map = {int(j["id"]): j for j in raw_jobs}
-
-base_jobs = []
-job_ids = sorted(list(set(raw_jobs_map.keys()) & set(reviews_map.keys())))
-print(f"Found {len(job_ids)} common job IDs.")
-
-for job_id in job_ids:
-    # Skip jobs whose raw status is Closed
-    if raw_jobs_map.get(job_id, {}).get("status") == "Closed":
-        continue
-    job_data = {
-        "id": job_id,
-        **raw_jobs_map.get(job_id, {}),
-        **reviews_map.get(job_id, {}),
+# Number of jobs rendered in the sidebar on first paint; the next pages come from /api/jobs
+DASHBOARD_PAGE_SIZE = 50
+
+
+def _parse_job_query(args):
+    """Parses the filters, sort and paging parameters of /api/jobs."""
+    filters = {}
+    for field in ("min_score", "max_score"):
+        if args.get(field) not in (None, ""):
+            try:
+                filters[field] = float(args[field])
+            except ValueError:
+                raise ValueError(f"Parameter '{field}' must be a number")
+    for field in ("company", "location", "workplace_type", "status", "posted_after", "posted_before"):
+        if args.get(field):
+            filters[field] = args[field]
+    order = args.get("order", "desc")
+    if order not in ("asc", "desc"):
+        raise ValueError("Parameter 'order' must be 'asc' or 'desc'")
+    try:
+        limit = int(args.get("limit", DASHBOARD_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("Parameter 'limit' must be an integer")
+    return {
+        "filters": filters,
+        "sort": args.get("sort", "score"),
+        "descending": order == "desc",
+        "cursor": args.get("cursor") or None,
+        "limit": limit,
     }
-    base_jobs.append(job_data)
-
-# Sort by score descending
-base_jobs.sort(key=lambda x: x.get("score", -float("inf")), reverse=True)
-print("Jobs sorted by score.")
 
 
 def run_review_latest_task(count: int):
     try:
         print(f"Starting latest-first review of {count} jobs")
         reviewer = JobReviewer()
-        state.REVIEW_STATUS = {"status": "running", "current": 0, "total": count, "error": None}
-        for i in range(count):
-            job_review = reviewer.review_next_latest("gpt-5-mini", with_correction=True, reasoning_level="low")
-            if job_review is None:
-                state.REVIEW_STATUS["total"] = i
-                break
-            state.REVIEW_STATUS["current"] = i + 1
-            print(f"Reviewed {i + 1}/{count} jobs (latest-first)")
-        state.REVIEW_STATUS["status"] = "completed"
-        print(f"Review (latest-first) completed. Reviewed {state.REVIEW_STATUS['current']} jobs.")
+        progress.set_status("review", status="running", current=0, total=count, error=None)
+
+        def on_review(done, _review):
+            progress.update_status("review", current=done)
+            print(f"Reviewed {done}/{count} jobs (latest-first)")
+            check_cancelled()
+
+        reviews_done = reviewer.review_pipelined(
+            count, "gpt-5-mini", with_correction=True, reasoning_level="low",
+            order="latest", progress_callback=on_review,
+        )
+        if len(reviews_done) < count:
+            progress.update_status("review", total=len(reviews_done))
+        progress.update_status("review", status="completed")
+        print(f"Review (latest-first) completed. Reviewed {progress.get_status('review')['current']} jobs.")
+    except TaskCancelled:
+        raise
     except Exception as e:
         print(f"Error during latest-first review: {str(e)}")
         import traceback
         traceback.print_exc()
-        state.REVIEW_STATUS = {
-            "status": "error",
-            "current": state.REVIEW_STATUS.get("current", 0),
-            "total": count,
-            "error": str(e)
-        }
+        progress.set_status("review", status="error", current=progress.get_status("review").get("current", 0), total=count, error=str(e))
+        raise
 
 @bp.route("/")
 def dashboard():
     """Renders the main dashboard HTML."""
     print("--- Request received for / route ---")
-    job_statuses = load_job_statuses()
-    job_statuses_map = {int(p["id"]): p for p in job_statuses}
-
-    all_jobs = []
-    for job in base_jobs:
-        job_with_status = job.copy()
-        job_with_status["status"] = job_statuses_map.get(job_with_status.get("id"))
-        
-        # Convert synthesis from Markdown to HTML
-        if "synthesis_and_decision" in job_with_status and job_with_status["synthesis_and_decision"]:
-            job_with_status["synthesis_and_decision"] = markdown.markdown(job_with_status["synthesis_and_decision"])
-
-        all_jobs.append(job_with_status)
-
-    unprocessed_jobs = [j for j in all_jobs if not j["status"]]
-    print(f"Rendering dashboard with {len(unprocessed_jobs)} unprocessed jobs.")
-
-    # Calculate review count info
-    # Total: all open jobs (not Closed) in raw_jobs
-    total_open_count = len([j for j in raw_jobs if j.get("status") != "Closed"])
-    # Unreviewed: open jobs that are NOT in reviews.json
-    unreviewed_count = len([
-        j for j in raw_jobs 
-        if j.get("status") != "Closed" and j["id"] not in reviews_map
-    ])
-    percentage = (unreviewed_count / total_open_count * 100) if total_open_count > 0 else 0
-    review_count_info = {
-        "unreviewed_count": unreviewed_count,
-        "total_open_count": total_open_count,
-        "percentage": round(percentage, 1)
-    }
+    view = get_dashboard_view()
+    view.ensure_fresh()
+    first_page = view.query({"status": "unprocessed"}, limit=DASHBOARD_PAGE_SIZE)
+    print(f"Rendering dashboard with {len(first_page['jobs'])} of {first_page['total']} unprocessed jobs.")
 
     return render_template(
         "reviewer/dashboard.html",
-        sidebar_jobs=unprocessed_jobs,
-        all_jobs=all_jobs,
-        review_count_info=review_count_info,
+        sidebar_jobs=first_page["jobs"],
+        sidebar_total=first_page["total"],
+        next_cursor=first_page["next_cursor"],
+        review_count_info=view.review_count_info(),
     )
 
 
@@ -126,9 +118,9 @@ def dashboard():
 def get_job_details(job_id: int):
     """Fetches live job details and returns as JSON."""
     print(f"--- Request received for /job/{job_id} ---")
-    job_link = raw_jobs_map.get(job_id, {}).get("job_link")
+    job_link = (get_dashboard_view().get_raw_job(job_id) or {}).get("job_link")
     if not job_link:
-        print(f"Job ID {job_id} not found in raw_jobs_map.")
+        print(f"Job ID {job_id} not found in raw jobs.")
         return jsonify({"error": "Job not found"}), 404
     
     print(f"Fetching live details for job link: {job_link}")
@@ -182,6 +174,7 @@ def update_status(job_id: int):
     current_statuses.append(status)
     
     save_job_statuses(current_statuses)
+    publish(JOB_STATUS_CHANGED, status=status)
     print(f"Status for job {job_id} saved successfully.")
 
     return jsonify({"success": True, "status": status})
@@ -206,34 +199,28 @@ def start_scraping():
     if destinations is None:
         destinations = load_scraping_destinations()
     
-    if state.SCRAPING_THREAD and state.SCRAPING_THREAD.is_alive():
+    if get_task_manager().is_active("scraping"):
         return jsonify({"success": False, "message": "Scraping already in progress"}), 400
     
     # Reset status
-    state.SCRAPING_STATUS = {"status": "running", "new_jobs_count": 0, "error": None}
+    progress.set_status("scraping", status="running", new_jobs_count=0, error=None)
     
     def scrape_task():
         try:
             print(f"Starting scraping with time_horizon={time_horizon}")
             new_jobs_count = run_scraping(max_time=time_horizon, destinations_config=destinations)
-            state.SCRAPING_STATUS = {
-                "status": "completed",
-                "new_jobs_count": new_jobs_count,
-                "error": None
-            }
+            progress.set_status("scraping", status="completed", new_jobs_count=new_jobs_count, error=None)
             print(f"Scraping completed. Added {new_jobs_count} new jobs.")
         except Exception as e:
             print(f"Error during scraping: {str(e)}")
-            state.SCRAPING_STATUS = {
-                "status": "error",
-                "new_jobs_count": 0,
-                "error": str(e)
-            }
+            progress.set_status("scraping", status="error", new_jobs_count=0, error=str(e))
+            raise
     
-    state.SCRAPING_THREAD = threading.Thread(target=scrape_task)
-    state.SCRAPING_THREAD.start()
+    task = get_task_manager().submit(
+        "scraping", scrape_task, params={"time_horizon": time_horizon, "destinations": len(destinations)}
+    )
     
-    return jsonify({"success": True, "message": "Scraping started"})
+    return jsonify({"success": True, "message": "Scraping started", "task_id": task.id})
 
 
 @bp.route("/scrape/config", methods=["GET"])
@@ -270,7 +257,7 @@ def save_scraping_config():
 @bp.route("/scrape/status", methods=["GET"])
 def get_scraping_status():
     """Get current scraping status."""
-    return jsonify(state.SCRAPING_STATUS)
+    return jsonify(progress.get_status("scraping"))
 
 
 @bp.route("/update-status", methods=["POST"])
@@ -278,57 +265,56 @@ def start_update_status():
     """Launch job status update in a background thread."""
     print("--- Request received for /update-status ---")
     
-    if state.UPDATE_STATUS_THREAD and state.UPDATE_STATUS_THREAD.is_alive():
+    if get_task_manager().is_active("update_status"):
         return jsonify({"success": False, "message": "Status update already in progress"}), 400
     
     # Reset status
-    state.UPDATE_STATUS_STATUS = {"status": "running", "current": 0, "total": 0, "jobs_updated_count": 0, "error": None}
+    progress.set_status("update_status", status="running", current=0, total=0, jobs_updated_count=0, error=None)
     
     def update_status_task():
         try:
             print("Starting job status update...")
             
             def progress_callback(current, total):
-                state.UPDATE_STATUS_STATUS = {
-                    "status": "running",
-                    "current": current,
-                    "total": total,
-                    "jobs_updated_count": 0,
-                    "error": None
-                }
+                progress.set_status("update_status", status="running", current=current, total=total, jobs_updated_count=0, error=None)
+                check_cancelled()
             
             jobs_updated_count = update_job_statuses(status_callback=progress_callback)
-            final_total = state.UPDATE_STATUS_STATUS.get("total", 0)
-            state.UPDATE_STATUS_STATUS = {
-                "status": "completed",
-                "current": final_total,
-                "total": final_total,
-                "jobs_updated_count": jobs_updated_count,
-                "error": None
-            }
+            final_total = progress.get_status("update_status").get("total", 0)
+            progress.set_status(
+                "update_status",
+                status="completed",
+                current=final_total,
+                total=final_total,
+                jobs_updated_count=jobs_updated_count,
+                error=None,
+            )
             print(f"Status update completed. {jobs_updated_count} jobs updated to 'Closed'.")
+        except TaskCancelled:
+            raise
         except Exception as e:
             print(f"Error during status update: {str(e)}")
             import traceback
             traceback.print_exc()
-            state.UPDATE_STATUS_STATUS = {
-                "status": "error",
-                "current": state.UPDATE_STATUS_STATUS.get("current", 0),
-                "total": state.UPDATE_STATUS_STATUS.get("total", 0),
-                "jobs_updated_count": 0,
-                "error": str(e)
-            }
+            progress.set_status(
+                "update_status",
+                status="error",
+                current=progress.get_status("update_status").get("current", 0),
+                total=progress.get_status("update_status").get("total", 0),
+                jobs_updated_count=0,
+                error=str(e),
+            )
+            raise
     
-    state.UPDATE_STATUS_THREAD = threading.Thread(target=update_status_task)
-    state.UPDATE_STATUS_THREAD.start()
+    task = get_task_manager().submit("update_status", update_status_task)
     
-    return jsonify({"success": True, "message": "Status update started"})
+    return jsonify({"success": True, "message": "Status update started", "task_id": task.id})
 
 
 @bp.route("/update-status/status", methods=["GET"])
 def get_update_status_status():
     """Get current update status status."""
-    return jsonify(state.UPDATE_STATUS_STATUS)
+    return jsonify(progress.get_status("update_status"))
 
 
 @bp.route("/review", methods=["POST"])
@@ -338,43 +324,44 @@ def start_review():
     data = request.get_json()
     count = data.get("count", 10)
     
-    if state.REVIEW_STATUS.get("status") == "running":
+    if get_task_manager().is_active("review"):
         return jsonify({"success": False, "message": "Review already in progress"}), 400
     
     # Reset status
-    state.REVIEW_STATUS = {"status": "running", "current": 0, "total": count, "error": None}
+    progress.set_status("review", status="running", current=0, total=count, error=None)
     
     def review_task():
         try:
             print(f"Starting review of {count} jobs")
             reviewer = JobReviewer()
+
+            def on_review(done, _review):
+                progress.update_status("review", current=done)
+                print(f"Reviewed {done}/{count} jobs")
+                check_cancelled()
+
+            # Details of the next jobs are fetched while LLM calls are in flight
+            reviews_done = reviewer.review_pipelined(
+                count, "gpt-5-mini", with_correction=True, reasoning_level="low", progress_callback=on_review
+            )
+            if len(reviews_done) < count:
+                # No more jobs to review
+                progress.update_status("review", total=len(reviews_done))
             
-            for i in range(count):
-                job_review = reviewer.review_random_job("gpt-5-mini", with_correction=True, reasoning_level="low")
-                if job_review is None:
-                    # No more jobs to review
-                    state.REVIEW_STATUS["total"] = i
-                    break
-                state.REVIEW_STATUS["current"] = i + 1
-                print(f"Reviewed {i + 1}/{count} jobs")
-            
-            state.REVIEW_STATUS["status"] = "completed"
-            print(f"Review completed. Reviewed {state.REVIEW_STATUS['current']} jobs.")
+            progress.update_status("review", status="completed")
+            print(f"Review completed. Reviewed {progress.get_status('review')['current']} jobs.")
+        except TaskCancelled:
+            raise
         except Exception as e:
             print(f"Error during review: {str(e)}")
             import traceback
             traceback.print_exc()
-            state.REVIEW_STATUS = {
-                "status": "error",
-                "current": state.REVIEW_STATUS.get("current", 0),
-                "total": count,
-                "error": str(e)
-            }
+            progress.set_status("review", status="error", current=progress.get_status("review").get("current", 0), total=count, error=str(e))
+            raise
     
-    state.REVIEW_THREAD = threading.Thread(target=review_task)
-    state.REVIEW_THREAD.start()
+    task = get_task_manager().submit("review", review_task, params={"count": count, "order": "random"})
     
-    return jsonify({"success": True, "message": "Review started"})
+    return jsonify({"success": True, "message": "Review started", "task_id": task.id})
 
 
 @bp.route("/review/latest", methods=["POST"])
@@ -384,94 +371,45 @@ def start_review_latest():
     data = request.get_json()
     count = data.get("count", 10)
 
-    if state.REVIEW_STATUS.get("status") == "running":
+    if get_task_manager().is_active("review"):
         return jsonify({"success": False, "message": "Review already in progress"}), 400
 
-    state.REVIEW_STATUS = {"status": "running", "current": 0, "total": count, "error": None}
-    state.REVIEW_THREAD = threading.Thread(target=run_review_latest_task, args=(count,))
-    state.REVIEW_THREAD.start()
+    progress.set_status("review", status="running", current=0, total=count, error=None)
 
-    return jsonify({"success": True, "message": "Latest-first review started"})
+    task = get_task_manager().submit("review", run_review_latest_task, count, params={"count": count, "order": "latest"})
+
+    return jsonify({"success": True, "message": "Latest-first review started", "task_id": task.id})
 
 @bp.route("/review/status", methods=["GET"])
 def get_review_status():
     """Get current review status."""
-    return jsonify(state.REVIEW_STATUS)
+    return jsonify(progress.get_status("review"))
 
 
-@bp.route("/refresh-jobs", methods=["GET"])
-def refresh_jobs():
-    """Reload job data and return updated lists."""
-    print("--- Request received for /refresh-jobs ---")
-    
+@bp.route("/api/jobs", methods=["GET"])
+def list_jobs():
+    """
+    Return one page of reviewed open jobs.
+
+    Query parameters: sort (score, posted_date, id), order (asc, desc), limit, cursor
+    (next_cursor of the previous page), and the filters min_score, max_score, company,
+    location, workplace_type, status (unprocessed, processed, applied, not_interested),
+    posted_after and posted_before (YYYY-MM-DD).
+    """
     try:
-        # Reload data
-        reviews = load_reviews()
-        raw_jobs = load_raw_jobs()
-        job_statuses = load_job_statuses()
-        
-        print(f"Reloaded {len(reviews)} reviews and {len(raw_jobs)} raw jobs.")
-        
-        reviews_map = {int(e["id"]): e for e in reviews}
-        raw_jobs_map = {int(j["id"]): j for j in raw_jobs}
-        job_statuses_map = {int(p["id"]): p for p in job_statuses}
-        
-        base_jobs = []
-        job_ids = sorted(list(set(raw_jobs_map.keys()) & set(reviews_map.keys())))
-        
-        for job_id in job_ids:
-            # Skip jobs whose raw status is Closed
-            if raw_jobs_map.get(job_id, {}).get("status") == "Closed":
-                continue
-            job_data = {
-                "id": job_id,
-                **raw_jobs_map.get(job_id, {}),
-                **reviews_map.get(job_id, {}),
-            }
-            base_jobs.append(job_data)
-        
-        # Sort by score descending
-        base_jobs.sort(key=lambda x: x.get("score", -float("inf")), reverse=True)
-        
-        all_jobs = []
-        for job in base_jobs:
-            job_with_status = job.copy()
-            job_with_status["status"] = job_statuses_map.get(job_with_status.get("id"))
-            
-            # Convert synthesis from Markdown to HTML
-            if "synthesis_and_decision" in job_with_status and job_with_status["synthesis_and_decision"]:
-                job_with_status["synthesis_and_decision"] = markdown.markdown(job_with_status["synthesis_and_decision"])
-            
-            all_jobs.append(job_with_status)
-        
-        unprocessed_jobs = [j for j in all_jobs if not j["status"]]
-        
-        # Calculate review count info
-        # Total: all open jobs (not Closed) in raw_jobs
-        total_open_count = len([j for j in raw_jobs if j.get("status") != "Closed"])
-        # Unreviewed: open jobs that are NOT in reviews.json
-        unreviewed_count = len([
-            j for j in raw_jobs 
-            if j.get("status") != "Closed" and j["id"] not in reviews_map
-        ])
-        percentage = (unreviewed_count / total_open_count * 100) if total_open_count > 0 else 0
-        review_count_info = {
-            "unreviewed_count": unreviewed_count,
-            "total_open_count": total_open_count,
-            "percentage": round(percentage, 1)
-        }
-        
-        print(f"Returning {len(unprocessed_jobs)} unprocessed jobs.")
-        
-        return jsonify({
-            "success": True,
-            "jobs": all_jobs,
-            "sidebar_jobs": unprocessed_jobs,
-            "review_count_info": review_count_info
-        })
-    except Exception as e:
-        print(f"Error refreshing jobs: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        query = _parse_job_query(request.args)
+        view = get_dashboard_view()
+        if not query["cursor"]:
+            view.ensure_fresh()
+        page = view.query(**query)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    return jsonify({
+        "success": True,
+        **page,
+        "review_count_info": view.review_count_info(),
+    })
 
 
 @bp.route("/review/manual", methods=["POST"])
@@ -549,6 +487,7 @@ def manual_review():
             new_job = {"id": new_id, **new_job_data}
             jobs.append(new_job)
             save_raw_jobs(jobs)
+            publish(JOB_ADDED, job=new_job)
             
             existing_job = new_job
             print(f"Job {existing_job['id']} added successfully.")
@@ -562,9 +501,12 @@ def manual_review():
         job_details = extract_full_job_details(existing_job["job_link"])
         if not job_details:
             return jsonify({"success": False, "message": "Failed to retrieve job details for review"}), 400
+        job_details = compact_job_details(existing_job, job_details)
         
         # Faire le review directement
         review = review_agent(existing_job, job_details, "gpt-4.1", with_correction=True)
+        apply_saved_weights([review])
+        render_synthesis(review)
         
         # Sauvegarder le review
         reviews = load_reviews()
@@ -575,6 +517,7 @@ def manual_review():
         processed_jobs = set(load_processed_jobs())
         processed_jobs.add(existing_job["id"])
         save_processed_jobs(list(processed_jobs))
+        publish(REVIEW_SAVED, review=review)
         
         print(f"Review completed for job {existing_job['id']}.")
         
@@ -591,3 +534,69 @@ def manual_review():
         traceback.print_exc()
         return jsonify({"success": False, "message": str(e)}), 500
 
+
+def _parse_weights(data):
+    """Parses a {criterion_id: weight} mapping from a JSON payload."""
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object with a 'weights' field")
+    weights = data.get("weights")
+    if not isinstance(weights, dict):
+        raise ValueError("Field 'weights' must be an object mapping criterion ids to weights")
+    return {int(cid): float(w) for cid, w in weights.items()}
+
+
+@bp.route("/scoring/weights", methods=["GET"])
+def get_scoring_weights():
+    """Return the prompt's default criterion weights and the effective ones."""
+    return jsonify({
+        "default_weights": get_default_weights(),
+        "weights": get_criteria_weights(),
+    })
+
+
+@bp.route("/scoring/what-if", methods=["POST"])
+def scoring_what_if():
+    """Rescore the dashboard jobs under new weights and report ranking changes, without saving."""
+    data = request.get_json(silent=True) or {}
+    try:
+        weights = {**get_criteria_weights(), **_parse_weights(data)}
+        limit = data.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                raise ValueError("Parameter 'limit' must be an integer")
+            if limit < 0:
+                raise ValueError("Parameter 'limit' must be a positive integer")
+    except (TypeError, ValueError) as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    result = what_if(get_dashboard_view().jobs(), weights, limit=limit)
+    return jsonify({"success": True, **result})
+
+
+@bp.route("/scoring/weights", methods=["POST"])
+def save_scoring_weights():
+    """Persist new criterion weights and rescore every stored review with them."""
+    data = request.get_json(silent=True) or {}
+    try:
+        weights = _parse_weights(data)
+    except (TypeError, ValueError) as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    # Only keep weights that differ from the prompt's
+    default_weights = get_default_weights()
+    custom_weights = {
+        cid: w for cid, w in {**load_criteria_weights(), **weights}.items()
+        if default_weights.get(cid) != w
+    }
+    save_criteria_weights(custom_weights)
+
+    all_reviews = load_reviews()
+    changed = apply_weights(all_reviews, get_criteria_weights())
+    save_reviews(all_reviews)
+    print(f"Criteria weights saved. {changed} review scores updated.")
+
+    # Update the in-memory dashboard data
+    get_dashboard_view().rescore({int(r["id"]): r["score"] for r in all_reviews})
+
+    return jsonify({"success": True, "weights": get_criteria_weights(), "updated_reviews": changed})
@@ -0,0 +1,31 @@
+from flask import Blueprint, jsonify, request
+
+from jobseeker_agent.interface.tasks.manager import get_task_manager
+
+bp = Blueprint("tasks", __name__)
+
+
+@bp.route("/tasks", methods=["GET"])
+def list_tasks():
+    """Active and finished background tasks, most recent first (optional ?type= and ?job_id= filters)."""
+    task_type = request.args.get("type")
+    job_id = request.args.get("job_id", type=int)
+    include_history = request.args.get("history", "true").lower() != "false"
+    return jsonify({"tasks": get_task_manager().list(task_type, job_id, include_history=include_history)})
+
+
+@bp.route("/tasks/<int:task_id>", methods=["GET"])
+def get_task(task_id: int):
+    """Record of one background task."""
+    task = get_task_manager().get(task_id)
+    if task is None:
+        return jsonify({"success": False, "message": "Task not found"}), 404
+    return jsonify(task)
+
+
+@bp.route("/tasks/<int:task_id>/cancel", methods=["POST"])
+def cancel_task(task_id: int):
+    """Cancels a queued task, or asks a running one to stop at its next checkpoint."""
+    if not get_task_manager().cancel(task_id):
+        return jsonify({"success": False, "message": "Task not found or already finished"}), 404
+    return jsonify({"success": True, "task": get_task_manager().get(task_id)})
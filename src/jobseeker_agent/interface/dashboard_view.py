@@ -0,0 +1,472 @@
+"""
+In-memory view model of the reviewer dashboard.
+
+Holds the reviewed open jobs (raw job merged with its review) sorted by score,
+plus the jobs' processing statuses and the review counters. It is built once
+from the JSON files, then kept up to date by the events published when jobs are
+ingested or closed, reviews are saved and statuses change, so that rendering a
+page of the dashboard costs O(page size) instead of a full merge of the corpus.
+`query` serves the paginated, filtered and sorted job lists of /api/jobs.
+
+Files written by another process (e.g. a CLI review run) are detected by their
+modification time and trigger a full rebuild on the next read.
+"""
+
+import base64
+import json
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from jobseeker_agent.reviewer.synthesis import (
+    HASH_FIELD,
+    HTML_FIELD,
+    SYNTHESIS_FIELD,
+    get_synthesis_html,
+    markdown_to_html,
+)
+from jobseeker_agent.utils.events import (
+    JOB_ADDED,
+    JOB_CLOSED,
+    JOB_STATUS_CHANGED,
+    REVIEW_SAVED,
+    subscribe,
+)
+from jobseeker_agent.utils.paths import (
+    get_job_statuses_json_path,
+    get_raw_jobs_json_path,
+    get_reviews_json_path,
+    load_job_statuses,
+    load_raw_jobs,
+    load_reviews,
+)
+
+
+# Fields that can be filtered on with an exact (case-insensitive) match
+INDEXED_FIELDS = ("company", "location", "workplace_type", "status")
+SORT_FIELDS = ("score", "posted_date", "id")
+STATUS_FILTERS = ("unprocessed", "processed", "applied", "not_interested")
+DEFAULT_API_PAGE_SIZE = 50
+MAX_API_PAGE_SIZE = 500
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _sort_key(job_id: int, review: Dict[str, Any]) -> Tuple[float, int]:
+    """Score descending; jobs without a score go last. Ties are broken by id."""
+    score = review.get("score")
+    return (-score if isinstance(score, (int, float)) else float("inf"), job_id)
+
+
+def _date_key(job_id: int, job: Dict[str, Any]) -> Tuple[str, int]:
+    """Posting date (YYYY-MM-DD); jobs without a valid date sort first."""
+    posted_date = job.get("posted_date")
+    return (posted_date if isinstance(posted_date, str) and _DATE_PATTERN.match(posted_date) else "", job_id)
+
+
+def _normalize(value: Any) -> str:
+    return str(value or "").strip().lower()
+
+
+def _status_bucket(status: Optional[Dict[str, Any]]) -> str:
+    if not status:
+        return "unprocessed"
+    return "applied" if status.get("applied") else "not_interested"
+
+
+def encode_cursor(sort: str, descending: bool, key: Tuple) -> str:
+    payload = json.dumps({"sort": sort, "descending": descending, "key": list(key)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple:
+    """Decodes a cursor returned by `query`. Raises ValueError if it is invalid or was made for another sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        key = tuple(payload["key"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if payload.get("sort") != sort or payload.get("descending") != descending:
+        raise ValueError("Cursor does not match the requested sort")
+    return key
+
+
+def _file_signature(path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class DashboardView:
+    """
+    Materialized view of the dashboard.
+
+    - `_ranked`: sorted keys (-score, id) of every reviewed open job
+    - `_dates` / `_ids`: the same jobs sorted by posting date and by id
+    - `_index`: field -> normalized value -> job ids, for exact-match filters
+    - `_open_count` / `_unreviewed_count`: counters of the review progress bar
+
+    Sorted lists are maintained with bisect, so an update costs a binary search
+    plus a memmove, and a page is a slice.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Reloads everything from the JSON files."""
+        with self._lock:
+            self._signatures = self._current_signatures()
+            raw_jobs = load_raw_jobs()
+            reviews = load_reviews()
+            statuses = load_job_statuses()
+            self._raw_jobs: Dict[int, Dict[str, Any]] = {int(j["id"]): j for j in raw_jobs}
+            self._reviews: Dict[int, Dict[str, Any]] = {int(r["id"]): r for r in reviews}
+            self._statuses: Dict[int, Dict[str, Any]] = {int(s["id"]): s for s in statuses}
+            self._keys: Dict[int, Tuple[float, int]] = {}
+            self._html: Dict[int, str] = {}
+            self._open_count = 0
+            self._unreviewed_count = 0
+            for job_id, job in self._raw_jobs.items():
+                if job.get("status") == "Closed":
+                    continue
+                self._open_count += 1
+                if job_id in self._reviews:
+                    self._keys[job_id] = _sort_key(job_id, self._reviews[job_id])
+                else:
+                    self._unreviewed_count += 1
+            self._build_indexes()
+            print(f"Dashboard view built: {len(self._ranked)} reviewed open jobs, {len(self._index['status'].get('unprocessed', ()))} to process.")
+
+    def _build_indexes(self) -> None:
+        self._ranked: List[Tuple[float, int]] = sorted(self._keys.values())
+        self._dates: List[Tuple[str, int]] = sorted(_date_key(job_id, self._raw_jobs[job_id]) for job_id in self._keys)
+        self._ids: List[Tuple[int]] = sorted((job_id,) for job_id in self._keys)
+        self._index: Dict[str, Dict[str, Set[int]]] = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        self._indexed_values: Dict[int, Dict[str, str]] = {}
+        for job_id in self._keys:
+            self._index_fields(job_id)
+
+    def _field_values(self, job_id: int) -> Dict[str, str]:
+        job = self._raw_jobs[job_id]
+        values = {field: _normalize(job.get(field)) for field in INDEXED_FIELDS if field != "status"}
+        values["status"] = _status_bucket(self._statuses.get(job_id))
+        return values
+
+    def _index_fields(self, job_id: int) -> None:
+        values = self._indexed_values[job_id] = self._field_values(job_id)
+        for field, value in values.items():
+            self._index[field][value].add(job_id)
+
+    def _unindex_fields(self, job_id: int) -> None:
+        for field, value in self._indexed_values.pop(job_id, {}).items():
+            ids = self._index[field].get(value)
+            if ids is not None:
+                ids.discard(job_id)
+                if not ids:
+                    del self._index[field][value]
+
+    # --- Freshness -------------------------------------------------------
+
+    @staticmethod
+    def _current_signatures() -> Dict[str, Optional[Tuple[int, int]]]:
+        return {
+            "raw_jobs": _file_signature(get_raw_jobs_json_path()),
+            "reviews": _file_signature(get_reviews_json_path()),
+            "statuses": _file_signature(get_job_statuses_json_path()),
+        }
+
+    def _mark_fresh(self, name: str, path) -> None:
+        """Records the file written by the publisher of an event as already applied."""
+        self._signatures[name] = _file_signature(path)
+
+    def ensure_fresh(self) -> None:
+        """Rebuilds the view if a file was changed by someone who did not publish an event."""
+        with self._lock:
+            if self._current_signatures() != self._signatures:
+                print("Data files changed outside this process. Rebuilding dashboard view.")
+                self.rebuild()
+
+    # --- Incremental updates ---------------------------------------------
+
+    @staticmethod
+    def _remove_key(keys: List[Tuple], key: Tuple) -> None:
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+
+    def _insert(self, job_id: int) -> None:
+        key = _sort_key(job_id, self._reviews[job_id])
+        self._keys[job_id] = key
+        insort(self._ranked, key)
+        insort(self._dates, _date_key(job_id, self._raw_jobs[job_id]))
+        insort(self._ids, (job_id,))
+        self._index_fields(job_id)
+
+    def _discard(self, job_id: int) -> None:
+        key = self._keys.pop(job_id, None)
+        if key is None:
+            return
+        self._remove_key(self._ranked, key)
+        self._remove_key(self._dates, _date_key(job_id, self._raw_jobs[job_id]))
+        self._remove_key(self._ids, (job_id,))
+        self._unindex_fields(job_id)
+
+    def add_job(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            job_id = int(job["id"])
+            was_open = job_id in self._raw_jobs and self._raw_jobs[job_id].get("status") != "Closed"
+            # Re-added job: its indexed fields may have changed
+            self._discard(job_id)
+            self._raw_jobs[job_id] = job
+            if job.get("status") != "Closed":
+                if not was_open:
+                    self._open_count += 1
+                    if job_id not in self._reviews:
+                        self._unreviewed_count += 1
+                if job_id in self._reviews:
+                    self._insert(job_id)
+            elif was_open:
+                self._open_count -= 1
+                if job_id not in self._reviews:
+                    self._unreviewed_count -= 1
+            self._mark_fresh("raw_jobs", get_raw_jobs_json_path())
+
+    def close_job(self, job_id: int) -> None:
+        with self._lock:
+            job = self._raw_jobs.get(job_id)
+            if job is not None and job.get("status") != "Closed":
+                self._discard(job_id)
+                self._raw_jobs[job_id] = {**job, "status": "Closed"}
+                self._open_count -= 1
+                if job_id not in self._reviews:
+                    self._unreviewed_count -= 1
+            self._mark_fresh("raw_jobs", get_raw_jobs_json_path())
+
+    def set_review(self, review: Dict[str, Any]) -> None:
+        with self._lock:
+            job_id = int(review["id"])
+            is_new = job_id not in self._reviews
+            self._discard(job_id)
+            self._reviews[job_id] = review
+            self._html.pop(job_id, None)
+            job = self._raw_jobs.get(job_id)
+            if job is not None and job.get("status") != "Closed":
+                if is_new:
+                    self._unreviewed_count -= 1
+                self._insert(job_id)
+            self._mark_fresh("reviews", get_reviews_json_path())
+
+    def set_status(self, status: Dict[str, Any]) -> None:
+        with self._lock:
+            job_id = int(status["id"])
+            reviewed_open = job_id in self._keys
+            self._discard(job_id)
+            self._statuses[job_id] = status
+            if reviewed_open:
+                self._insert(job_id)
+            self._mark_fresh("statuses", get_job_statuses_json_path())
+
+    def rescore(self, scores: Dict[int, float]) -> None:
+        """Applies new scores (e.g. after a change of criteria weights) and re-sorts once."""
+        with self._lock:
+            for job_id, score in scores.items():
+                review = self._reviews.get(job_id)
+                if review is not None and review.get("score") != score:
+                    self._reviews[job_id] = {**review, "llm_score": review.get("llm_score", review.get("score")), "score": score}
+            self._keys = {job_id: _sort_key(job_id, self._reviews[job_id]) for job_id in self._keys}
+            self._build_indexes()
+            self._mark_fresh("reviews", get_reviews_json_path())
+
+    # --- Reads -----------------------------------------------------------
+
+    def _merged(self, job_id: int) -> Dict[str, Any]:
+        return {"id": job_id, **self._raw_jobs[job_id], **self._reviews[job_id]}
+
+    def _render(self, job_id: int) -> Dict[str, Any]:
+        job = self._merged(job_id)
+        job["status"] = self._statuses.get(job_id)
+        job.pop(HTML_FIELD, None)
+        job.pop(HASH_FIELD, None)
+        if job.get(SYNTHESIS_FIELD):
+            # HTML rendered when the review was written; reviews not backfilled yet are rendered once here
+            html = get_synthesis_html(self._reviews[job_id]) or self._html.get(job_id)
+            if html is None:
+                html = self._html[job_id] = markdown_to_html(job[SYNTHESIS_FIELD])
+            job[SYNTHESIS_FIELD] = html
+        return job
+
+    def _sorted_keys(self, sort: str) -> Tuple[List[Tuple], Any]:
+        """Sorted key list of a sort field and the function giving a job's key in it."""
+        if sort == "score":
+            return self._ranked, lambda job_id: self._keys[job_id]
+        if sort == "posted_date":
+            return self._dates, lambda job_id: _date_key(job_id, self._raw_jobs[job_id])
+        return self._ids, lambda job_id: (job_id,)
+
+    def _matches(self, job_id: int, filters: Dict[str, Any]) -> bool:
+        score = self._reviews[job_id].get("score")
+        if filters.get("min_score") is not None or filters.get("max_score") is not None:
+            if not isinstance(score, (int, float)):
+                return False
+            if filters.get("min_score") is not None and score < filters["min_score"]:
+                return False
+            if filters.get("max_score") is not None and score > filters["max_score"]:
+                return False
+        if filters.get("posted_after") or filters.get("posted_before"):
+            posted_date = _date_key(job_id, self._raw_jobs[job_id])[0]
+            if not posted_date:
+                return False
+            if filters.get("posted_after") and posted_date < filters["posted_after"]:
+                return False
+            if filters.get("posted_before") and posted_date > filters["posted_before"]:
+                return False
+        return True
+
+    def _candidates(self, filters: Dict[str, Any]) -> Optional[Set[int]]:
+        """
+        Jobs matching the exact-match filters (intersection of the indexes), or None without such filters.
+
+        With a single filter, the index set itself is returned, not a copy: it is only read,
+        under the lock, so a page costs O(page size) instead of O(matching jobs).
+        """
+        sets = []
+        for field in INDEXED_FIELDS:
+            value = filters.get(field)
+            if value is None:
+                continue
+            if field == "status" and value == "processed":
+                sets.append(self._index["status"].get("applied", set()) | self._index["status"].get("not_interested", set()))
+            else:
+                sets.append(self._index[field].get(_normalize(value), set()))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return set.intersection(*sets) if len(sets) > 1 else sets[0]
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = "score",
+        descending: bool = True,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_API_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        One page of reviewed open jobs, filtered and sorted, with cursor-based paging.
+
+        Args:
+            filters: Optional min_score / max_score, posted_after / posted_before (YYYY-MM-DD),
+                and exact matches on company, location, workplace_type and status
+                ("unprocessed", "processed", "applied", "not_interested")
+            sort: "score", "posted_date" or "id"
+            descending: Sort order
+            cursor: `next_cursor` of the previous page
+            limit: Page size
+
+        Returns:
+            Dict with 'jobs' (rendered like `page`), 'next_cursor' (None on the last page)
+            and 'total' (None when it would require a scan of the corpus)
+        """
+        filters = filters or {}
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}. Use one of {', '.join(SORT_FIELDS)}")
+        if filters.get("status") is not None and filters["status"] not in STATUS_FILTERS:
+            raise ValueError(f"Unknown status filter: {filters['status']}. Use one of {', '.join(STATUS_FILTERS)}")
+        limit = max(1, min(int(limit), MAX_API_PAGE_SIZE))
+        # Keys of the score list are (-score, id): descending scores are the list's natural order
+        forward = descending if sort == "score" else not descending
+        has_range = any(filters.get(f) is not None for f in ("min_score", "max_score", "posted_after", "posted_before"))
+
+        with self._lock:
+            keys, key_of = self._sorted_keys(sort)
+            candidates = self._candidates(filters)
+            matched = len(self._keys) if candidates is None else len(candidates)
+            # Selective filters: sorting the few candidates beats scanning the whole list
+            if candidates is not None and len(candidates) * 8 < len(keys):
+                keys = sorted(key_of(job_id) for job_id in candidates)
+                candidates = None
+
+            if cursor:
+                last_key = decode_cursor(cursor, sort, descending)
+                position = bisect_right(keys, last_key) if forward else bisect_left(keys, last_key) - 1
+            else:
+                position = 0 if forward else len(keys) - 1
+            step = 1 if forward else -1
+
+            selected, next_cursor = [], None
+            while 0 <= position < len(keys):
+                key = keys[position]
+                job_id = key[-1]
+                position += step
+                if candidates is not None and job_id not in candidates:
+                    continue
+                if has_range and not self._matches(job_id, filters):
+                    continue
+                if len(selected) == limit:
+                    next_cursor = encode_cursor(sort, descending, selected[-1][0])
+                    break
+                selected.append((key, job_id))
+
+            return {
+                "jobs": [self._render(job_id) for _, job_id in selected],
+                "next_cursor": next_cursor,
+                "total": None if has_range else matched,
+            }
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Every reviewed open job, merged and sorted by score (raw Markdown synthesis)."""
+        with self._lock:
+            return [self._merged(job_id) for _, job_id in self._ranked]
+
+    def get_raw_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._raw_jobs.get(job_id)
+
+    def review_count_info(self) -> Dict[str, Any]:
+        with self._lock:
+            percentage = (self._unreviewed_count / self._open_count * 100) if self._open_count > 0 else 0
+            return {
+                "unreviewed_count": self._unreviewed_count,
+                "total_open_count": self._open_count,
+                "percentage": round(percentage, 1),
+            }
+
+
+_VIEW_LOCK = threading.Lock()
+_VIEW: Optional[DashboardView] = None
+
+
+def _on_job_added(job: Dict[str, Any]) -> None:
+    _VIEW.add_job(job)
+
+
+def _on_job_closed(job_id: int) -> None:
+    _VIEW.close_job(job_id)
+
+
+def _on_review_saved(review: Dict[str, Any]) -> None:
+    _VIEW.set_review(review)
+
+
+def _on_job_status_changed(status: Dict[str, Any]) -> None:
+    _VIEW.set_status(status)
+
+
+def get_dashboard_view() -> DashboardView:
+    """Returns the process-wide view, built on first call then kept up to date by events."""
+    global _VIEW
+    with _VIEW_LOCK:
+        if _VIEW is None:
+            _VIEW = DashboardView()
+            subscribe(JOB_ADDED, _on_job_added)
+            subscribe(JOB_CLOSED, _on_job_closed)
+            subscribe(REVIEW_SAVED, _on_review_saved)
+            subscribe(JOB_STATUS_CHANGED, _on_job_status_changed)
+        return _VIEW
@@ -1,3 +1,4 @@
+import argparse
 import sys
 import webbrowser
 import threading
@@ -14,41 +15,105 @@ print(f"Project root added to sys.path: {project_root}")
 
 from jobseeker_agent.interface.blueprints.reviewer import bp as reviewer_bp
 from jobseeker_agent.interface.blueprints.customizer import bp as customizer_bp
+from jobseeker_agent.interface.blueprints.events import bp as events_bp
+from jobseeker_agent.interface.blueprints.tasks import bp as tasks_bp
+from jobseeker_agent.interface.dashboard_view import get_dashboard_view
+from jobseeker_agent.interface.static_assets import StaticAssets
+from jobseeker_agent.interface.tasks.manager import get_task_manager
 
-print("--- Initializing Flask App ---")
-# Get the interface directory path
-interface_path = Path(__file__).resolve().parent
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5000
+# Each open page holds a thread on its /events stream
+DEFAULT_THREADS = 16
 
-# Create Flask app with template and static folders
-app = Flask(
-    __name__,
-    template_folder=str(interface_path / "templates"),
-    static_folder=str(interface_path / "static"),
-)
 
-# Register blueprints
-app.register_blueprint(reviewer_bp)  # No prefix - it's at the root
-app.register_blueprint(customizer_bp, url_prefix="/customizer")
+def create_app(production: bool = False) -> Flask:
+    """
+    Creates the Flask app.
 
-# Disable caching for development
-app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+    Args:
+        production: Fingerprint static assets and serve them with long-lived cache
+            headers, instead of disabling caching for development
+    """
+    print("--- Initializing Flask App ---")
+    # Get the interface directory path
+    interface_path = Path(__file__).resolve().parent
 
-print("Flask App initialized.")
+    # Create Flask app with template and static folders
+    app = Flask(
+        __name__,
+        template_folder=str(interface_path / "templates"),
+        static_folder=str(interface_path / "static"),
+    )
+
+    # Register blueprints
+    app.register_blueprint(reviewer_bp)  # No prefix - it's at the root
+    app.register_blueprint(customizer_bp, url_prefix="/customizer")
+    app.register_blueprint(events_bp)
+    app.register_blueprint(tasks_bp)
+
+    app.config["PRODUCTION"] = production
+    if production:
+        StaticAssets(app)
+    else:
+        # Disable caching for development
+        app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+
+    print(f"Flask App initialized ({'production' if production else 'development'} mode).")
+    return app
+
+
+app = create_app(production=os.environ.get("JOBSEEKER_ENV") == "production")
+
+
+def warm_up() -> None:
+    """Loads the task table and builds the dashboard view, so the first request does not pay for it."""
+    get_task_manager()
+    get_dashboard_view()
+    print("✅ Dashboard data loaded.")
+
+
+def serve_production(app: Flask, host: str, port: int, threads: int) -> None:
+    """Serves the app with waitress (multi-threaded WSGI server), or the threaded Flask server without it."""
+    threading.Thread(target=warm_up, daemon=True).start()
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠️ waitress is not installed (pip install waitress), falling back to the threaded Flask server.")
+        app.run(host=host, port=port, threaded=True, debug=False, use_reloader=False)
+        return
+    serve(app, host=host, port=port, threads=threads, channel_timeout=120)
 
 
 def main():
     """Main function to run the Flask app."""
     print("--- main() function called ---")
+    parser = argparse.ArgumentParser(description="Jobseeker dashboard server")
+    parser.add_argument("--production", action="store_true", help="Serve with a multi-threaded WSGI server, without debugger nor reloader")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="Worker threads in production mode")
+    args = parser.parse_args()
+
+    url = f"http://{args.host}:{args.port}/"
+    if args.production:
+        server_app = app if app.config["PRODUCTION"] else create_app(production=True)
+        print(f"Starting the dashboard server (production) at {url} with {args.threads} threads")
+        print("Press CTRL+C to stop the server.")
+        serve_production(server_app, args.host, args.port, args.threads)
+        return
+
     # We use a thread to open the browser after the server starts.
     # This should only happen in the main process, not in the reloader's child process.
     if os.environ.get("WERKZEUG_RUN_MAIN") != "true":
-        threading.Timer(1.25, lambda: webbrowser.open("http://127.0.0.1:5000/")).start()
-    print("Starting the dashboard server at http://127.0.0.1:5000/")
+        threading.Timer(1.25, lambda: webbrowser.open(url)).start()
+    else:
+        threading.Thread(target=warm_up, daemon=True).start()
+    print(f"Starting the dashboard server at {url}")
     print("Press CTRL+C to stop the server.")
-    app.run(port=5000, debug=True)
+    app.run(host=args.host, port=args.port, debug=True)
 
 
 if __name__ == "__main__":
     print("--- Script executed directly ---")
     main()
-
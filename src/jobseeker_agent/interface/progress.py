@@ -0,0 +1,203 @@
+"""
+Progress of the background tasks, pushed to the browser.
+
+Tasks update their status with `set_status` / `update_status`. The status dicts
+of `interface.state` (and, for customizer tasks, of the job's session) are kept,
+so the */status endpoints still answer, and each change is also appended to an
+in-memory event log. `stream` turns that log into
+a server-sent events stream (served at /events): on connection the client gets
+the current status of every task, then each change as it happens. Every saved
+review is also pushed as a "review" event. Event ids carry an epoch drawn at
+process start, so a client reconnecting with the Last-Event-ID of a previous
+process (debug reloader, restart) gets the current statuses again.
+
+The statuses of the global tasks (scraping, review, status update) are also
+written to data/interface/task_statuses.json on each change, and reloaded when
+that file was changed by another process, so every server process (and the
+*/status endpoints they serve) sees the same progress.
+"""
+
+import itertools
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jobseeker_agent.interface import sessions, state
+from jobseeker_agent.utils.events import REVIEW_SAVED, subscribe
+from jobseeker_agent.utils.paths import get_task_statuses_json_path, load_task_statuses, save_task_statuses
+
+
+# Task name -> status dict in interface.state
+TASKS = {
+    "scraping": "SCRAPING_STATUS",
+    "review": "REVIEW_STATUS",
+    "update_status": "UPDATE_STATUS_STATUS",
+}
+# Customizer tasks: one status per job, kept in its session
+JOB_TASKS = tuple(sessions.DEFAULT_STATUSES)
+EVENT_BUFFER_SIZE = 1000
+HEARTBEAT_INTERVAL = 15
+
+
+class ProgressBroker:
+    """Bounded log of events; readers wait on a condition for events newer than the last one they saw."""
+
+    def __init__(self, buffer_size: int = EVENT_BUFFER_SIZE):
+        self._condition = threading.Condition()
+        self._events: deque = deque(maxlen=buffer_size)
+        self._ids = itertools.count(1)
+        self.last_id = 0
+        # Tells the event ids of this process from those of a previous one
+        self.epoch = uuid.uuid4().hex[:8]
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        with self._condition:
+            self.last_id = next(self._ids)
+            self._events.append((self.last_id, event, data))
+            self._condition.notify_all()
+
+    def events_since(self, last_id: int) -> Optional[List[Tuple[int, str, Dict[str, Any]]]]:
+        """Events newer than `last_id`, or None if some of them already left the buffer."""
+        with self._condition:
+            if self._events and self._events[0][0] > last_id + 1:
+                return None
+            return [entry for entry in self._events if entry[0] > last_id]
+
+    def wait(self, last_id: int, timeout: float) -> Optional[List[Tuple[int, str, Dict[str, Any]]]]:
+        """Blocks until there are events newer than `last_id` or the timeout expires."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.last_id > last_id, timeout)
+        return self.events_since(last_id)
+
+
+BROKER = ProgressBroker()
+
+
+def has_status(task: str) -> bool:
+    return task in TASKS or task in JOB_TASKS
+
+
+_SHARED_LOCK = threading.Lock()
+_shared_signature: Optional[Tuple[int, int]] = None
+
+
+def _file_signature() -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(get_task_statuses_json_path())
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_shared_statuses() -> None:
+    """Adopts the global task statuses saved by another process, if the file changed since it was last read."""
+    global _shared_signature
+    with _SHARED_LOCK:
+        signature = _file_signature()
+        if signature is None or signature == _shared_signature:
+            return
+        for task, status in load_task_statuses().items():
+            if task in TASKS:
+                setattr(state, TASKS[task], status)
+        _shared_signature = signature
+
+
+def _save_shared_statuses() -> None:
+    global _shared_signature
+    with _SHARED_LOCK:
+        save_task_statuses({task: getattr(state, attr) for task, attr in TASKS.items()})
+        _shared_signature = _file_signature()
+
+
+def get_status(task: str, job_id: Optional[int] = None) -> Dict[str, Any]:
+    """Status of a task; customizer tasks need the job_id of their session."""
+    if task in JOB_TASKS:
+        return sessions.get_session(job_id).statuses[task]
+    _load_shared_statuses()
+    return getattr(state, TASKS[task])
+
+
+def _status_event(task: str, job_id: Optional[int], status: Dict[str, Any]) -> Dict[str, Any]:
+    if task in JOB_TASKS:
+        return {"task": task, "job_id": job_id, **status}
+    return {"task": task, **status}
+
+
+def set_status(task: str, job_id: Optional[int] = None, **fields: Any) -> None:
+    """Replaces the status of a task and pushes it."""
+    if task in JOB_TASKS:
+        sessions.get_session(job_id).statuses[task] = dict(fields)
+    else:
+        setattr(state, TASKS[task], dict(fields))
+        _save_shared_statuses()
+    BROKER.publish("status", _status_event(task, job_id, fields))
+
+
+def update_status(task: str, job_id: Optional[int] = None, **fields: Any) -> None:
+    """Updates some fields of the status of a task and pushes the whole status."""
+    status = get_status(task, job_id)
+    status.update(fields)
+    if task not in JOB_TASKS:
+        _save_shared_statuses()
+    BROKER.publish("status", _status_event(task, job_id, status))
+
+
+def _on_review_saved(review: Dict[str, Any]) -> None:
+    BROKER.publish("review", {
+        "job_id": review["id"],
+        "score": review.get("score"),
+        "duplicate_of": review.get("duplicate_of"),
+    })
+
+
+subscribe(REVIEW_SAVED, _on_review_saved)
+
+
+def format_event(event_id: int, event: str, data: Dict[str, Any]) -> str:
+    return f"id: {BROKER.epoch}-{event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def parse_last_event_id(header: Optional[str]) -> Optional[int]:
+    """Event number of a Last-Event-ID header, or None if it was not issued by this process."""
+    epoch, _, number = (header or "").partition("-")
+    if epoch != BROKER.epoch or not number.isdigit():
+        return None
+    return int(number)
+
+
+def _snapshot(event_id: int) -> Iterator[str]:
+    for task in TASKS:
+        yield format_event(event_id, "status", {"task": task, **get_status(task)})
+    for session in sessions.list_sessions():
+        for task in JOB_TASKS:
+            yield format_event(event_id, "status", _status_event(task, session.job_id, session.statuses[task]))
+
+
+def stream(last_event_id: Optional[int] = None, heartbeat: float = HEARTBEAT_INTERVAL) -> Iterator[str]:
+    """
+    Server-sent events: current statuses, then every change.
+
+    Args:
+        last_event_id: Last event received by a reconnecting client (see `parse_last_event_id`).
+            Missed events are replayed if still buffered, otherwise statuses are sent again.
+        heartbeat: Seconds between keep-alive comments when nothing happens
+    """
+    if last_event_id is None or last_event_id > BROKER.last_id or BROKER.events_since(last_event_id) is None:
+        last_event_id = BROKER.last_id
+        yield from _snapshot(last_event_id)
+    while True:
+        events = BROKER.wait(last_event_id, heartbeat)
+        if events is None:
+            # Client too slow: the buffer moved on, resynchronize
+            last_event_id = BROKER.last_id
+            yield from _snapshot(last_event_id)
+            continue
+        if not events:
+            yield ": heartbeat\n\n"
+            continue
+        for event_id, event, data in events:
+            yield format_event(event_id, event, data)
+            last_event_id = event_id
@@ -0,0 +1,96 @@
+"""
+Customizer sessions, one per job being tailored.
+
+A session carries what the customizer pipeline used to keep in process-global
+state: the job description sent to the LLMs, the job details shown in the
+workspace and the status of each customizer task. Sessions are keyed by job id,
+so several applications can be prepared at the same time.
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from jobseeker_agent.utils.paths import get_data_path
+
+
+# Customizer task -> initial status
+DEFAULT_STATUSES: Dict[str, Dict[str, Any]] = {
+    "extraction": {"status": "idle", "error": None},
+    "data_loading": {"status": "idle", "error": None},
+    "ranking": {"status": "idle", "error": None},
+    "introduction": {"status": "idle", "error": None},
+    "cover_letter": {"status": "idle", "error": None, "message": ""},
+}
+
+
+class CustomizerSession:
+    """State of the customizer for one job."""
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self.job_description: str = ""
+        self.job_details: Dict[str, Any] = {}
+        self.statuses: Dict[str, Dict[str, Any]] = {task: dict(status) for task, status in DEFAULT_STATUSES.items()}
+        self.last_opened = datetime.now()
+        self._restore()
+
+    @property
+    def job_dir(self) -> Path:
+        return get_data_path() / "resume" / str(self.job_id)
+
+    def _restore(self) -> None:
+        """Reloads the job details saved by a previous initial load (e.g. before a restart)."""
+        job_details_file = self.job_dir / "job_details.json"
+        if not job_details_file.exists():
+            return
+        try:
+            with open(job_details_file, "r", encoding="utf-8") as f:
+                self.job_details = json.load(f)
+        except json.JSONDecodeError:
+            return
+        # The compacted description is not saved; the raw one is the closest substitute
+        self.job_description = self.job_details.get("description") or ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "title": self.job_details.get("title"),
+            "company_name": self.job_details.get("company_name"),
+            "last_opened": self.last_opened.isoformat(timespec="seconds"),
+            "statuses": self.statuses,
+        }
+
+
+_SESSIONS_LOCK = threading.Lock()
+_SESSIONS: Dict[int, CustomizerSession] = {}
+
+
+def get_session(job_id: int) -> CustomizerSession:
+    """Session of a job, created on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(job_id)
+        if session is None:
+            session = _SESSIONS[job_id] = CustomizerSession(job_id)
+        return session
+
+
+def open_session(job_id: int) -> CustomizerSession:
+    """Session of a job, marked as the last one opened in the browser."""
+    session = get_session(job_id)
+    session.last_opened = datetime.now()
+    return session
+
+
+def list_sessions() -> List[CustomizerSession]:
+    """Open sessions, most recently opened first."""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+    return sorted(sessions, key=lambda session: session.last_opened, reverse=True)
+
+
+def latest_session() -> Optional[CustomizerSession]:
+    sessions = list_sessions()
+    return sessions[0] if sessions else None
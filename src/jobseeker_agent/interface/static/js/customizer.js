@@ -3,6 +3,10 @@
 let highlighter; // Declare highlighter in a broader scope
 let currentContext = 'resume'; // Tracks whether viewing 'resume' or 'cover-letter'
 
+// Every customizer endpoint is scoped to the job of this page
+const JOB_ID = Number(document.body.dataset.jobId);
+const CUSTOMIZER_URL = `/customizer/${JOB_ID}`;
+
 // --- Utility Functions ---
 
 function refreshPdf() {
@@ -21,7 +25,7 @@ function refreshTex() {
 
 function refreshTexForContext(context) {
     const texEditor = document.getElementById('tex-editor');
-    const endpoint = context === 'cover-letter' ? '/customizer/cover-letter-tex' : '/customizer/tex';
+    const endpoint = context === 'cover-letter' ? `${CUSTOMIZER_URL}/cover-letter-tex` : `${CUSTOMIZER_URL}/tex`;
     
     fetch(endpoint)
         .then(response => response.json())
@@ -38,7 +42,7 @@ function switchToDocumentContext(context) {
     currentContext = context;
     const pdfViewer = document.getElementById('pdf-viewer');
     const filename = context === 'cover-letter' ? 'cover-letter.pdf' : 'resume.pdf';
-    const url = `/customizer/pdf/${filename}?t=${new Date().getTime()}`;
+    const url = `${CUSTOMIZER_URL}/pdf/${filename}?t=${new Date().getTime()}`;
     pdfViewer.src = url;
     
     // If TeX viewer is visible, refresh its content
@@ -209,19 +213,15 @@ function checkValidationState() {
 
 function startAndPollExtraction() {
     function pollExtractionStatus() {
-        fetch("/customizer/extraction-status")
-        .then(response => response.json())
-        .then(data => {
+        watchTask('extraction', `${CUSTOMIZER_URL}/extraction-status`, data => {
             if (data.status === 'complete') {
-                const keywordsPromise = fetch("/customizer/keywords").then(res => res.json());
-                const titlesPromise = fetch("/customizer/titles").then(res => res.json());
+                const keywordsPromise = fetch(`${CUSTOMIZER_URL}/keywords`).then(res => res.json());
+                const titlesPromise = fetch(`${CUSTOMIZER_URL}/titles`).then(res => res.json());
                 Promise.all([keywordsPromise, titlesPromise])
                     .then(([keywordsData, titlesData]) => {
                         renderData(keywordsData, titlesData);
                     })
                     .catch(error => console.error("Failed to fetch final data:", error));
-            } else if (data.status === 'pending') {
-                setTimeout(pollExtractionStatus, 2000);
             } else if (data.status === 'failed') {
                 const loader = document.getElementById('keyword-loading-container');
                 loader.innerHTML = ''; // Clear previous content
@@ -232,10 +232,10 @@ function startAndPollExtraction() {
                 loader.appendChild(h4);
                 loader.appendChild(p);
             }
-        });
+        }, { refetch: true, jobId: JOB_ID });
     }
 
-    fetch("/customizer/start-extraction", { method: 'POST' })
+    fetch(`${CUSTOMIZER_URL}/start-extraction`, { method: 'POST' })
     .then(response => response.json())
     .then(data => {
         if (data.status === 'started' || data.status === 'complete') {
@@ -407,7 +407,7 @@ function updateTitle(title, clickedButton = null) {
     if (clickedButton) {
         clickedButton.classList.add('selected');
     }
-    fetch("/customizer/update-title", {
+    fetch(`${CUSTOMIZER_URL}/update-title`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ title: title })
@@ -457,11 +457,9 @@ function updateExperienceBlocksOrder(experienceRanking) {
 
 function startAndPollRanking() {
     function pollRankingStatus() {
-        fetch("/customizer/ranking-status")
-        .then(response => response.json())
-        .then(data => {
+        watchTask('ranking', `${CUSTOMIZER_URL}/ranking-status`, data => {
             if (data.status === 'complete') {
-                fetch("/customizer/ranking-report")
+                fetch(`${CUSTOMIZER_URL}/ranking-report`)
                 .then(res => res.json())
                 .then(reportData => {
                     // Update the visual order of experience blocks
@@ -484,18 +482,16 @@ function startAndPollRanking() {
                     btn.disabled = false;
                     document.getElementById('suggest-introductions-btn').style.display = 'block';
                 });
-            } else if (data.status === 'pending') {
-                setTimeout(pollRankingStatus, 2000);
             } else if (data.status === 'failed') {
                 alert('Ranking failed: ' + (data.error || 'Unknown error'));
                 const btn = document.getElementById('auto-rank-btn');
                 btn.textContent = 'Auto-Rank with AI';
                 btn.disabled = false;
             }
-        });
+        }, { jobId: JOB_ID });
     }
 
-    fetch("/customizer/start-ranking", { method: 'POST' })
+    fetch(`${CUSTOMIZER_URL}/start-ranking`, { method: 'POST' })
     .then(response => response.json())
     .then(data => {
         if (data.status === 'started') {
@@ -511,11 +507,9 @@ function startAndPollRanking() {
 
 function startAndPollIntroductions() {
     function pollIntroductionStatus() {
-        fetch("/customizer/introduction-status")
-        .then(response => response.json())
-        .then(data => {
+        watchTask('introduction', `${CUSTOMIZER_URL}/introduction-status`, data => {
             if (data.status === 'complete') {
-                fetch("/customizer/introduction-report")
+                fetch(`${CUSTOMIZER_URL}/introduction-report`)
                 .then(res => res.json())
                 .then(reportData => {
                     const reportContainer = document.getElementById('introduction-report');
@@ -560,8 +554,6 @@ function startAndPollIntroductions() {
                     btn.textContent = 'Suggest Opening Lines';
                     btn.disabled = false;
                 });
-            } else if (data.status === 'pending') {
-                setTimeout(pollIntroductionStatus, 2000);
             } else if (data.status === 'failed') {
                 const reportContainer = document.getElementById('introduction-container');
                 reportContainer.style.display = 'block';
@@ -570,10 +562,10 @@ function startAndPollIntroductions() {
                 btn.textContent = 'Suggest Opening Lines';
                 btn.disabled = false;
             }
-        });
+        }, { jobId: JOB_ID });
     }
 
-    fetch("/customizer/start-introduction", { method: 'POST' })
+    fetch(`${CUSTOMIZER_URL}/start-introduction`, { method: 'POST' })
     .then(response => response.json())
     .then(data => {
         if (data.status === 'started') {
@@ -610,7 +602,7 @@ function updateCoverLetterWordCount() {
 }
 
 function loadCoverLetterContent() {
-    fetch("/customizer/cover-letter-content")
+    fetch(`${CUSTOMIZER_URL}/cover-letter-content`)
     .then(response => response.json())
     .then(data => {
         if (data.success && data.content) {
@@ -634,9 +626,7 @@ function loadCoverLetterContent() {
 
 function startAndPollCoverLetter() {
     function pollCoverLetterStatus() {
-        fetch("/customizer/cover-letter-status")
-        .then(response => response.json())
-        .then(data => {
+        watchTask('cover_letter', `${CUSTOMIZER_URL}/cover-letter-status`, data => {
             if (data.status === 'complete') {
                 const statusMessage = document.getElementById('cover-letter-status-message');
                 statusMessage.innerHTML = '<p style="color: green;">Cover letter generated successfully!</p>';
@@ -669,7 +659,6 @@ function startAndPollCoverLetter() {
                 if (data.message) {
                     progressDiv.textContent = data.message;
                 }
-                setTimeout(pollCoverLetterStatus, 2000);
             } else if (data.status === 'failed') {
                 const statusMessage = document.getElementById('cover-letter-status-message');
                 statusMessage.innerHTML = `<p style="color: red;">Generation failed: ${data.error || 'Unknown error'}</p>`;
@@ -682,10 +671,10 @@ function startAndPollCoverLetter() {
                 btn.textContent = 'Generate Cover Letter';
                 btn.disabled = false;
             }
-        });
+        }, { jobId: JOB_ID });
     }
 
-    fetch("/customizer/start-cover-letter", { method: 'POST' })
+    fetch(`${CUSTOMIZER_URL}/start-cover-letter`, { method: 'POST' })
     .then(response => response.json())
     .then(data => {
         if (data.status === 'started') {
@@ -709,7 +698,7 @@ function saveCoverLetter() {
     btn.textContent = 'Saving...';
     btn.disabled = true;
     
-    fetch("/customizer/save-cover-letter", {
+    fetch(`${CUSTOMIZER_URL}/save-cover-letter`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ content: content })
@@ -740,7 +729,7 @@ function convertCoverLetterToPdf() {
     btn.disabled = true;
     statusMessage.innerHTML = '<p style="color: #0066cc;">Converting markdown to PDF...</p>';
     
-    fetch("/customizer/convert-cover-letter-to-pdf", {
+    fetch(`${CUSTOMIZER_URL}/convert-cover-letter-to-pdf`, {
         method: 'POST'
     })
     .then(response => response.json())
@@ -780,7 +769,7 @@ function getExperienceOrder() {
 }
 
 function loadCurrentSkills() {
-    fetch("/customizer/get-current-skills")
+    fetch(`${CUSTOMIZER_URL}/get-current-skills`)
     .then(response => response.json())
     .then(data => {
         if (data.error) {
@@ -884,7 +873,7 @@ function updateSkillsBlocksOrder(skillRanking) {
 }
 
 function loadCurrentExperienceOrder() {
-    fetch("/customizer/get-current-experience-order")
+    fetch(`${CUSTOMIZER_URL}/get-current-experience-order`)
     .then(response => response.json())
     .then(data => {
         if (data.error) {
@@ -957,10 +946,8 @@ function initializeDragAndDrop() {
 }
 
 function pollInitialLoadStatus() {
-    console.log("Polling for initial load status...");
-    fetch("/customizer/initial-load-status")
-    .then(response => response.json())
-    .then(data => {
+    console.log("Waiting for initial load status...");
+    watchTask('data_loading', `${CUSTOMIZER_URL}/initial-load-status`, data => {
         console.log("Received status:", data.status);
         if (data.status === 'complete') {
             console.log("Status is 'complete'. Hiding loader and starting keyword extraction.");
@@ -988,8 +975,6 @@ function pollInitialLoadStatus() {
             // Load current order from resume
             loadCurrentExperienceOrder();
             loadCurrentSkills();
-        } else if (data.status === 'pending') {
-            setTimeout(pollInitialLoadStatus, 2000);
         } else if (data.status === 'failed') {
             const loader = document.getElementById('initial-loading-container');
             loader.innerHTML = '';
@@ -1000,7 +985,7 @@ function pollInitialLoadStatus() {
             loader.appendChild(h4);
             loader.appendChild(p);
         }
-    });
+    }, { refetch: true, jobId: JOB_ID });
 }
 
 
@@ -1068,7 +1053,7 @@ document.body.addEventListener('click', function(event) {
             return;
         }
         const highlightedTexts = highlighter.highlights.map(h => h.getText());
-        fetch("/customizer/save-highlights", {
+        fetch(`${CUSTOMIZER_URL}/save-highlights`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ highlights: highlightedTexts })
@@ -1092,7 +1077,7 @@ document.body.addEventListener('click', function(event) {
     if (id === 'refresh-btn') {
         if (document.getElementById('tex-viewer').style.display === 'block') {
             refreshTex();
-            fetch("/customizer/recompile-tex", { method: 'POST' })
+            fetch(`${CUSTOMIZER_URL}/recompile-tex`, { method: 'POST' })
                 .then(res => res.json())
                 .then(data => {
                     if(data.success) {
@@ -1117,7 +1102,7 @@ document.body.addEventListener('click', function(event) {
         const content = document.getElementById('tex-editor').value;
         button.textContent = 'Saving...';
         button.disabled = true;
-        fetch("/customizer/save-tex", {
+        fetch(`${CUSTOMIZER_URL}/save-tex`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ content: content })
@@ -1145,7 +1130,7 @@ document.body.addEventListener('click', function(event) {
     
     if (id === 'reinitialize-btn') {
         if (confirm('Are you sure you want to reset the TeX file to its original template? All changes will be lost.')) {
-            fetch("/customizer/reinitialize-tex", { method: 'POST' })
+            fetch(`${CUSTOMIZER_URL}/reinitialize-tex`, { method: 'POST' })
                 .then(res => res.json())
                 .then(data => {
                     if (data.success) {
@@ -1229,7 +1214,7 @@ document.body.addEventListener('click', function(event) {
         button.textContent = 'Saving...';
         button.disabled = true;
 
-        fetch("/customizer/save-validated-keywords", {
+        fetch(`${CUSTOMIZER_URL}/save-validated-keywords`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify(finalData)
@@ -1254,7 +1239,7 @@ document.body.addEventListener('click', function(event) {
         button.disabled = true;
         reportContainer.innerHTML = '<div class="log-line">Running... please wait.</div>';
 
-        fetch("/customizer/run-executor", { method: 'POST' })
+        fetch(`${CUSTOMIZER_URL}/run-executor`, { method: 'POST' })
         .then(response => {
             if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
             return response.json();
@@ -1317,7 +1302,7 @@ document.body.addEventListener('click', function(event) {
         const skillRanking = getSkillsOrder();
         
         // Appliquer d'abord les expériences (avec hidden state)
-        fetch("/customizer/apply-manual-ranking", {
+        fetch(`${CUSTOMIZER_URL}/apply-manual-ranking`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
@@ -1331,7 +1316,7 @@ document.body.addEventListener('click', function(event) {
                 throw new Error(data.error || 'Failed to apply experience ranking');
             }
             // Puis appliquer les skills
-            return fetch("/customizer/apply-manual-skill-ranking", {
+            return fetch(`${CUSTOMIZER_URL}/apply-manual-skill-ranking`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ skill_ranking: skillRanking })
@@ -1402,7 +1387,7 @@ document.body.addEventListener('click', function(event) {
         button.textContent = 'Saving...';
         button.disabled = true;
 
-        fetch("/customizer/save-introduction", {
+        fetch(`${CUSTOMIZER_URL}/save-introduction`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ introduction: introductionText })
@@ -1439,7 +1424,7 @@ document.body.addEventListener('click', function(event) {
         button.textContent = 'Deleting...';
         button.disabled = true;
 
-        fetch("/customizer/delete-publications", {
+        fetch(`${CUSTOMIZER_URL}/delete-publications`, {
             method: 'POST'
         })
         .then(response => response.json())
@@ -1471,7 +1456,7 @@ document.body.addEventListener('click', function(event) {
 
 // --- Initial Script Execution ---
 console.log("Triggering start-initial-load...");
-fetch("/customizer/start-initial-load", { method: 'POST' })
+fetch(`${CUSTOMIZER_URL}/start-initial-load`, { method: 'POST' })
 .then(response => response.json())
 .then(data => {
     console.log("Response from start-initial-load:", data.status);
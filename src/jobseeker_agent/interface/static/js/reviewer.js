@@ -26,7 +26,7 @@ document.querySelectorAll('.job-item').forEach(item => {
 });
 
 // Scraping functionality
-let scrapingInterval = null;
+let stopScrapingWatch = null;
 
 // Destinations state
 let scrapingDestinations = [];
@@ -167,7 +167,7 @@ document.getElementById('scrape-btn').addEventListener('click', () => {
     .then(data => {
         if (data.success) {
             statusDiv.textContent = 'Scraping in progress...';
-            startScrapingPolling();
+            startScrapingWatch();
         } else {
             statusDiv.className = 'status-display error';
             statusDiv.textContent = `Error: ${data.message || 'Unknown error'}`;
@@ -181,85 +181,76 @@ document.getElementById('scrape-btn').addEventListener('click', () => {
     });
 });
 
-function startScrapingPolling() {
-    if (scrapingInterval) clearInterval(scrapingInterval);
+function startScrapingWatch() {
+    if (stopScrapingWatch) stopScrapingWatch();
     
-    scrapingInterval = setInterval(() => {
-        fetch('/scrape/status')
-            .then(response => response.json())
-            .then(data => {
-                const statusDiv = document.getElementById('scrape-status');
-                const scrapeBtn = document.getElementById('scrape-btn');
+    stopScrapingWatch = watchTask('scraping', '/scrape/status', data => {
+        const statusDiv = document.getElementById('scrape-status');
+        const scrapeBtn = document.getElementById('scrape-btn');
+        
+        if (data.status === 'running') {
+            statusDiv.className = 'status-display running';
+            statusDiv.textContent = 'Scraping in progress...';
+        } else if (data.status === 'completed') {
+            statusDiv.className = 'status-display completed';
+            statusDiv.textContent = `Scraping completed! ${data.new_jobs_count} new jobs added.`;
+            scrapeBtn.disabled = false;
+
+            // Trigger latest-first review automatically if opted-in
+            if (autoEvaluateAfterScrape && data.new_jobs_count > 0) {
+                // Switch to review tab to show progress
+                document.querySelector('[data-tab="review"]').click();
                 
-                if (data.status === 'running') {
-                    statusDiv.className = 'status-display running';
-                    statusDiv.textContent = 'Scraping in progress...';
-                } else if (data.status === 'completed') {
-                    clearInterval(scrapingInterval);
-                    statusDiv.className = 'status-display completed';
-                    statusDiv.textContent = `Scraping completed! ${data.new_jobs_count} new jobs added.`;
-                    scrapeBtn.disabled = false;
-
-                    // Trigger latest-first review automatically if opted-in
-                    if (autoEvaluateAfterScrape && data.new_jobs_count > 0) {
-                        // Switch to review tab to show progress
-                        document.querySelector('[data-tab="review"]').click();
-                        
-                        const reviewBtn = document.getElementById('review-btn');
-                        const reviewStatus = document.getElementById('review-status');
-                        const progressContainer = document.getElementById('review-progress');
-                        reviewBtn.disabled = true;
-                        reviewStatus.className = 'status-display running';
-                        reviewStatus.textContent = 'Launching review...';
-                        progressContainer.style.display = 'block';
-
-                        fetch('/review/latest', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({ count: data.new_jobs_count })
-                        })
-                        .then(response => response.json())
-                        .then(resp => {
-                            if (resp.success) {
-                                reviewStatus.textContent = 'Review in progress...';
-                                startReviewPolling();
-                            } else {
-                                reviewStatus.className = 'status-display error';
-                                reviewStatus.textContent = `Error: ${resp.message || 'Unknown error'}`;
-                                reviewBtn.disabled = false;
-                                progressContainer.style.display = 'none';
-                            }
-                        })
-                        .catch(error => {
-                            reviewStatus.className = 'status-display error';
-                            reviewStatus.textContent = `Error: ${error.message}`;
-                            reviewBtn.disabled = false;
-                            progressContainer.style.display = 'none';
-                        })
-                        .finally(() => {
-                            autoEvaluateAfterScrape = false;
-                        });
+                const reviewBtn = document.getElementById('review-btn');
+                const reviewStatus = document.getElementById('review-status');
+                const progressContainer = document.getElementById('review-progress');
+                reviewBtn.disabled = true;
+                reviewStatus.className = 'status-display running';
+                reviewStatus.textContent = 'Launching review...';
+                progressContainer.style.display = 'block';
+
+                fetch('/review/latest', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ count: data.new_jobs_count })
+                })
+                .then(response => response.json())
+                .then(resp => {
+                    if (resp.success) {
+                        reviewStatus.textContent = 'Review in progress...';
+                        startReviewWatch();
                     } else {
-                        autoEvaluateAfterScrape = false;
+                        reviewStatus.className = 'status-display error';
+                        reviewStatus.textContent = `Error: ${resp.message || 'Unknown error'}`;
+                        reviewBtn.disabled = false;
+                        progressContainer.style.display = 'none';
                     }
-                } else if (data.status === 'error') {
-                    clearInterval(scrapingInterval);
-                    statusDiv.className = 'status-display error';
-                    statusDiv.textContent = `Error: ${data.error || 'Unknown error'}`;
-                    scrapeBtn.disabled = false;
-                } else {
-                    statusDiv.className = 'status-display idle';
-                    statusDiv.textContent = 'Ready to scrape';
-                }
-            })
-            .catch(error => {
-                console.error('Error polling scraping status:', error);
-            });
-    }, 2000); // Poll every 2 seconds
+                })
+                .catch(error => {
+                    reviewStatus.className = 'status-display error';
+                    reviewStatus.textContent = `Error: ${error.message}`;
+                    reviewBtn.disabled = false;
+                    progressContainer.style.display = 'none';
+                })
+                .finally(() => {
+                    autoEvaluateAfterScrape = false;
+                });
+            } else {
+                autoEvaluateAfterScrape = false;
+            }
+        } else if (data.status === 'error' || data.status === 'cancelled') {
+            statusDiv.className = 'status-display error';
+            statusDiv.textContent = data.status === 'cancelled' ? 'Cancelled' : `Error: ${data.error || 'Unknown error'}`;
+            scrapeBtn.disabled = false;
+        } else {
+            statusDiv.className = 'status-display idle';
+            statusDiv.textContent = 'Ready to scrape';
+        }
+    });
 }
 
 // Update status functionality
-let updateStatusInterval = null;
+let stopUpdateStatusWatch = null;
 
 document.getElementById('update-status-btn').addEventListener('click', () => {
     const updateStatusBtn = document.getElementById('update-status-btn');
@@ -279,7 +270,7 @@ document.getElementById('update-status-btn').addEventListener('click', () => {
     .then(data => {
         if (data.success) {
             statusDiv.textContent = 'Checking statuses in progress...';
-            startUpdateStatusPolling();
+            startUpdateStatusWatch();
         } else {
             statusDiv.className = 'status-display error';
             statusDiv.textContent = `Error: ${data.message || 'Unknown error'}`;
@@ -295,57 +286,54 @@ document.getElementById('update-status-btn').addEventListener('click', () => {
     });
 });
 
-function startUpdateStatusPolling() {
-    if (updateStatusInterval) clearInterval(updateStatusInterval);
+function startUpdateStatusWatch() {
+    if (stopUpdateStatusWatch) stopUpdateStatusWatch();
     
-    updateStatusInterval = setInterval(() => {
-        fetch('/update-status/status')
-            .then(response => response.json())
-            .then(data => {
-                const statusDiv = document.getElementById('update-status-display');
-                const updateStatusBtn = document.getElementById('update-status-btn');
-                const progressBar = document.getElementById('update-status-progress-bar');
-                const progressText = document.getElementById('update-status-progress-text');
-                const progressContainer = document.getElementById('update-status-progress');
-                
-                if (data.status === 'running') {
-                    statusDiv.className = 'status-display running';
-                    statusDiv.textContent = 'Checking job statuses...';
-                    progressContainer.style.display = 'block';
-                    
-                    const percentage = data.total > 0 ? (data.current / data.total) * 100 : 0;
-                    progressBar.style.width = `${percentage}%`;
-                    progressText.textContent = `${data.current} / ${data.total}`;
-                } else if (data.status === 'completed') {
-                    clearInterval(updateStatusInterval);
-                    statusDiv.className = 'status-display completed';
-                    statusDiv.textContent = `Status check completed! ${data.jobs_updated_count} jobs updated to 'Closed'.`;
-                    progressBar.style.width = '100%';
-                    progressText.textContent = `${data.total} / ${data.total}`;
-                    updateStatusBtn.disabled = false;
-                    
-                    // Refresh job list to reflect status changes
-                    refreshJobList();
-                } else if (data.status === 'error') {
-                    clearInterval(updateStatusInterval);
-                    statusDiv.className = 'status-display error';
-                    statusDiv.textContent = `Error: ${data.error || 'Unknown error'}`;
-                    updateStatusBtn.disabled = false;
-                    progressContainer.style.display = 'none';
-                } else {
-                    statusDiv.className = 'status-display idle';
-                    statusDiv.textContent = 'Ready to check statuses';
-                    progressContainer.style.display = 'none';
-                }
-            })
-            .catch(error => {
-                console.error('Error polling update status:', error);
-            });
-    }, 2000); // Poll every 2 seconds
+    stopUpdateStatusWatch = watchTask('update_status', '/update-status/status', data => {
+        const statusDiv = document.getElementById('update-status-display');
+        const updateStatusBtn = document.getElementById('update-status-btn');
+        const progressBar = document.getElementById('update-status-progress-bar');
+        const progressText = document.getElementById('update-status-progress-text');
+        const progressContainer = document.getElementById('update-status-progress');
+        
+        if (data.status === 'running') {
+            statusDiv.className = 'status-display running';
+            statusDiv.textContent = 'Checking job statuses...';
+            progressContainer.style.display = 'block';
+            
+            const percentage = data.total > 0 ? (data.current / data.total) * 100 : 0;
+            progressBar.style.width = `${percentage}%`;
+            progressText.textContent = `${data.current} / ${data.total}`;
+        } else if (data.status === 'completed') {
+            statusDiv.className = 'status-display completed';
+            statusDiv.textContent = `Status check completed! ${data.jobs_updated_count} jobs updated to 'Closed'.`;
+            progressBar.style.width = '100%';
+            progressText.textContent = `${data.total} / ${data.total}`;
+            updateStatusBtn.disabled = false;
+            
+            // Refresh job list to reflect status changes
+            refreshJobList();
+        } else if (data.status === 'error' || data.status === 'cancelled') {
+            statusDiv.className = 'status-display error';
+            statusDiv.textContent = data.status === 'cancelled' ? 'Cancelled' : `Error: ${data.error || 'Unknown error'}`;
+            updateStatusBtn.disabled = false;
+            progressContainer.style.display = 'none';
+        } else {
+            statusDiv.className = 'status-display idle';
+            statusDiv.textContent = 'Ready to check statuses';
+            progressContainer.style.display = 'none';
+        }
+    });
 }
 
 // Review functionality
-let reviewInterval = null;
+let stopReviewWatch = null;
+let lastReviewResult = null;
+
+// Each review result is pushed as soon as it is saved
+taskEvents.on('review', review => {
+    lastReviewResult = review;
+});
 
 document.getElementById('review-btn').addEventListener('click', () => {
     const count = parseInt(document.getElementById('review-count').value);
@@ -372,7 +360,7 @@ document.getElementById('review-btn').addEventListener('click', () => {
     .then(data => {
         if (data.success) {
             statusDiv.textContent = 'Review in progress...';
-            startReviewPolling();
+            startReviewWatch();
         } else {
             statusDiv.className = 'status-display error';
             statusDiv.textContent = `Error: ${data.message || 'Unknown error'}`;
@@ -388,89 +376,122 @@ document.getElementById('review-btn').addEventListener('click', () => {
     });
 });
 
-function startReviewPolling() {
-    if (reviewInterval) clearInterval(reviewInterval);
+function startReviewWatch() {
+    if (stopReviewWatch) stopReviewWatch();
+    lastReviewResult = null;
     
-    reviewInterval = setInterval(() => {
-        fetch('/review/status')
-            .then(response => response.json())
-            .then(data => {
-                const statusDiv = document.getElementById('review-status');
-                const reviewBtn = document.getElementById('review-btn');
-                const progressBar = document.getElementById('review-progress-bar');
-                const progressText = document.getElementById('review-progress-text');
-                const progressContainer = document.getElementById('review-progress');
-                
-                if (data.status === 'running') {
-                    statusDiv.className = 'status-display running';
-                    statusDiv.textContent = 'Review in progress...';
-                    progressContainer.style.display = 'block';
-                    
-                    const percentage = data.total > 0 ? (data.current / data.total) * 100 : 0;
-                    progressBar.style.width = `${percentage}%`;
-                    progressText.textContent = `${data.current} / ${data.total}`;
-                } else if (data.status === 'completed') {
-                    clearInterval(reviewInterval);
-                    statusDiv.className = 'status-display completed';
-                    statusDiv.textContent = `Review completed! ${data.total} jobs reviewed.`;
-                    progressBar.style.width = '100%';
-                    progressText.textContent = `${data.total} / ${data.total}`;
-                    reviewBtn.disabled = false;
-                    
-                    // Refresh job list
-                    refreshJobList();
-                } else if (data.status === 'error') {
-                    clearInterval(reviewInterval);
-                    statusDiv.className = 'status-display error';
-                    statusDiv.textContent = `Error: ${data.error || 'Unknown error'}`;
-                    reviewBtn.disabled = false;
-                    progressContainer.style.display = 'none';
-                } else {
-                    statusDiv.className = 'status-display idle';
-                    statusDiv.textContent = 'Ready to review';
-                    progressContainer.style.display = 'none';
-                }
-            })
-            .catch(error => {
-                console.error('Error polling review status:', error);
-            });
-    }, 2000); // Poll every 2 seconds
+    stopReviewWatch = watchTask('review', '/review/status', data => {
+        const statusDiv = document.getElementById('review-status');
+        const reviewBtn = document.getElementById('review-btn');
+        const progressBar = document.getElementById('review-progress-bar');
+        const progressText = document.getElementById('review-progress-text');
+        const progressContainer = document.getElementById('review-progress');
+        
+        if (data.status === 'running') {
+            statusDiv.className = 'status-display running';
+            statusDiv.textContent = lastReviewResult
+                ? `Review in progress... Last: job ${lastReviewResult.job_id} (score ${lastReviewResult.score ?? 'N/A'})`
+                : 'Review in progress...';
+            progressContainer.style.display = 'block';
+            
+            const percentage = data.total > 0 ? (data.current / data.total) * 100 : 0;
+            progressBar.style.width = `${percentage}%`;
+            progressText.textContent = `${data.current} / ${data.total}`;
+        } else if (data.status === 'completed') {
+            statusDiv.className = 'status-display completed';
+            statusDiv.textContent = `Review completed! ${data.total} jobs reviewed.`;
+            progressBar.style.width = '100%';
+            progressText.textContent = `${data.total} / ${data.total}`;
+            reviewBtn.disabled = false;
+            
+            // Refresh job list
+            refreshJobList();
+        } else if (data.status === 'error' || data.status === 'cancelled') {
+            statusDiv.className = 'status-display error';
+            statusDiv.textContent = data.status === 'cancelled' ? 'Cancelled' : `Error: ${data.error || 'Unknown error'}`;
+            reviewBtn.disabled = false;
+            progressContainer.style.display = 'none';
+        } else {
+            statusDiv.className = 'status-display idle';
+            statusDiv.textContent = 'Ready to review';
+            progressContainer.style.display = 'none';
+        }
+    });
 }
 
+// Sidebar pages come from /api/jobs; only the visible jobs are fetched
+const JOBS_PAGE_SIZE = 50;
+
+function createJobItem(job) {
+    const jobItem = document.createElement('div');
+    jobItem.className = 'job-item';
+    jobItem.dataset.jobId = job.id;
+    
+    const h4 = document.createElement('h4');
+    h4.textContent = `${job.title || 'N/A'} (Score: ${job.score !== null ? job.score : 'N/A'})`;
+    
+    const p = document.createElement('p');
+    p.textContent = `${job.company || 'N/A'} - ${job.location || 'N/A'}`;
+    
+    jobItem.appendChild(h4);
+    jobItem.appendChild(p);
+    
+    jobItem.addEventListener('click', () => {
+        displayJobDetails(job.id);
+        document.querySelectorAll('.job-item').forEach(i => i.classList.remove('selected'));
+        jobItem.classList.add('selected');
+    });
+    
+    return jobItem;
+}
+
+function fetchJobsPage(cursor) {
+    const params = new URLSearchParams({ status: 'unprocessed', limit: JOBS_PAGE_SIZE });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    return fetch(`/api/jobs?${params.toString()}`).then(response => response.json());
+}
+
+function appendJobsPage(data) {
+    const jobList = document.getElementById('job-list');
+    data.jobs.forEach(job => {
+        jobsData.push(job);
+        jobList.appendChild(createJobItem(job));
+    });
+    jobList.dataset.nextCursor = data.next_cursor || '';
+    document.getElementById('load-more-jobs-btn').style.display = data.next_cursor ? '' : 'none';
+    if (data.total !== null && data.total !== undefined) {
+        document.getElementById('jobs-to-process-count').textContent = data.total;
+    }
+}
+
+function loadMoreJobs() {
+    const cursor = document.getElementById('job-list').dataset.nextCursor;
+    if (!cursor) {
+        return;
+    }
+    fetchJobsPage(cursor)
+        .then(data => {
+            if (data.success) {
+                appendJobsPage(data);
+            }
+        })
+        .catch(error => {
+            console.error('Error loading more jobs:', error);
+        });
+}
+
+document.getElementById('load-more-jobs-btn').addEventListener('click', loadMoreJobs);
+
 function refreshJobList() {
-    fetch('/refresh-jobs')
-        .then(response => response.json())
+    fetchJobsPage(null)
         .then(data => {
             if (data.success) {
-                // Update the jobs data
-                Object.assign(jobsData, data.jobs);
-                
-                // Update the sidebar
-                const jobList = document.getElementById('job-list');
-                jobList.innerHTML = '';
-                
-                data.sidebar_jobs.forEach(job => {
-                    const jobItem = document.createElement('div');
-                    jobItem.className = 'job-item';
-                    jobItem.dataset.jobId = job.id;
-                    
-                    const h4 = document.createElement('h4');
-                    h4.textContent = `${job.title || 'N/A'} (Score: ${job.score !== null ? job.score : 'N/A'})`;
-                    
-                    const p = document.createElement('p');
-                    p.textContent = `${job.company || 'N/A'} - ${job.location || 'N/A'}`;
-                    
-                    jobItem.appendChild(h4);
-                    jobItem.appendChild(p);
-                    
-                    jobItem.addEventListener('click', () => {
-                        displayJobDetails(job.id);
-                        document.querySelectorAll('.job-item').forEach(i => i.classList.remove('selected'));
-                        jobItem.classList.add('selected');
-                    });
-                    
-                    jobList.appendChild(jobItem);
-                });
+                // Replace the jobs data and the sidebar with the first page
+                jobsData.length = 0;
+                document.getElementById('job-list').innerHTML = '';
+                appendJobsPage(data);
                 
                 // Update review count info
                 if (data.review_count_info) {
@@ -0,0 +1,104 @@
+// Background task progress pushed by the server on /events (server-sent events).
+// watchTask() replaces status polling: the handler gets the current status once,
+// then every change, until the task completes or fails.
+
+const TERMINAL_TASK_STATUSES = ['complete', 'completed', 'failed', 'error', 'cancelled'];
+const FALLBACK_POLL_INTERVAL = 2000;
+
+const taskEvents = (() => {
+    const listeners = {};
+    let source = null;
+
+    function dispatch(event, data) {
+        (listeners[event] || []).slice().forEach(listener => listener(data));
+    }
+
+    function connect() {
+        if (source || !window.EventSource) {
+            return;
+        }
+        // EventSource reconnects by itself and sends Last-Event-ID to replay missed events
+        source = new EventSource('/events');
+        ['status', 'review', 'task'].forEach(event => {
+            source.addEventListener(event, e => dispatch(event, JSON.parse(e.data)));
+        });
+    }
+
+    function on(event, listener) {
+        connect();
+        (listeners[event] = listeners[event] || []).push(listener);
+        return () => {
+            listeners[event] = (listeners[event] || []).filter(l => l !== listener);
+        };
+    }
+
+    return { on, supported: () => !!window.EventSource };
+})();
+
+// Calls handler(status) for a task until it reaches a terminal status. Returns a stop function.
+// statusUrl gives the current status on start; with refetch, it is also read on each pushed change
+// (for endpoints whose answer holds more than the task status). Customizer tasks run per job:
+// jobId keeps only the changes of that job.
+function watchTask(task, statusUrl, handler, options = {}) {
+    let stopped = false;
+    let pushed = false;
+    let unsubscribe = () => {};
+    let pollTimer = null;
+
+    function stop() {
+        stopped = true;
+        unsubscribe();
+        if (pollTimer) {
+            clearTimeout(pollTimer);
+        }
+    }
+
+    function handle(data) {
+        if (stopped) {
+            return;
+        }
+        if (TERMINAL_TASK_STATUSES.includes(data.status)) {
+            stop();
+        }
+        handler(data);
+    }
+
+    function fetchStatus() {
+        return fetch(statusUrl).then(response => response.json());
+    }
+
+    if (!taskEvents.supported()) {
+        // No server-sent events: fall back to polling
+        const poll = () => fetchStatus()
+            .then(data => {
+                handle(data);
+                if (!stopped) {
+                    pollTimer = setTimeout(poll, FALLBACK_POLL_INTERVAL);
+                }
+            })
+            .catch(error => console.error(`Error polling ${task} status:`, error));
+        poll();
+        return stop;
+    }
+
+    unsubscribe = taskEvents.on('status', data => {
+        if (data.task !== task || (options.jobId !== undefined && data.job_id !== options.jobId)) {
+            return;
+        }
+        pushed = true;
+        if (options.refetch) {
+            fetchStatus().then(handle).catch(error => console.error(`Error reading ${task} status:`, error));
+        } else {
+            handle(data);
+        }
+    });
+    // Current status, unless a pushed change already superseded it
+    fetchStatus()
+        .then(data => {
+            if (!pushed) {
+                handle(data);
+            }
+        })
+        .catch(error => console.error(`Error reading ${task} status:`, error));
+    return stop;
+}
@@ -0,0 +1,77 @@
+"""
+Fingerprinted static assets, for the production server.
+
+`url_for('static', filename=...)` gets a `v=<hash of the file content>` query
+argument, and a static file requested with the hash of its current content is
+served with a one-year immutable Cache-Control: browsers keep it until the file
+changes, which changes its URL. Hashes are computed on first use and recomputed
+when a file's mtime or size changes.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask, Response, request
+
+
+VERSION_ARG = "v"
+HASH_LENGTH = 12
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticAssets:
+    """Adds content hashes to static URLs and long-lived cache headers to the matching responses."""
+
+    def __init__(self, app: Optional[Flask] = None):
+        self._lock = threading.Lock()
+        # filename -> ((mtime_ns, size), hash)
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._static_folder: Optional[str] = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self._static_folder = app.static_folder
+        app.url_defaults(self._add_version)
+        app.after_request(self._cache_headers)
+
+    def file_hash(self, filename: str) -> Optional[str]:
+        """Hash of a static file's content, or None if it is not a file of the static folder."""
+        if self._static_folder is None:
+            return None
+        root = os.path.realpath(self._static_folder)
+        path = os.path.realpath(os.path.join(root, filename))
+        if not path.startswith(root + os.sep):
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(filename)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+        with self._lock:
+            self._hashes[filename] = (signature, digest)
+        return digest
+
+    def _add_version(self, endpoint: str, values: Dict[str, Any]) -> None:
+        if endpoint != "static" or VERSION_ARG in values or "filename" not in values:
+            return
+        digest = self.file_hash(values["filename"])
+        if digest is not None:
+            values[VERSION_ARG] = digest
+
+    def _cache_headers(self, response: Response) -> Response:
+        if request.endpoint != "static" or response.status_code != 200:
+            return response
+        version = request.args.get(VERSION_ARG)
+        filename = (request.view_args or {}).get("filename")
+        if version and filename and version == self.file_hash(filename):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -1,6 +1,7 @@
 import os
 import json
-from jobseeker_agent.interface import state
+from jobseeker_agent.interface import progress
+from jobseeker_agent.interface.sessions import get_session
 from jobseeker_agent.interface.utils import compile as compile_utils
 from jobseeker_agent.utils.paths import (
     load_prompt,
@@ -10,6 +11,7 @@ from jobseeker_agent.utils.paths import (
     load_raw_job,
 )
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
 from jobseeker_agent.customizer.agents.keyword_extractor import extract_keywords
 from jobseeker_agent.customizer.agents.keyword_executor import execute_keywords
 from jobseeker_agent.customizer.agents.ranker import rank, reorder_experiences, reorder_skills
@@ -17,14 +19,15 @@ from jobseeker_agent.customizer.agents.introducer import suggest_introductions
 from jobseeker_agent.customizer.agents.cover_letter.cover_letter import write_cover_letter
 
 
-def run_keyword_extraction_task():
-    """The actual keyword extraction logic to be run in a background thread."""
+def run_keyword_extraction_task(job_id: int):
+    """The actual keyword extraction logic to be run as a background task."""
+    session = get_session(job_id)
     try:
         print("➡️ [THREAD] Keyword extraction task started.")
-        state.EXTRACTION_STATUS["status"] = "pending"
+        progress.update_status("extraction", job_id, status="pending")
 
         print("    [THREAD] Loading job, prompt, and resume...")
-        job = load_raw_job(state.JOB_ID)
+        job = load_raw_job(job_id)
         profil_pro = load_prompt("profil_pro")
         resume = load_cv_template()
         print("    [THREAD] ...data loaded.")
@@ -33,6 +36,7 @@ def run_keyword_extraction_task():
         job_details = extract_job_details(job["job_link"])
         if not job_details:
             raise Exception("Failed to analyze LinkedIn job page.")
+        job_details = compact_job_details(job, job_details)
         print("    [THREAD] ...LinkedIn page analyzed.")
 
         print("    [THREAD] Calling LLM to extract keywords...")
@@ -41,7 +45,7 @@ def run_keyword_extraction_task():
         )
         print("    [THREAD] ...LLM response received.")
 
-        job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+        job_dir = session.job_dir
         titles_file = job_dir / "titles.json"
         with open(titles_file, "w", encoding="utf-8") as f:
             json.dump(extraction_response["title_suggestions"], f, indent=4)
@@ -50,21 +54,22 @@ def run_keyword_extraction_task():
         with open(keywords_file, "w", encoding="utf-8") as f:
             json.dump(extraction_response["classified"], f, indent=4)
 
-        state.EXTRACTION_STATUS["status"] = "complete"
+        progress.update_status("extraction", job_id, status="complete")
         print("✅ Background keyword extraction complete.")
     except Exception as e:
         print(f"❌ Background keyword extraction failed: {e}")
-        state.EXTRACTION_STATUS["status"] = "failed"
-        state.EXTRACTION_STATUS["error"] = str(e)
+        progress.update_status("extraction", job_id, status="failed", error=str(e))
+        raise
 
 
-def run_initial_load_task():
-    """Loads all necessary data in a background thread."""
+def run_initial_load_task(job_id: int):
+    """Loads all necessary data as a background task."""
+    session = get_session(job_id)
     try:
         print("➡️ [THREAD] Initial load task started.")
-        state.DATA_LOADING_STATUS["status"] = "pending"
+        progress.update_status("data_loading", job_id, status="pending")
 
-        job = load_raw_job(state.JOB_ID)
+        job = load_raw_job(job_id)
         print("    [THREAD] Analyzing LinkedIn job page...")
         job_details_live = extract_job_details(job["job_link"])
         print("    [THREAD] ...LinkedIn page analyzed.")
@@ -72,7 +77,10 @@ def run_initial_load_task():
         if not job_details_live:
             raise Exception("Failed to fetch live job details from LinkedIn.")
 
-        state.JOB_DESCRIPTION = job_details_live.get(
+        # The compacted description (boilerplate removed) is the one sent to the LLMs,
+        # the raw one is kept for display.
+        job_details_live = compact_job_details(job, job_details_live)
+        session.job_description = job_details_live.get(
             "description", "Could not fetch job description."
         )
 
@@ -83,7 +91,7 @@ def run_initial_load_task():
             with reviews_path.open("r", encoding="utf-8") as f:
                 reviews_data = json.load(f)
             job_review_data = next(
-                (item for item in reviews_data if item.get("id") == state.JOB_ID), None
+                (item for item in reviews_data if item.get("id") == job_id), None
             )
             if job_review_data:
                 job_review = job_review_data
@@ -91,29 +99,29 @@ def run_initial_load_task():
             print(f"Could not load or parse reviews.json: {e}")
         print("    [THREAD] ...reviews.json loaded.")
 
-        state.JOB_DETAILS = {
+        session.job_details = {
             "title": job.get("title"),
             "company_name": job.get("company"),
             "location": job.get("location"),
             "posted_date": job.get("posted_date"),
             "workplace_type": job.get("workplace_type"),
             "job_link": job.get("job_link"),
-            "description": state.JOB_DESCRIPTION,
+            "description": job_details_live["raw_description"],
             "score": job_review.get("score"),
             "evaluation_grid": job_review.get("evaluation_grid"),
             "synthesis": job_review.get("synthesis_and_decision"),
         }
         print("--- [SERVER-SIDE] Job Details Prepared ---")
-        print(json.dumps(state.JOB_DETAILS, indent=2))
+        print(json.dumps(session.job_details, indent=2))
         print("-----------------------------------------")
 
-        job_dir = get_data_path() / "resume" / f"{state.JOB_ID}"
+        job_dir = session.job_dir
         os.makedirs(job_dir, exist_ok=True)
 
         # Save job details to a file
         job_details_file = job_dir / "job_details.json"
         with open(job_details_file, "w", encoding="utf-8") as f:
-            json.dump(state.JOB_DETAILS, f, indent=4, ensure_ascii=False)
+            json.dump(session.job_details, f, indent=4, ensure_ascii=False)
 
         # Only initialize resume.tex if it doesn't exist yet
         resume_file = job_dir / "resume.tex"
@@ -123,37 +131,38 @@ def run_initial_load_task():
             with open(resume_file, "w", encoding="utf-8") as f:
                 f.write(resume)
             print("    [THREAD] Compiling initial TeX file...")
-            compile_utils.compile_tex()
+            compile_utils.compile_tex(job_id)
             print("    [THREAD] ...TeX file compiled.")
         else:
             print("    [THREAD] resume.tex already exists, preserving existing file.")
 
-        state.DATA_LOADING_STATUS["status"] = "complete"
+        progress.update_status("data_loading", job_id, status="complete")
         print("✅ Background initial data load complete.")
         print("JOB DETAILS COLLECTED")
 
     except Exception as e:
         print(f"❌ Background initial data load failed: {e}")
-        state.DATA_LOADING_STATUS["status"] = "failed"
-        state.DATA_LOADING_STATUS["error"] = str(e)
+        progress.update_status("data_loading", job_id, status="failed", error=str(e))
+        raise
 
 
-def run_ranker_task():
-    """The actual ranking logic to be run in a background thread."""
+def run_ranker_task(job_id: int):
+    """The actual ranking logic to be run as a background task."""
+    session = get_session(job_id)
     try:
         print("➡️ [THREAD] Ranker task started.")
-        state.RANKING_STATUS["status"] = "pending"
+        progress.update_status("ranking", job_id, status="pending")
 
         print("    [THREAD] Loading job, prompt, and resume...")
         profil_pro = load_prompt("profil_pro")
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         print("    [THREAD] ...data loaded.")
 
         print("    [THREAD] Calling LLM to rank experiences and skills...")
         response = rank(
-            job_id=state.JOB_ID,
-            job_description=state.JOB_DESCRIPTION,
+            job_id=job_id,
+            job_description=session.job_description,
             profil_pro=profil_pro,
             resume=resume_content,
         )
@@ -167,60 +176,62 @@ def run_ranker_task():
         print("    [THREAD] ...Reordering complete.")
 
         print("    [THREAD] Compiling ranked TeX file...")
-        compile_utils.compile_tex()
+        compile_utils.compile_tex(job_id)
         print("    [THREAD] ...TeX file compiled.")
 
-        state.RANKING_STATUS["status"] = "complete"
+        progress.update_status("ranking", job_id, status="complete")
         print("✅ Background ranking complete.")
     except Exception as e:
         print(f"❌ Background ranking failed: {e}")
-        state.RANKING_STATUS["status"] = "failed"
-        state.RANKING_STATUS["error"] = str(e)
+        progress.update_status("ranking", job_id, status="failed", error=str(e))
+        raise
 
 
-def run_introducer_task():
-    """The actual introduction suggestion logic to be run in a background thread."""
+def run_introducer_task(job_id: int):
+    """The actual introduction suggestion logic to be run as a background task."""
+    session = get_session(job_id)
     try:
         print("➡️ [THREAD] Introducer task started.")
-        state.INTRODUCTION_STATUS["status"] = "pending"
+        progress.update_status("introduction", job_id, status="pending")
 
         print("    [THREAD] Loading job, prompt, and resume...")
         profil_pro = load_prompt("profil_pro")
-        resume_file = get_data_path() / "resume" / str(state.JOB_ID) / "resume.tex"
+        resume_file = session.job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
-        synthesis_and_decision = state.JOB_DETAILS.get("synthesis") or ""
+        synthesis_and_decision = session.job_details.get("synthesis") or ""
         print("    [THREAD] ...data loaded.")
 
         print("    [THREAD] Calling LLM to suggest introductions...")
         response = suggest_introductions(
-            job_id=state.JOB_ID,
-            job_description=state.JOB_DESCRIPTION,
+            job_id=job_id,
+            job_description=session.job_description,
             profil_pro=profil_pro,
             synthesis_and_decision=synthesis_and_decision,
             resume=resume_content,
         )
         print("    [THREAD] ...LLM response received.")
 
-        state.INTRODUCTION_STATUS["status"] = "complete"
+        progress.update_status("introduction", job_id, status="complete")
         print("✅ Background introduction suggestion complete.")
     except Exception as e:
         print(f"❌ Background introduction suggestion failed: {e}")
-        state.INTRODUCTION_STATUS["status"] = "failed"
-        state.INTRODUCTION_STATUS["error"] = str(e)
+        progress.update_status("introduction", job_id, status="failed", error=str(e))
+        raise
 
 
-def run_cover_letter_task():
-    """The actual cover letter generation logic to be run in a background thread."""
+def run_cover_letter_task(job_id: int):
+    """The actual cover letter generation logic to be run as a background task."""
+    session = get_session(job_id)
     try:
         print("➡️ [THREAD] Cover letter task started.")
-        print(f"    [DEBUG] Initial status: {state.COVER_LETTER_STATUS}")
-        state.COVER_LETTER_STATUS["status"] = "pending"
-        print(f"    [DEBUG] Status set to pending: {state.COVER_LETTER_STATUS}")
+        print(f"    [DEBUG] Initial status: {session.statuses['cover_letter']}")
+        progress.update_status("cover_letter", job_id, status="pending")
+        print(f"    [DEBUG] Status set to pending: {session.statuses['cover_letter']}")
 
         print("    [THREAD] Loading cover letter template...")
         cover_letter_template = load_cover_letter_template()
         print(f"    [DEBUG] Template loaded, length: {len(cover_letter_template)} chars")
-        job_dir = get_data_path() / "resume" / str(state.JOB_ID)
+        job_dir = session.job_dir
         cover_letter_file = job_dir / "cover-letter.md"
         print(f"    [DEBUG] Cover letter file path: {cover_letter_file}")
 
@@ -230,20 +241,20 @@ def run_cover_letter_task():
         resume_file = job_dir / "resume.tex"
         resume_content = resume_file.read_text(encoding="utf-8")
         print(f"    [DEBUG] Resume loaded, length: {len(resume_content)} chars")
-        synthesis_and_decision = state.JOB_DETAILS.get("synthesis") or ""
+        synthesis_and_decision = session.job_details.get("synthesis") or ""
         print(f"    [DEBUG] Synthesis loaded, length: {len(synthesis_and_decision)} chars")
         print("    [THREAD] ...data loaded.")
 
         print("    [THREAD] Calling LLM to write cover letter...")
-        print(f"    [DEBUG] Job description length: {len(state.JOB_DESCRIPTION)} chars")
+        print(f"    [DEBUG] Job description length: {len(session.job_description)} chars")
         
         # Define status callback to update progress
         def update_status(message: str):
-            state.COVER_LETTER_STATUS["message"] = message
+            progress.update_status("cover_letter", job_id, message=message)
             print(f"    [PROGRESS] {message}")
         
         cover_letter_content = write_cover_letter(
-            job_description=state.JOB_DESCRIPTION,
+            job_description=session.job_description,
             profil_pro=profil_pro,
             synthesis_and_decision=synthesis_and_decision,
             resume=resume_content,
@@ -261,9 +272,8 @@ def run_cover_letter_task():
         print(f"    [DEBUG] File size: {cover_letter_file.stat().st_size} bytes")
 
         # Store the content in state for display
-        state.COVER_LETTER_STATUS["content"] = cover_letter_content
-        state.COVER_LETTER_STATUS["status"] = "complete"
-        print(f"    [DEBUG] Final status: {state.COVER_LETTER_STATUS}")
+        progress.update_status("cover_letter", job_id, content=cover_letter_content, status="complete")
+        print(f"    [DEBUG] Final status: {session.statuses['cover_letter']}")
         print("✅ Background cover letter generation complete.")
     except Exception as e:
         print(f"❌ Background cover letter generation failed: {e}")
@@ -271,7 +281,7 @@ def run_cover_letter_task():
         import traceback
         print(f"    [DEBUG] Full traceback:")
         traceback.print_exc()
-        state.COVER_LETTER_STATUS["status"] = "failed"
-        state.COVER_LETTER_STATUS["error"] = str(e)
-        print(f"    [DEBUG] Error status set: {state.COVER_LETTER_STATUS}")
+        progress.update_status("cover_letter", job_id, status="failed", error=str(e))
+        print(f"    [DEBUG] Error status set: {session.statuses['cover_letter']}")
+        raise
 
@@ -0,0 +1,316 @@
+"""
+Background task manager of the interface.
+
+Every long-running action (scraping, review, status update, customizer steps) is
+submitted here instead of starting its own thread. Tasks run on a bounded worker
+pool, with a concurrency limit per task type: a task over its type's limit waits
+in a queue until a task of the same type finishes.
+
+The task table (active tasks and the last finished ones) is saved to
+data/interface/tasks.json on every state change, so the history survives a
+restart; tasks still queued or running when the process stopped are marked
+"interrupted" on the next start (and their saved status, if "running", set to
+"error").
+
+Progress stays in the status dicts handled by `interface.progress`; a task's
+progress is the status of its type (of its type and job, for customizer tasks
+submitted with a "job_id" param), copied into its record when it finishes.
+Cancellation is cooperative: a queued task is dropped at once, a running task is
+stopped the next time it calls `check_cancelled()`.
+"""
+
+import itertools
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from jobseeker_agent.interface import progress
+from jobseeker_agent.utils.paths import load_tasks, save_tasks
+
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CONCURRENCY_LIMIT = 1
+# Task type -> number of tasks of that type allowed to run at the same time
+CONCURRENCY_LIMITS: Dict[str, int] = {
+    "scraping": 1,
+    "review": 1,
+    "update_status": 1,
+    # Customizer tasks of different jobs may run side by side
+    "extraction": 2,
+    "data_loading": 2,
+    "ranking": 2,
+    "introduction": 2,
+    "cover_letter": 2,
+}
+MAX_HISTORY = 200
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+
+class TaskCancelled(Exception):
+    """Raised by `check_cancelled()` in a task whose cancellation was requested."""
+
+
+class TaskAlreadyActive(Exception):
+    """Raised by `submit(..., unique=True)` when a task of the same type is queued or running."""
+
+    def __init__(self, task: "Task"):
+        super().__init__(f"A '{task.type}' task is already {task.state}")
+        self.task = task
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class Task:
+    """One submitted task: the callable to run and its record in the task table."""
+
+    def __init__(self, task_id: int, task_type: str, fn: Callable, args: tuple, kwargs: dict, params: Dict[str, Any]):
+        self.id = task_id
+        self.type = task_type
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.params = params
+        self.job_id: Optional[int] = params.get("job_id")
+        self.state = QUEUED
+        self.progress: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.created_at = _now()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise TaskCancelled(f"Task {self.id} ({self.type}) cancelled")
+
+    @property
+    def has_status(self) -> bool:
+        """Whether the task reports its progress through `interface.progress`."""
+        return progress.has_status(self.type) and (self.type not in progress.JOB_TASKS or self.job_id is not None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        task_progress = self.progress
+        if self.state == RUNNING and self.has_status:
+            task_progress = dict(progress.get_status(self.type, self.job_id))
+        return {
+            "id": self.id,
+            "type": self.type,
+            "state": self.state,
+            "params": self.params,
+            "progress": task_progress,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+_current = threading.local()
+
+
+def current_task() -> Optional[Task]:
+    """Task run by the calling thread, if it is a task manager worker."""
+    return getattr(_current, "task", None)
+
+
+def check_cancelled() -> None:
+    """Raises TaskCancelled if the task run by the calling thread was cancelled (no-op outside a task)."""
+    task = current_task()
+    if task is not None:
+        task.check_cancelled()
+
+
+class TaskManager:
+    """Bounded worker pool with per-type concurrency limits and a persistent task table."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        limits: Optional[Dict[str, int]] = None,
+        max_history: int = MAX_HISTORY,
+    ):
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._limits = {**CONCURRENCY_LIMITS, **(limits or {})}
+        self._active: Dict[int, Task] = {}
+        self._queues: Dict[str, Deque[Task]] = defaultdict(deque)
+        self._running: Dict[str, int] = defaultdict(int)
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        self._load_history()
+
+    def _load_history(self) -> None:
+        last_id = 0
+        interrupted = set()
+        for record in load_tasks():
+            if record.get("state") in ACTIVE_STATES:
+                record = {**record, "state": INTERRUPTED, "finished_at": record.get("finished_at") or _now()}
+                interrupted.add(record.get("type"))
+            self._history.append(record)
+            last_id = max(last_id, record.get("id", 0))
+        self._ids = itertools.count(last_id + 1)
+        # Global statuses are saved to disk: do not leave them "running" for a task that is gone
+        for task_type in interrupted:
+            if task_type in progress.TASKS and progress.get_status(task_type).get("status") == "running":
+                progress.update_status(task_type, status="error", error="Interrupted by a server restart")
+
+    def _save(self) -> None:
+        save_tasks(list(self._history) + [task.to_dict() for task in self._active.values()])
+
+    def _changed(self, task: Task) -> None:
+        """Saves the table and pushes the task record (caller holds the lock)."""
+        self._save()
+        progress.BROKER.publish("task", task.to_dict())
+
+    def submit(
+        self,
+        task_type: str,
+        fn: Callable,
+        *args: Any,
+        unique: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Task:
+        """
+        Queues `fn(*args, **kwargs)` as a task of type `task_type`.
+
+        Args:
+            unique: Refuse the task (TaskAlreadyActive) if one of the same type (and job) is queued or running
+            params: JSON-serializable parameters kept in the task record; a "job_id" ties the task to a job
+        """
+        with self._lock:
+            if unique:
+                active = self.active(task_type, (params or {}).get("job_id"))
+                if active:
+                    raise TaskAlreadyActive(active[0])
+            task = Task(next(self._ids), task_type, fn, args, kwargs, params or {})
+            self._active[task.id] = task
+            self._queues[task_type].append(task)
+            self._changed(task)
+            self._dispatch(task_type)
+        return task
+
+    def _dispatch(self, task_type: str) -> None:
+        """Hands queued tasks of a type to the pool while under its limit (caller holds the lock)."""
+        limit = self._limits.get(task_type, DEFAULT_CONCURRENCY_LIMIT)
+        queue = self._queues[task_type]
+        while queue and self._running[task_type] < limit:
+            task = queue.popleft()
+            self._running[task_type] += 1
+            self._executor.submit(self._run, task)
+
+    def _run(self, task: Task) -> None:
+        with self._lock:
+            task.state = RUNNING
+            task.started_at = _now()
+            self._changed(task)
+        _current.task = task
+        try:
+            task.check_cancelled()
+            task.fn(*task.args, **task.kwargs)
+            state, error = COMPLETED, None
+        except TaskCancelled:
+            state, error = CANCELLED, None
+            if task.has_status:
+                progress.update_status(task.type, task.job_id, status="cancelled")
+            print(f"🛑 Task {task.id} ({task.type}) cancelled.")
+        except Exception as e:
+            state, error = FAILED, str(e)
+            print(f"❌ Task {task.id} ({task.type}) failed: {e}")
+        finally:
+            _current.task = None
+        with self._lock:
+            self._running[task.type] -= 1
+            self._finish(task, state, error)
+            self._dispatch(task.type)
+
+    def _finish(self, task: Task, state: str, error: Optional[str]) -> None:
+        """Moves a task from the active table to the history (caller holds the lock)."""
+        task.state = state
+        task.error = error
+        task.finished_at = _now()
+        if task.started_at and task.has_status:
+            task.progress = dict(progress.get_status(task.type, task.job_id))
+        del self._active[task.id]
+        self._history.append(task.to_dict())
+        self._changed(task)
+
+    def cancel(self, task_id: int) -> bool:
+        """
+        Requests the cancellation of a task.
+
+        Returns:
+            False if the task is unknown or already finished
+        """
+        with self._lock:
+            task = self._active.get(task_id)
+            if task is None:
+                return False
+            task._cancel_event.set()
+            if task.state == QUEUED and task in self._queues[task.type]:
+                self._queues[task.type].remove(task)
+                self._finish(task, CANCELLED, None)
+            else:
+                self._changed(task)
+            return True
+
+    def active(self, task_type: Optional[str] = None, job_id: Optional[int] = None) -> List[Task]:
+        """Queued and running tasks (of a type, of a job), oldest first."""
+        with self._lock:
+            return [
+                task for task in self._active.values()
+                if (task_type is None or task.type == task_type) and (job_id is None or task.job_id == job_id)
+            ]
+
+    def is_active(self, task_type: str, job_id: Optional[int] = None) -> bool:
+        return bool(self.active(task_type, job_id))
+
+    def get(self, task_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if task_id in self._active:
+                return self._active[task_id].to_dict()
+            for record in self._history:
+                if record.get("id") == task_id:
+                    return record
+        return None
+
+    def list(
+        self, task_type: Optional[str] = None, job_id: Optional[int] = None, include_history: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Task records, most recent first."""
+        with self._lock:
+            records = [task.to_dict() for task in self._active.values()]
+            if include_history:
+                records += list(self._history)
+        if task_type is not None:
+            records = [record for record in records if record.get("type") == task_type]
+        if job_id is not None:
+            records = [record for record in records if record.get("params", {}).get("job_id") == job_id]
+        return sorted(records, key=lambda record: record.get("id", 0), reverse=True)
+
+
+_MANAGER_LOCK = threading.Lock()
+_MANAGER: Optional[TaskManager] = None
+
+
+def get_task_manager() -> TaskManager:
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = TaskManager()
+        return _MANAGER
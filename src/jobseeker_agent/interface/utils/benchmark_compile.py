@@ -0,0 +1,77 @@
+"""
+Benchmark of the resume compile time, with and without the precompiled format.
+
+Compiles a copy of a CV template in a temporary directory, first with a normal
+pdflatex run (preamble and packages loaded every time), then against a format
+dumped from the template preamble.
+
+Usage:
+    python -m jobseeker_agent.interface.utils.benchmark_compile [--lang en] [--runs 5]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from jobseeker_agent.interface.utils.compile import build_format, run_pdflatex, split_preamble
+from jobseeker_agent.utils.paths import load_cv_template
+
+
+def _time_runs(compile_once: Callable[[], tuple], runs: int) -> List[float]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        success, log = compile_once()
+        durations.append(time.perf_counter() - start)
+        if not success:
+            raise RuntimeError(f"Compilation failed:\n{log}")
+    return durations
+
+
+def _summary(label: str, durations: List[float]) -> str:
+    return (
+        f"{label:<22} mean {statistics.mean(durations):6.3f}s   "
+        f"median {statistics.median(durations):6.3f}s   min {min(durations):6.3f}s"
+    )
+
+
+def benchmark(lang: str = "en", runs: int = 5) -> None:
+    source = load_cv_template(lang)
+    parts = split_preamble(source)
+    if parts is None:
+        raise ValueError(f"cv-{lang}.tex has no \\begin{{document}}")
+    preamble, body = parts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        tex_file = work_dir / "resume.tex"
+        tex_file.write_text(source, encoding="utf-8")
+        body_file = work_dir / "resume.body.tex"
+        body_file.write_text(body, encoding="utf-8")
+        fmt_file = work_dir / f"cv-{lang}.fmt"
+
+        full = _time_runs(lambda: run_pdflatex(tex_file), runs)
+
+        start = time.perf_counter()
+        if not build_format(preamble, fmt_file):
+            raise RuntimeError("Format build failed")
+        format_build = time.perf_counter() - start
+
+        with_format = _time_runs(lambda: run_pdflatex(body_file, fmt_file, jobname="resume"), runs)
+
+    print(f"\n📊 Resume compile time, cv-{lang}.tex, {runs} runs each")
+    print(_summary("Full compile", full))
+    print(_summary("Precompiled format", with_format))
+    print(f"{'Format build (once)':<22} {format_build:6.3f}s")
+    print(f"Speed-up: x{statistics.median(full) / statistics.median(with_format):.2f} (median)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark resume compilation with and without a precompiled format.")
+    parser.add_argument("--lang", default="en", choices=["en", "fr"])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    benchmark(args.lang, args.runs)
@@ -0,0 +1,67 @@
+"""
+Final PDFs of a job: resume and cover letter.
+
+`build_job_pdfs` converts the cover letter from Markdown to LaTeX, then builds
+both documents at the same time on the compile service (each in its own scratch
+directory, published atomically, skipped if unchanged). `build_jobs` does the
+same for a list of jobs across a process pool.
+
+Usage (batch):
+    python -m jobseeker_agent.interface.utils.build 12 34 56 [--processes 4]
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from jobseeker_agent.customizer.agents.cover_letter.md_to_tex import markdown_to_latex_cover_letter
+from jobseeker_agent.interface.utils.compile import CompileResult, get_compile_service
+from jobseeker_agent.utils.paths import get_data_path
+
+
+DOCUMENTS = ("resume.tex", "cover-letter.tex")
+
+
+def build_job_pdfs(job_id: int) -> Dict[str, CompileResult]:
+    """
+    Builds the resume and cover letter PDFs of a job concurrently.
+
+    Returns:
+        Document name -> (success, log), for the documents the job has
+    """
+    job_dir = get_data_path() / "resume" / str(job_id)
+    markdown_file = job_dir / "cover-letter.md"
+    if markdown_file.exists():
+        markdown_to_latex_cover_letter(markdown_file, job_dir / "cover-letter.tex")
+
+    service = get_compile_service()
+    futures = {name: service.compile(job_dir / name) for name in DOCUMENTS if (job_dir / name).exists()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _build_job(job_id: int) -> Tuple[int, Dict[str, CompileResult]]:
+    try:
+        return job_id, build_job_pdfs(job_id)
+    except Exception as e:
+        return job_id, {"error": (False, str(e))}
+
+
+def build_jobs(job_ids: Iterable[int], processes: Optional[int] = None) -> Dict[int, Dict[str, CompileResult]]:
+    """Builds the final PDFs of several jobs across a process pool."""
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return dict(pool.map(_build_job, job_ids))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the resume and cover letter PDFs of jobs.")
+    parser.add_argument("job_ids", type=int, nargs="+")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    results = build_jobs(args.job_ids, args.processes)
+    for job_id, documents in results.items():
+        for name, (success, log) in documents.items():
+            if success:
+                print(f"✅ Job {job_id}: {name} built.")
+            else:
+                print(f"❌ Job {job_id}: {name} failed.\n{log[-1000:]}")
@@ -1,40 +1,299 @@
+"""
+LaTeX compilation of the resume and cover letter of a job.
+
+Builds go through a shared CompileService:
+- a document whose source hash matches its last successful build is not
+  rebuilt, the PDF on disk is returned as is;
+- requests for a document arriving while it builds are coalesced into a single
+  follow-up build, which reads the source as it is when it starts;
+- builds run on a small worker pool, each in its own scratch directory (on
+  tmpfs when /dev/shm is available); the PDF is published to the job directory
+  with an atomic rename, so readers never see a half-written file; pdflatex is
+  rerun while it asks for it (cross-references), up to MAX_PASSES;
+- a document whose preamble is the one of a CV template (data/resume/template/
+  cv-{lang}.tex) compiles against a format precompiled from that preamble, so
+  the packages are not reloaded on every run. Formats are cached per preamble
+  hash in data/resume/template/formats; a document whose preamble diverges, or
+  whose format build or compile fails, gets a normal compile.
+
+Benchmark (per-compile time with and without the format):
+    python -m jobseeker_agent.interface.utils.benchmark_compile
+"""
+
+import hashlib
+import os
+import shutil
 import subprocess
-from jobseeker_agent.utils.paths import get_data_path
-from jobseeker_agent.interface import state
-
-
-def compile_tex():
-    """Compiles the TeX file to a PDF."""
-    job_dir = get_data_path() / "resume" / f"{state.JOB_ID}"
-    print(f"Compiling resume.tex for job {state.JOB_ID}...")
-    result = subprocess.run(
-        ["pdflatex", "-output-directory", str(job_dir), str(job_dir / "resume.tex")],
-        capture_output=True,
-        text=True,
-    )
-    print("Compilation finished.")
-    if result.returncode != 0:
-        print("--- LaTeX Compilation Error ---")
-        print(result.stdout)
-        print(result.stderr)
-        return False, result.stdout
-    return True, ""
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from jobseeker_agent.utils.paths import get_cv_template_path, get_data_path, get_latex_formats_dir
+
+
+DEFAULT_COMPILE_WORKERS = 2
+MAX_PASSES = 3
+RERUN_MARKERS = ("Rerun to get", "Label(s) may have changed")
+CV_TEMPLATE_LANGS = ("en", "fr")
+BEGIN_DOCUMENT = "\\begin{document}"
+SCRATCH_ROOT = Path("/dev/shm")
+
+CompileResult = Tuple[bool, str]
+
+
+def _job_dir(job_id: int) -> Path:
+    return get_data_path() / "resume" / f"{job_id}"
+
+
+def _hash_file(tex_file: Path) -> Path:
+    return tex_file.with_suffix(".build-hash")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
-def compile_cover_letter_tex():
-    """Compiles the cover-letter.tex file to a PDF."""
-    job_dir = get_data_path() / "resume" / f"{state.JOB_ID}"
-    print(f"Compiling cover-letter.tex for job {state.JOB_ID}...")
-    result = subprocess.run(
-        ["pdflatex", "-output-directory", str(job_dir), str(job_dir / "cover-letter.tex")],
-        capture_output=True,
-        text=True,
-    )
-    print("Compilation finished.")
-    if result.returncode != 0:
-        print("--- LaTeX Compilation Error ---")
-        print(result.stdout)
-        print(result.stderr)
-        return False, result.stdout
+def source_hash(tex_file: Path) -> str:
+    return _sha256(tex_file.read_bytes())
+
+
+def is_up_to_date(tex_file: Path) -> bool:
+    """Whether the PDF was built from the current content of the .tex file."""
+    hash_file = _hash_file(tex_file)
+    if not tex_file.exists() or not hash_file.exists() or not tex_file.with_suffix(".pdf").exists():
+        return False
+    return hash_file.read_text(encoding="utf-8").strip() == source_hash(tex_file)
+
+
+def run_pdflatex(tex_file: Path, fmt_file: Optional[Path] = None, jobname: Optional[str] = None) -> CompileResult:
+    """
+    Compiles a .tex file next to itself, rerunning pdflatex while it asks for it.
+
+    Args:
+        fmt_file: Precompiled format to load instead of the default LaTeX one
+        jobname: Base name of the outputs (default: the name of the .tex file)
+    """
+    command = ["pdflatex", "-interaction=nonstopmode", "-output-directory", str(tex_file.parent)]
+    if fmt_file is not None:
+        command.append(f"-fmt={fmt_file.with_suffix('')}")
+    if jobname is not None:
+        command.append(f"-jobname={jobname}")
+    command.append(str(tex_file))
+    for _ in range(MAX_PASSES):
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print("--- LaTeX Compilation Error ---")
+            print(result.stdout)
+            print(result.stderr)
+            return False, result.stdout
+        if not any(marker in result.stdout for marker in RERUN_MARKERS):
+            break
     return True, ""
 
+
+def split_preamble(source: str) -> Optional[Tuple[str, str]]:
+    """(preamble, body starting at \\begin{document}), or None if there is no \\begin{document}."""
+    index = source.find(BEGIN_DOCUMENT)
+    if index == -1:
+        return None
+    return source[:index], source[index:]
+
+
+def preamble_hash(preamble: str) -> str:
+    return _sha256(preamble.replace("\r\n", "\n").strip().encode("utf-8"))[:16]
+
+
+def scratch_dir() -> tempfile.TemporaryDirectory:
+    """Temporary build directory, on tmpfs (/dev/shm) when available."""
+    root = SCRATCH_ROOT if SCRATCH_ROOT.is_dir() and os.access(SCRATCH_ROOT, os.W_OK) else None
+    return tempfile.TemporaryDirectory(prefix="jobseeker-latex-", dir=root)
+
+
+def publish(built_file: Path, dest: Path) -> None:
+    """Atomically replaces `dest` with `built_file`, which may be on another file system."""
+    tmp_file = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    shutil.copyfile(built_file, tmp_file)
+    os.replace(tmp_file, dest)
+
+
+def build_format(preamble: str, fmt_file: Path) -> bool:
+    """Dumps a LaTeX format holding `preamble` (documentclass and packages) to `fmt_file`."""
+    with scratch_dir() as scratch:
+        ini_file = Path(scratch) / f"{fmt_file.stem}.ini.tex"
+        ini_file.write_text(preamble + "\n\\dump\n", encoding="utf-8")
+        print(f"Building LaTeX format {fmt_file.name}...")
+        result = subprocess.run(
+            [
+                "pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={fmt_file.stem}",
+                "-output-directory", scratch, "&pdflatex", str(ini_file),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        built_file = Path(scratch) / fmt_file.name
+        if result.returncode != 0 or not built_file.exists():
+            print(f"⚠️ Could not build LaTeX format {fmt_file.name}, documents will be compiled without it.")
+            print(result.stdout[-2000:])
+            return False
+        # Another process may be building the same format: the last rename wins, both are identical
+        publish(built_file, fmt_file)
+    return True
+
+
+class FormatCache:
+    """Precompiled formats of the CV template preambles, built on first use and keyed by preamble hash."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failed: Set[str] = set()
+
+    def _template_langs(self) -> Dict[str, str]:
+        """Preamble hash -> language, for the CV templates on disk."""
+        langs = {}
+        for lang in CV_TEMPLATE_LANGS:
+            template_path = get_cv_template_path(lang)
+            if not template_path.exists():
+                continue
+            parts = split_preamble(template_path.read_text(encoding="utf-8"))
+            if parts is not None:
+                langs[preamble_hash(parts[0])] = lang
+        return langs
+
+    def get(self, preamble: str) -> Optional[Path]:
+        """Format for a document preamble, or None if it is not the preamble of a CV template."""
+        digest = preamble_hash(preamble)
+        with self._lock:
+            if digest in self._failed:
+                return None
+            lang = self._template_langs().get(digest)
+            if lang is None:
+                return None
+            fmt_file = get_latex_formats_dir() / f"cv-{lang}-{digest}.fmt"
+            if not fmt_file.exists() and not build_format(preamble, fmt_file):
+                self._failed.add(digest)
+                return None
+            return fmt_file
+
+
+def build_pdf(tex_file: Path, source: Optional[str] = None, formats: Optional[FormatCache] = None) -> CompileResult:
+    """Compiles a .tex file, against the precompiled format of its preamble when there is one."""
+    if source is None:
+        source = tex_file.read_text(encoding="utf-8")
+    parts = split_preamble(source)
+    fmt_file = (formats or get_format_cache()).get(parts[0]) if parts is not None else None
+    if fmt_file is not None:
+        # The preamble is already in the format: only the body is read
+        body_file = tex_file.with_name(f"{tex_file.stem}.body.tex")
+        body_file.write_text(parts[1], encoding="utf-8")
+        success, log = run_pdflatex(body_file, fmt_file, jobname=tex_file.stem)
+        if success:
+            return success, log
+        print(f"⚠️ Compilation of {tex_file.name} with format {fmt_file.name} failed, retrying without it.")
+    return run_pdflatex(tex_file)
+
+
+def build_isolated(tex_file: Path, source: str) -> CompileResult:
+    """Compiles `source` in a scratch directory and, on success, publishes the PDF next to `tex_file`."""
+    with scratch_dir() as scratch:
+        scratch_tex = Path(scratch) / tex_file.name
+        scratch_tex.write_text(source, encoding="utf-8")
+        result = build_pdf(scratch_tex, source)
+        if result[0]:
+            publish(scratch_tex.with_suffix(".pdf"), tex_file.with_suffix(".pdf"))
+    return result
+
+
+class _DocumentBuilds:
+    """Running and follow-up build of one document."""
+
+    def __init__(self):
+        self.running: Optional[Future] = None
+        self.pending: Optional[Future] = None
+
+
+class CompileService:
+    """Hash-aware, coalescing pdflatex builds on a worker pool."""
+
+    def __init__(self, max_workers: int = DEFAULT_COMPILE_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdflatex")
+        self._lock = threading.Lock()
+        self._builds: Dict[Path, _DocumentBuilds] = {}
+
+    def compile(self, tex_file: Path) -> "Future[CompileResult]":
+        """
+        Requests a build of `tex_file`.
+
+        Returns a future of (success, log): already done if the PDF is up to date,
+        shared with other requests if a follow-up build is already queued.
+        """
+        with self._lock:
+            builds = self._builds.setdefault(tex_file, _DocumentBuilds())
+            if builds.pending is not None:
+                return builds.pending
+            future: Future = Future()
+            if builds.running is not None:
+                # Built once the running build is over, from the source as it is then
+                builds.pending = future
+                return future
+            if is_up_to_date(tex_file):
+                print(f"✅ {tex_file.name} unchanged since its last build, PDF reused.")
+                future.set_result((True, ""))
+                return future
+            builds.running = future
+        self._executor.submit(self._build, tex_file, future)
+        return future
+
+    def _build(self, tex_file: Path, future: Future) -> None:
+        try:
+            if is_up_to_date(tex_file):
+                result = (True, "")
+            else:
+                print(f"Compiling {tex_file.name} for job {tex_file.parent.name}...")
+                data = tex_file.read_bytes()
+                digest = _sha256(data)
+                result = build_isolated(tex_file, data.decode("utf-8"))
+                print("Compilation finished.")
+                if result[0]:
+                    _hash_file(tex_file).write_text(digest, encoding="utf-8")
+            future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+        with self._lock:
+            builds = self._builds[tex_file]
+            builds.running, builds.pending = builds.pending, None
+            next_future = builds.running
+        if next_future is not None:
+            self._executor.submit(self._build, tex_file, next_future)
+
+
+_SERVICE_LOCK = threading.Lock()
+_SERVICE: Optional[CompileService] = None
+_FORMATS: Optional[FormatCache] = None
+
+
+def get_format_cache() -> FormatCache:
+    global _FORMATS
+    with _SERVICE_LOCK:
+        if _FORMATS is None:
+            _FORMATS = FormatCache()
+        return _FORMATS
+
+
+def get_compile_service() -> CompileService:
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = CompileService()
+        return _SERVICE
+
+
+def compile_tex(job_id: int) -> CompileResult:
+    """Compiles the TeX file of a job to a PDF."""
+    return get_compile_service().compile(_job_dir(job_id) / "resume.tex").result()
+
+
+def compile_cover_letter_tex(job_id: int) -> CompileResult:
+    """Compiles the cover-letter.tex file of a job to a PDF."""
+    return get_compile_service().compile(_job_dir(job_id) / "cover-letter.tex").result()
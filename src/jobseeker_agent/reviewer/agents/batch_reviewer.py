@@ -0,0 +1,257 @@
+"""
+Review de plusieurs jobs dans une seule requête LLM.
+
+Le profil et la grille de critères ne sont envoyés qu'une fois pour K offres, et
+le LLM renvoie K grilles d'évaluation. K est choisi d'après la fenêtre de contexte
+et la limite de tokens de sortie du modèle. Les entrées manquantes ou invalides
+sont reviewées individuellement avec `review`. Les tokens de la requête sont
+répartis entre les jobs pour que le coût par review reste comparable au mode
+un-job-par-requête.
+"""
+
+from dotenv import load_dotenv
+from langchain.schema import HumanMessage, AIMessage
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from typing_extensions import TypedDict, Annotated
+from typing import List, Dict, Optional, Any
+import json
+import re
+import time
+
+from jobseeker_agent.reviewer.agents.reviewer import (
+    CORRECTION_PROMPT,
+    Evaluation,
+    get_reasoning_config,
+    get_usage_totals,
+    review,
+)
+from jobseeker_agent.reviewer.scoring import REVIEWER_PROMPT_PATH
+from jobseeker_agent.utils.paths import get_data_path, load_prompt
+from jobseeker_agent.utils.llm import get_llm, calculate_cost, estimate_tokens, get_model_limits
+from jobseeker_agent.utils.fake_llm import register_field_values
+
+
+load_dotenv()
+
+# Nombre maximal d'offres par requête, quelle que soit la taille du contexte
+MAX_BATCH_SIZE = 8
+# Estimation des tokens de sortie pour la grille d'une offre
+OUTPUT_TOKENS_PER_JOB = 800
+# Part de la fenêtre de contexte / de la limite de sortie que l'on s'autorise à remplir
+CONTEXT_SAFETY_RATIO = 0.5
+OUTPUT_SAFETY_RATIO = 0.5
+
+
+class BatchJobReview(TypedDict):
+    """Review of one job offer of the batch."""
+    job_id: Annotated[int, ..., "The job_id shown in the header of the job offer."]
+    evaluation_grid: Annotated[List[Evaluation], ..., "List of evaluations for each relevant evaluation criterion"]
+    score: Annotated[float, ..., "raw score computed from the evaluation grid. Can be negative."]
+
+
+class BatchReviewResponse(TypedDict):
+    """Response structure for a batch of job reviews."""
+    reviews: Annotated[List[BatchJobReview], ..., "One review per job offer, in any order."]
+
+
+def _load_profile() -> str:
+    # Lecture directe : load_prompt retournerait le .md de ce module
+    with open(get_data_path() / "prompts" / "profil_pro.md", "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _evaluation_instructions() -> str:
+    """Grille de critères et consignes du prompt single-job (à partir de 'Identify which...')."""
+    with open(REVIEWER_PROMPT_PATH, "r", encoding="utf-8") as f:
+        prompt = f.read()
+    instructions = prompt[prompt.index("Identify which"):]
+    return instructions[0].lower() + instructions[1:]
+
+
+def format_job_offer(job: Dict[str, Any], job_details: Dict[str, Any]) -> str:
+    """Bloc d'une offre dans le prompt batch."""
+    return (
+        f"### Job offer (job_id: {job['id']})\n"
+        f"company name: {job['company']},\n"
+        f"job title: {job['title']},\n"
+        f"location: {job['location']},\n"
+        f"job description: {job_details['description']}\n"
+    )
+
+
+def _job_ids_in(text: str) -> List[int]:
+    """job_id des offres présentes dans un prompt batch."""
+    return [int(job_id) for job_id in re.findall(r"### Job offer \(job_id: (\d+)\)", text)]
+
+
+# Les modèles fake: renvoient une review par offre du prompt
+register_field_values("job_id", _job_ids_in)
+
+
+def _shared_prompt_tokens() -> int:
+    """Tokens du prompt commun à toutes les offres (profil + grille)."""
+    return estimate_tokens(load_prompt("batch_reviewer")) + estimate_tokens(_load_profile()) + estimate_tokens(_evaluation_instructions())
+
+
+def plan_batches(
+    jobs: List[Dict[str, Any]],
+    jobs_details: List[Dict[str, Any]],
+    model: str,
+    with_correction: bool = True,
+    max_batch_size: int = MAX_BATCH_SIZE
+) -> List[List[int]]:
+    """
+    Découpe les jobs en lots qui tiennent dans le contexte et la limite de sortie du modèle.
+
+    Returns:
+        Liste de lots, chaque lot étant une liste d'indices dans `jobs`
+    """
+    limits = get_model_limits(model)
+    context_budget = limits["context"] * CONTEXT_SAFETY_RATIO
+    max_jobs_by_output = max(1, int(limits["output"] * OUTPUT_SAFETY_RATIO // OUTPUT_TOKENS_PER_JOB))
+    max_jobs = max(1, min(max_batch_size, max_jobs_by_output))
+    shared_tokens = _shared_prompt_tokens()
+    # Avec correction, la première réponse est renvoyée au modèle dans la seconde requête
+    output_factor = 2 if with_correction else 1
+
+    batches = []
+    current, current_tokens = [], shared_tokens
+    for i, (job, job_details) in enumerate(zip(jobs, jobs_details)):
+        job_tokens = estimate_tokens(format_job_offer(job, job_details)) + output_factor * OUTPUT_TOKENS_PER_JOB
+        if current and (len(current) >= max_jobs or current_tokens + job_tokens > context_budget):
+            batches.append(current)
+            current, current_tokens = [], shared_tokens
+        current.append(i)
+        current_tokens += job_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _is_valid_entry(entry: Any) -> bool:
+    """Vérifie qu'une review du lot a la structure attendue."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("evaluation_grid"), list):
+        return False
+    if not isinstance(entry.get("score"), (int, float)):
+        return False
+    for evaluation in entry["evaluation_grid"]:
+        if not isinstance(evaluation, dict) or not isinstance(evaluation.get("score"), (int, float)):
+            return False
+        try:
+            int(evaluation.get("id"))
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def review_batch(
+    jobs: List[Dict[str, Any]],
+    jobs_details: List[Dict[str, Any]],
+    model: str = "gpt-4.1",
+    with_correction: bool = True,
+    reasoning_level: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Reviews several jobs in a single structured-output request.
+
+    Args:
+        jobs: Job dicts containing at least 'id', 'title', 'company', 'location'
+        jobs_details: Job details dicts containing 'description', aligned with `jobs`
+        model: Model name to use (default: "gpt-4.1")
+        with_correction: Whether to apply self-correction (default: True)
+        reasoning_level: Level of reasoning to use. "low", "medium", "high" (default: None)
+
+    Returns:
+        One review per job, in the order of `jobs`, with the same structure as `review`.
+        metadata['batch'] holds the size and the totals of the shared request.
+    """
+    if len(jobs) == 1:
+        return [review(jobs[0], jobs_details[0], model, with_correction, reasoning_level)]
+
+    start_time = time.time()
+    job_offers = [format_job_offer(job, job_details) for job, job_details in zip(jobs, jobs_details)]
+    message = HumanMessage(
+        content=load_prompt("batch_reviewer").format(
+            profil_pro=_load_profile(),
+            job_count=len(jobs),
+            evaluation_instructions=_evaluation_instructions(),
+            job_offers="\n".join(job_offers),
+        )
+    )
+
+    llm = get_llm(model, reasoning=get_reasoning_config(model, reasoning_level))
+    llm = llm.with_structured_output(BatchReviewResponse)
+    usage_callback = UsageMetadataCallbackHandler()
+    try:
+        response = llm.invoke([message], config={"callbacks": [usage_callback]})
+        if with_correction:
+            messages = [
+                message,
+                AIMessage(content=json.dumps(response)),
+                HumanMessage(content=CORRECTION_PROMPT + " Keep one review per job offer.")
+            ]
+            response = llm.invoke(messages, config={"callbacks": [usage_callback]})
+        entries = (response or {}).get("reviews") or []
+    except Exception as e:
+        print(f"⚠️  Batch review of {len(jobs)} jobs failed ({e}). Falling back to single-job reviews.")
+        entries = []
+    execution_time = time.time() - start_time
+    input_tokens, output_tokens, total_tokens = get_usage_totals(usage_callback)
+
+    entries_by_id = {}
+    for entry in entries:
+        if _is_valid_entry(entry):
+            try:
+                entries_by_id.setdefault(int(entry.get("job_id")), entry)
+            except (TypeError, ValueError):
+                continue
+    valid = [job["id"] in entries_by_id for job in jobs]
+
+    # Répartition des tokens entre les reviews valides : prompt commun à parts égales,
+    # offre et sortie au prorata de leur taille
+    n_valid = sum(valid) or 1
+    shared_tokens = _shared_prompt_tokens()
+    input_weights = [
+        shared_tokens / n_valid + estimate_tokens(offer) if is_valid else 0
+        for offer, is_valid in zip(job_offers, valid)
+    ]
+    output_weights = [len(json.dumps(entries_by_id[job["id"]])) if is_valid else 0 for job, is_valid in zip(jobs, valid)]
+    input_total = sum(input_weights) or 1
+    output_total = sum(output_weights) or 1
+    batch_metadata = {
+        "size": len(jobs),
+        "valid": sum(valid),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
+        "total_cost": calculate_cost(model, input_tokens, output_tokens),
+        "execution_time": execution_time,
+    }
+
+    reviews = []
+    for i, (job, job_details) in enumerate(zip(jobs, jobs_details)):
+        if not valid[i]:
+            print(f"⚠️  No valid review for job {job['id']} in the batch. Reviewing it alone.")
+            single_review = review(job, job_details, model, with_correction, reasoning_level)
+            single_review["metadata"]["batch"] = {**batch_metadata, "fallback": True}
+            reviews.append(single_review)
+            continue
+
+        entry = entries_by_id[job["id"]]
+        job_input_tokens = round(input_tokens * input_weights[i] / input_total)
+        job_output_tokens = round(output_tokens * output_weights[i] / output_total)
+        reviews.append({
+            "evaluation_grid": entry["evaluation_grid"],
+            "score": entry["score"],
+            "id": job["id"],
+            "metadata": {
+                "model": model,
+                "input_tokens": job_input_tokens,
+                "output_tokens": job_output_tokens,
+                "total_tokens": job_input_tokens + job_output_tokens,
+                "total_cost": calculate_cost(model, job_input_tokens, job_output_tokens),
+                "execution_time": execution_time / n_valid,
+                "with_correction": with_correction,
+                "batch": batch_metadata,
+            },
+        })
+    return reviews
@@ -37,6 +37,59 @@ def _model_supports_reasoning(model_name: str) -> bool:
     return model_lower.startswith("gpt-5") or "gemini" in model_lower
 
 
+def get_reasoning_config(model: str, reasoning_level: Optional[str]) -> Optional[dict]:
+    """Configuration reasoning à passer à get_llm (None si le modèle ne le supporte pas)."""
+    # Ne passer le paramètre reasoning que si le modèle le supporte
+    if reasoning_level and _model_supports_reasoning(model):
+        return {
+            "effort": reasoning_level,
+            "summary": None
+        }
+    if reasoning_level:
+        print(f"⚠️  Model {model} does not support reasoning_level. Ignoring parameter.")
+    return None
+
+
+def get_usage_totals(usage_callback: UsageMetadataCallbackHandler) -> tuple:
+    """Retourne (input_tokens, output_tokens, total_tokens) cumulés par le callback."""
+    # UsageMetadataCallbackHandler expose usage_metadata comme un dict organisé par modèle
+    # Structure: {'model-name': {'input_tokens': X, 'output_tokens': Y, 'total_tokens': Z, ...}}
+    usage_metadata = getattr(usage_callback, 'usage_metadata', {})
+    
+    # Sommer les tokens de tous les modèles (au cas où plusieurs appels avec différents modèles)
+    input_tokens = 0
+    output_tokens = 0
+    total_tokens = 0
+    
+    if usage_metadata:
+        for model_usage in usage_metadata.values():
+            if isinstance(model_usage, dict):
+                input_tokens += model_usage.get('input_tokens', 0)
+                output_tokens += model_usage.get('output_tokens', 0)
+                total_tokens += model_usage.get('total_tokens', 0)
+    
+    # Si total_tokens n'est pas fourni, le calculer
+    if total_tokens == 0 and (input_tokens > 0 or output_tokens > 0):
+        total_tokens = input_tokens + output_tokens
+    return input_tokens, output_tokens, total_tokens
+
+
+CORRECTION_PROMPT = "Please correct the evaluation grid. Evaluate each element. Is it correct ? Are there any missing element ? If elements are removed from the evaluation grid, don't put them in the evaluation grid."
+
+
+def build_review_prompt(job: Dict[str, Any], job_details: Dict[str, Any]) -> str:
+    """Construit le prompt de review d'un job (utilisé aussi par le mode batch hors ligne)."""
+    review_prompt = load_prompt("reviewer")
+    profil_pro = load_prompt("profil_pro")
+    return review_prompt.format(
+        job_description=job_details["description"],
+        job_title=job["title"],
+        company_name=job["company"],
+        location=job["location"],
+        profil_pro=profil_pro
+    )
+
+
 def review(
     job: Dict[str, Any], 
     job_details: Dict[str, Any], 
@@ -59,34 +112,13 @@ def review(
     """
     start_time = time.time()
     
-    review_prompt = load_prompt("reviewer")
-    profil_pro = load_prompt("profil_pro")
-
-    # Ne passer le paramètre reasoning que si le modèle le supporte
-    reasoning = None
-    if reasoning_level and _model_supports_reasoning(model):
-        reasoning = {
-            "effort": reasoning_level,
-            "summary": None
-        }
-    elif reasoning_level and not _model_supports_reasoning(model):
-        print(f"⚠️  Model {model} does not support reasoning_level. Ignoring parameter.")
-    
-    llm = get_llm(model, reasoning=reasoning)
+    llm = get_llm(model, reasoning=get_reasoning_config(model, reasoning_level))
     llm = llm.with_structured_output(JobReviewResponse)
     
     # Créer le callback pour capturer les métadonnées de tokens
     usage_callback = UsageMetadataCallbackHandler()
     
-    message = HumanMessage(
-        content=review_prompt.format(
-            job_description=job_details["description"],
-            job_title=job["title"],
-            company_name=job["company"],
-            location=job["location"],
-            profil_pro=profil_pro
-        )
-    )
+    message = HumanMessage(content=build_review_prompt(job, job_details))
     
     # Invoquer avec le callback - les tokens seront cumulés automatiquement
     response = llm.invoke([message], config={"callbacks": [usage_callback]})
@@ -95,32 +127,14 @@ def review(
         messages = [
             message,
             AIMessage(content=json.dumps(response)),
-            HumanMessage(content="Please correct the evaluation grid. Evaluate each element. Is it correct ? Are there any missing element ? If elements are removed from the evaluation grid, don't put them in the evaluation grid.")
+            HumanMessage(content=CORRECTION_PROMPT)
         ]
         response = llm.invoke(messages, config={"callbacks": [usage_callback]})
     
     # Récupérer les métadonnées depuis le callback
     execution_time = time.time() - start_time
     
-    # UsageMetadataCallbackHandler expose usage_metadata comme un dict organisé par modèle
-    # Structure: {'model-name': {'input_tokens': X, 'output_tokens': Y, 'total_tokens': Z, ...}}
-    usage_metadata = getattr(usage_callback, 'usage_metadata', {})
-    
-    # Sommer les tokens de tous les modèles (au cas où plusieurs appels avec différents modèles)
-    input_tokens = 0
-    output_tokens = 0
-    total_tokens = 0
-    
-    if usage_metadata:
-        for model_usage in usage_metadata.values():
-            if isinstance(model_usage, dict):
-                input_tokens += model_usage.get('input_tokens', 0)
-                output_tokens += model_usage.get('output_tokens', 0)
-                total_tokens += model_usage.get('total_tokens', 0)
-    
-    # Si total_tokens n'est pas fourni, le calculer
-    if total_tokens == 0 and (input_tokens > 0 or output_tokens > 0):
-        total_tokens = input_tokens + output_tokens
+    input_tokens, output_tokens, total_tokens = get_usage_totals(usage_callback)
     
     # Calculer le coût
     cost = calculate_cost(model, input_tokens, output_tokens)
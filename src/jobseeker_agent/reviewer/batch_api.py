@@ -0,0 +1,404 @@
+"""
+Reviews hors ligne via les API de batch des fournisseurs.
+
+Pour les gros rattrapages, la latence n'a pas d'importance : les requêtes de review
+sont écrites dans un fichier JSONL au format "batch" d'OpenAI, soumises en une fois,
+puis le résultat est récupéré quand le fournisseur a terminé, à prix réduit.
+La correction (second tour) est soumise comme un second batch une fois le premier terminé.
+
+`LocalBatchProvider` consomme le même format de fichier sans réseau, pour tester
+toute la chaîne (soumission, suivi, ingestion) hors ligne.
+
+Chaque batch soumis est suivi dans data/reviewer/batches/<batch_id>.json, ce qui permet
+de reprendre le suivi après un redémarrage avec `resume_review_batch`, qui enregistre
+les reviews obtenues dans reviews.json.
+"""
+
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from jobseeker_agent.reviewer.agents.reviewer import (
+    CORRECTION_PROMPT,
+    JobReviewResponse,
+    _model_supports_reasoning,
+    build_review_prompt,
+)
+from jobseeker_agent.utils.fake_llm import fake_batch_responder
+from jobseeker_agent.utils.llm import calculate_cost, estimate_tokens, get_json_schema
+from jobseeker_agent.utils.paths import get_review_batches_dir
+
+
+# Réduction appliquée par les fournisseurs aux requêtes en batch
+BATCH_DISCOUNT = 0.5
+# Intervalle entre deux vérifications de l'état d'un batch (secondes)
+DEFAULT_POLL_INTERVAL = 60
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class BatchProvider(ABC):
+    """Interface d'un fournisseur de batch : soumission d'un JSONL, suivi, récupération."""
+
+    name = "base"
+
+    @abstractmethod
+    def submit(self, requests_path: Path) -> str:
+        """Soumet le fichier de requêtes et retourne l'identifiant du batch."""
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """Retourne "in_progress", "completed" ou "failed"."""
+
+    @abstractmethod
+    def download(self, batch_id: str, output_path: Path) -> None:
+        """Écrit le fichier JSONL des réponses du batch."""
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """API Batch d'OpenAI (fenêtre de 24h)."""
+
+    name = "openai"
+
+    def __init__(self):
+        from openai import OpenAI
+        self.client = OpenAI()
+
+    def submit(self, requests_path: Path) -> str:
+        with open(requests_path, "rb") as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        status = self.client.batches.retrieve(batch_id).status
+        if status == "completed":
+            return "completed"
+        if status in ("failed", "expired", "cancelled"):
+            return "failed"
+        return "in_progress"
+
+    def download(self, batch_id: str, output_path: Path) -> None:
+        batch = self.client.batches.retrieve(batch_id)
+        content = self.client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        if batch.error_file_id:
+            content += self.client.files.content(batch.error_file_id).text
+        output_path.write_text(content, encoding="utf-8")
+
+
+class LocalBatchProvider(BatchProvider):
+    """
+    Fournisseur local, sans réseau : chaque requête du fichier est passée à `responder`
+    (body de la requête -> réponse structurée) et l'usage est estimé depuis les textes.
+    Par défaut, la réponse est générée par le faux modèle de utils/fake_llm.py.
+    """
+
+    name = "local"
+
+    def __init__(self, responder: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        self.responder = responder or fake_batch_responder
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        return get_review_batches_dir() / "local" / batch_id
+
+    def submit(self, requests_path: Path) -> str:
+        batch_id = f"local_{uuid.uuid4().hex[:12]}"
+        batch_dir = self._batch_dir(batch_id)
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        (batch_dir / "input.jsonl").write_text(requests_path.read_text(encoding="utf-8"), encoding="utf-8")
+        return batch_id
+
+    def _process(self, batch_id: str) -> None:
+        batch_dir = self._batch_dir(batch_id)
+        lines = []
+        with open(batch_dir / "input.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                result = {"id": f"response_{uuid.uuid4().hex[:12]}", "custom_id": request["custom_id"], "response": None, "error": None}
+                try:
+                    content = json.dumps(self.responder(request["body"]))
+                    prompt_tokens = sum(estimate_tokens(m["content"]) for m in request["body"]["messages"])
+                    completion_tokens = estimate_tokens(content)
+                    result["response"] = {
+                        "status_code": 200,
+                        "body": {
+                            "model": request["body"]["model"],
+                            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+                            "usage": {
+                                "prompt_tokens": prompt_tokens,
+                                "completion_tokens": completion_tokens,
+                                "total_tokens": prompt_tokens + completion_tokens,
+                            },
+                        },
+                    }
+                except Exception as e:
+                    result["error"] = {"message": str(e)}
+                lines.append(json.dumps(result, ensure_ascii=False))
+        (batch_dir / "output.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def status(self, batch_id: str) -> str:
+        batch_dir = self._batch_dir(batch_id)
+        if not (batch_dir / "input.jsonl").exists():
+            return "failed"
+        if not (batch_dir / "output.jsonl").exists():
+            self._process(batch_id)
+        return "completed"
+
+    def download(self, batch_id: str, output_path: Path) -> None:
+        output_path.write_text((self._batch_dir(batch_id) / "output.jsonl").read_text(encoding="utf-8"), encoding="utf-8")
+
+
+def get_batch_provider(name: str = "openai") -> BatchProvider:
+    """Retourne un fournisseur de batch par son nom ("openai" ou "local")."""
+    if name == "openai":
+        return OpenAIBatchProvider()
+    if name == "local":
+        return LocalBatchProvider()
+    raise ValueError(f"Unknown batch provider: {name}")
+
+
+def build_batch_request(
+    custom_id: str,
+    messages: List[Dict[str, str]],
+    model: str,
+    reasoning_level: Optional[str] = None
+) -> Dict[str, Any]:
+    """Une ligne du fichier de batch : requête chat avec sortie structurée JobReviewResponse."""
+    body = {
+        "model": model,
+        "messages": messages,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "JobReviewResponse", "schema": get_json_schema(JobReviewResponse)},
+        },
+    }
+    if reasoning_level and _model_supports_reasoning(model):
+        body["reasoning_effort"] = reasoning_level
+    else:
+        body["temperature"] = 0
+    return {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def write_batch_file(requests: List[Dict[str, Any]], path: Path) -> None:
+    """Écrit les requêtes au format JSONL."""
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests:
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+
+def read_batch_output(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Lit le fichier de réponses d'un batch.
+
+    Returns:
+        custom_id -> {"response": dict structuré ou None, "usage": dict, "error": str ou None}
+    """
+    results = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            result = {"response": None, "usage": {}, "error": None}
+            response = entry.get("response") or {}
+            body = response.get("body") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                error = entry.get("error") or body.get("error") or {}
+                result["error"] = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            else:
+                result["usage"] = body.get("usage") or {}
+                try:
+                    result["response"] = json.loads(body["choices"][0]["message"]["content"])
+                except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                    result["error"] = f"Invalid response: {e}"
+            results[entry["custom_id"]] = result
+    return results
+
+
+def _save_batch_record(record: Dict[str, Any]) -> None:
+    path = get_review_batches_dir() / f"{record['id']}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=4, ensure_ascii=False)
+
+
+def load_batch_record(record_id: str) -> Dict[str, Any]:
+    """Charge le suivi d'un batch soumis."""
+    with open(get_review_batches_dir() / f"{record_id}.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _submit_phase(record: Dict[str, Any], requests: List[Dict[str, Any]], provider: BatchProvider) -> None:
+    phase = len(record["phases"]) + 1
+    requests_path = get_review_batches_dir() / f"{record['id']}_phase{phase}_input.jsonl"
+    write_batch_file(requests, requests_path)
+    batch_id = provider.submit(requests_path)
+    record["phases"].append({"batch_id": batch_id, "requests": str(requests_path), "submitted_at": time.time()})
+    record["status"] = "in_progress"
+    _save_batch_record(record)
+    print(f"📤 Submitted batch {batch_id} ({len(requests)} requests, phase {phase}) to {provider.name}")
+
+
+def submit_review_batch(
+    jobs: List[Dict[str, Any]],
+    jobs_details: List[Dict[str, Any]],
+    model: str,
+    with_correction: bool = True,
+    reasoning_level: Optional[str] = None,
+    provider: Optional[BatchProvider] = None
+) -> Dict[str, Any]:
+    """
+    Écrit et soumet le batch de reviews (premier tour).
+
+    Returns:
+        Le suivi du batch (aussi enregistré sur disque), à passer à `wait_for_review_batch`
+    """
+    provider = provider or get_batch_provider()
+    record = {
+        "id": datetime.now().strftime("%Y%m%d_%H%M%S_") + uuid.uuid4().hex[:6],
+        "provider": provider.name,
+        "model": model,
+        "with_correction": with_correction,
+        "reasoning_level": reasoning_level,
+        "job_ids": [job["id"] for job in jobs],
+        "phases": [],
+        "status": "created",
+        "created_at": time.time(),
+    }
+    # Conversations par job, complétées au fil des tours
+    record["conversations"] = {
+        str(job["id"]): [{"role": "user", "content": build_review_prompt(job, job_details)}]
+        for job, job_details in zip(jobs, jobs_details)
+    }
+    requests = [
+        build_batch_request(job_id, messages, model, reasoning_level)
+        for job_id, messages in record["conversations"].items()
+    ]
+    _submit_phase(record, requests, provider)
+    return record
+
+
+def wait_for_review_batch(
+    record: Dict[str, Any],
+    provider: Optional[BatchProvider] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Suit le batch jusqu'à la fin (en soumettant le tour de correction si besoin)
+    et construit les reviews.
+
+    Returns:
+        job_id -> review (même structure que `review()`), pour les jobs réussis uniquement
+    """
+    provider = provider or get_batch_provider(record["provider"])
+    usage = record.setdefault("usage", {})
+    errors = record.setdefault("errors", {})
+
+    while record["status"] != "completed":
+        phase = record["phases"][-1]
+        status = provider.status(phase["batch_id"])
+        if status == "in_progress":
+            time.sleep(poll_interval)
+            continue
+        if status == "failed":
+            record["status"] = "failed"
+            _save_batch_record(record)
+            print(f"❌ Batch {phase['batch_id']} failed.")
+            return {}
+
+        output_path = Path(phase["requests"]).with_name(Path(phase["requests"]).name.replace("_input", "_output"))
+        provider.download(phase["batch_id"], output_path)
+        phase["completed_at"] = time.time()
+        results = read_batch_output(output_path)
+
+        for job_id, messages in list(record["conversations"].items()):
+            result = results.get(job_id)
+            if result is None or result["error"]:
+                errors[job_id] = result["error"] if result else "Missing from batch output"
+                del record["conversations"][job_id]
+                continue
+            job_usage = usage.setdefault(job_id, {"input_tokens": 0, "output_tokens": 0})
+            job_usage["input_tokens"] += result["usage"].get("prompt_tokens", 0)
+            job_usage["output_tokens"] += result["usage"].get("completion_tokens", 0)
+            messages.append({"role": "assistant", "content": json.dumps(result["response"])})
+
+        if record["with_correction"] and len(record["phases"]) == 1 and record["conversations"]:
+            requests = []
+            for job_id, messages in record["conversations"].items():
+                messages.append({"role": "user", "content": CORRECTION_PROMPT})
+                requests.append(build_batch_request(job_id, messages, record["model"], record["reasoning_level"]))
+            _submit_phase(record, requests, provider)
+            continue
+        record["status"] = "completed"
+        _save_batch_record(record)
+
+    elapsed = record["phases"][-1]["completed_at"] - record["created_at"]
+    if errors:
+        print(f"⚠️  {len(errors)} requests failed in batch {record['id']}")
+
+    reviews = {}
+    for job_id, messages in record["conversations"].items():
+        response = json.loads(messages[-1]["content"])
+        job_usage = usage[job_id]
+        input_tokens, output_tokens = job_usage["input_tokens"], job_usage["output_tokens"]
+        reviews[int(job_id)] = {
+            **response,
+            "id": int(job_id),
+            "metadata": {
+                "model": record["model"],
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "total_cost": calculate_cost(record["model"], input_tokens, output_tokens) * BATCH_DISCOUNT,
+                "execution_time": elapsed,
+                "with_correction": record["with_correction"],
+                "batch_api": {"provider": record["provider"], "record_id": record["id"], "discount": BATCH_DISCOUNT},
+            },
+        }
+    return reviews
+
+
+def resume_review_batch(record_id: str, poll_interval: float = DEFAULT_POLL_INTERVAL) -> List[Dict[str, Any]]:
+    """
+    Reprend le suivi d'un batch soumis lors d'une exécution précédente et enregistre
+    ses reviews comme `JobReviewer.review_offline`.
+
+    Returns:
+        La liste des reviews enregistrées
+    """
+    # Import local : review_batch utilise ce module
+    from jobseeker_agent.reviewer.review_batch import JobReviewer
+
+    record = load_batch_record(record_id)
+    results = wait_for_review_batch(record, poll_interval=poll_interval)
+    reviewer = JobReviewer(prefilter_mode="off")
+    raw_jobs_map = {job["id"]: job for job in reviewer.raw_jobs}
+    jobs = [raw_jobs_map[job_id] for job_id in record["job_ids"] if job_id in raw_jobs_map]
+    saved = reviewer.save_offline_reviews(jobs, results)
+    print(f"Batch {record_id} resumed: {len(saved)} reviews saved.")
+    return saved
+
+
+def run_offline_reviews(
+    jobs: List[Dict[str, Any]],
+    jobs_details: List[Dict[str, Any]],
+    model: str,
+    with_correction: bool = True,
+    reasoning_level: Optional[str] = None,
+    provider: Optional[BatchProvider] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> Dict[int, Dict[str, Any]]:
+    """Soumet, suit et ingère un batch de reviews. Retourne job_id -> review."""
+    if not jobs:
+        return {}
+    provider = provider or get_batch_provider()
+    record = submit_review_batch(jobs, jobs_details, model, with_correction, reasoning_level, provider)
+    return wait_for_review_batch(record, provider, poll_interval)
@@ -4,14 +4,17 @@ Compare les détections des modèles avec la ground truth.
 """
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
-from sklearn.metrics import precision_score, recall_score, f1_score
 import numpy as np
 
-from jobseeker_agent.reviewer.evaluation.batch_review import load_batch_results
+from jobseeker_agent.reviewer.evaluation.detections import (
+    DetectionIndex,
+    build_detection_index,
+    load_detection_index,
+)
 from jobseeker_agent.utils.paths import get_data_path
 
 
@@ -40,82 +43,189 @@ def load_ground_truth(generation_id: int) -> Dict[int, Set[int]]:
     return ground_truth
 
 
+@dataclass
+class DetectionTensors:
+    """
+    Détections des modèles et ground truth sous forme de tenseurs denses.
+    
+    - predicted[c, j, k]: la config c a détecté le critère k sur le job j
+    - truth[j, k]: le critère k est validé dans la ground truth du job j
+    - reviewed[c, j]: la config c a une review (sans erreur) pour le job j
+    - costs[c, j], times[c, j]: coût et temps d'exécution de ces reviews
+    """
+    config_names: List[str]
+    job_ids: List[int]
+    criteria_ids: List[int]
+    predicted: np.ndarray
+    truth: np.ndarray
+    reviewed: np.ndarray
+    costs: np.ndarray
+    times: np.ndarray
+
+
+def tensors_from_index(
+    index: DetectionIndex,
+    ground_truth: Dict[int, Set[int]],
+    all_criteria_ids: Optional[Set[int]] = None
+) -> DetectionTensors:
+    """
+    Construit les tenseurs configs × jobs × critères à partir de l'index des détections.
+    
+    Les jobs de la ground truth absents de l'index, ainsi que les critères validés ou
+    listés dans `all_criteria_ids` mais jamais détectés, sont ajoutés.
+    """
+    job_ids = sorted(set(index.job_ids) | set(ground_truth))
+    observed = {cid for criteria in ground_truth.values() for cid in criteria}
+    criteria_ids = sorted(set(all_criteria_ids or ()) | observed | set(index.criteria_ids))
+    
+    # Position des jobs et critères de l'index dans les axes élargis (listes triées)
+    job_positions = np.searchsorted(job_ids, index.job_ids)
+    criterion_positions = np.searchsorted(criteria_ids, index.criteria_ids)
+    shape = (len(index.config_names), len(job_ids))
+    
+    reviewed = np.zeros(shape, dtype=bool)
+    costs = np.zeros(shape)
+    times = np.zeros(shape)
+    reviewed[:, job_positions] = index.reviewed.T
+    costs[:, job_positions] = index.costs.T
+    times[:, job_positions] = index.times.T
+    
+    predicted = np.zeros(shape + (len(criteria_ids),), dtype=bool)
+    predicted[:, job_positions[:, None], criterion_positions[None, :]] = index.detected.transpose(2, 0, 1)
+    
+    job_index = {job_id: i for i, job_id in enumerate(job_ids)}
+    criterion_index = {cid: i for i, cid in enumerate(criteria_ids)}
+    truth = np.zeros((len(job_ids), len(criteria_ids)), dtype=bool)
+    gt_j = [job_index[job_id] for job_id, criteria in ground_truth.items() for _ in criteria]
+    gt_k = [criterion_index[cid] for criteria in ground_truth.values() for cid in criteria]
+    truth[gt_j, gt_k] = True
+    
+    return DetectionTensors(list(index.config_names), job_ids, criteria_ids, predicted, truth, reviewed, costs, times)
+
+
+def build_detection_tensors(
+    reviews: List[Dict],
+    ground_truth: Dict[int, Set[int]],
+    all_criteria_ids: Optional[Set[int]] = None
+) -> DetectionTensors:
+    """
+    Construit les tenseurs configs × jobs × critères à partir des reviews de batch.
+    
+    Les reviews en erreur sont ignorées. Si une config a plusieurs reviews pour un
+    même job, la dernière l'emporte.
+    """
+    return tensors_from_index(build_detection_index(reviews), ground_truth, all_criteria_ids)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Division élément par élément, 0 quand le dénominateur est nul (zero_division=0)."""
+    return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator)), where=denominator > 0)
+
+
+def _f1(precision: np.ndarray, recall: np.ndarray) -> np.ndarray:
+    return _safe_divide(2 * precision * recall, precision + recall)
+
+
+def compute_metrics_from_tensors(
+    tensors: DetectionTensors,
+    criteria_ids: Optional[Set[int]] = None
+) -> Dict[str, Dict]:
+    """
+    Calcule précision, rappel et F1 (micro, macro et par critère) pour chaque config,
+    ainsi que les agrégats de coût et de temps, en quelques opérations vectorisées.
+    
+    Args:
+        tensors: Tenseurs construits par build_detection_tensors
+        criteria_ids: Critères à prendre en compte (tous par défaut)
+    """
+    columns = np.arange(len(tensors.criteria_ids))
+    if criteria_ids is not None:
+        columns = np.flatnonzero(np.isin(tensors.criteria_ids, list(criteria_ids)))
+    kept_ids = [tensors.criteria_ids[k] for k in columns]
+    
+    mask = tensors.reviewed[:, :, None]
+    predicted = tensors.predicted[:, :, columns] & mask
+    truth = tensors.truth[None, :, columns] & mask
+    
+    # Comptes par config et par critère: (C, K)
+    tp = (predicted & truth).sum(axis=1)
+    fp = (predicted & ~truth).sum(axis=1)
+    fn = (~predicted & truth).sum(axis=1)
+    
+    per_precision = _safe_divide(tp, tp + fp)
+    per_recall = _safe_divide(tp, tp + fn)
+    per_f1 = _f1(per_precision, per_recall)
+    
+    # Micro: on somme les comptes sur les critères
+    tp_c, fp_c, fn_c = tp.sum(axis=1), fp.sum(axis=1), fn.sum(axis=1)
+    precision = _safe_divide(tp_c, tp_c + fp_c)
+    recall = _safe_divide(tp_c, tp_c + fn_c)
+    f1 = _f1(precision, recall)
+    
+    n_reviews = tensors.reviewed.sum(axis=1)
+    total_cost = (tensors.costs * tensors.reviewed).sum(axis=1)
+    total_time = (tensors.times * tensors.reviewed).sum(axis=1)
+    avg_cost = _safe_divide(total_cost, n_reviews)
+    avg_time = _safe_divide(total_time, n_reviews)
+    support = tensors.truth[:, columns][None, :, :] & mask
+    support = support.sum(axis=1)
+    
+    metrics_by_model = {}
+    for c, config_name in enumerate(tensors.config_names):
+        metrics_by_model[config_name] = {
+            'precision': float(precision[c]),
+            'recall': float(recall[c]),
+            'f1': float(f1[c]),
+            'macro_precision': float(per_precision[c].mean()) if len(columns) else 0.0,
+            'macro_recall': float(per_recall[c].mean()) if len(columns) else 0.0,
+            'macro_f1': float(per_f1[c].mean()) if len(columns) else 0.0,
+            'per_criterion': {
+                cid: {
+                    'precision': float(per_precision[c, k]),
+                    'recall': float(per_recall[c, k]),
+                    'f1': float(per_f1[c, k]),
+                    'support': int(support[c, k])
+                }
+                for k, cid in enumerate(kept_ids)
+            },
+            'avg_cost': float(avg_cost[c]),
+            'avg_time': float(avg_time[c]),
+            'total_cost': float(total_cost[c]),
+            'total_time': float(total_time[c]),
+            'total_jobs': int(n_reviews[c])
+        }
+    
+    return metrics_by_model
+
+
 def compute_metrics_per_model(
     reviews: List[Dict],
     ground_truth: Dict[int, Set[int]],
-    all_criteria_ids: Set[int]
+    all_criteria_ids: Set[int],
+    tensors: Optional[DetectionTensors] = None
 ) -> Dict[str, Dict]:
     """
     Calcule les métriques pour chaque modèle.
     
     Returns:
         Dict[config_name] = {
-            'precision': float,
-            'recall': float,
-            'f1': float,
+            'precision': float,       # micro
+            'recall': float,          # micro
+            'f1': float,              # micro
+            'macro_precision': float,
+            'macro_recall': float,
+            'macro_f1': float,
+            'per_criterion': Dict[criterion_id, {precision, recall, f1, support}],
             'avg_cost': float,
             'avg_time': float,
+            'total_cost': float,
+            'total_time': float,
             'total_jobs': int
         }
     """
-    # Grouper les reviews par config
-    reviews_by_config = defaultdict(list)
-    for review in reviews:
-        config_name = review['config_name']
-        reviews_by_config[config_name].append(review)
-    
-    metrics_by_model = {}
-    
-    for config_name, config_reviews in reviews_by_config.items():
-        # Préparer les données pour sklearn
-        y_true_all = []
-        y_pred_all = []
-        costs = []
-        times = []
-        
-        for review in config_reviews:
-            job_id = review['job_id']
-            
-            # Ground truth pour ce job
-            gt_criteria = ground_truth.get(job_id, set())
-            
-            # Prédictions du modèle
-            detected_criteria = set()
-            review_result = review.get('review_result', {})
-            if review_result and 'evaluation_grid' in review_result:
-                for criterion in review_result['evaluation_grid']:
-                    detected_criteria.add(criterion['id'])
-            
-            # Convertir en vecteurs binaires (un élément par critère)
-            for criterion_id in all_criteria_ids:
-                y_true_all.append(1 if criterion_id in gt_criteria else 0)
-                y_pred_all.append(1 if criterion_id in detected_criteria else 0)
-            
-            # Métriques de coût et temps
-            metadata = review.get('metadata', {})
-            costs.append(metadata.get('total_cost', 0))
-            times.append(metadata.get('execution_time', 0))
-        
-        # Calculer les métriques agrégées
-        y_true_arr = np.array(y_true_all)
-        y_pred_arr = np.array(y_pred_all)
-        
-        # Si aucun positif dans y_true, les métriques ne sont pas définies
-        # On utilise zero_division=0 pour gérer ce cas
-        precision = precision_score(y_true_arr, y_pred_arr, zero_division=0)
-        recall = recall_score(y_true_arr, y_pred_arr, zero_division=0)
-        f1 = f1_score(y_true_arr, y_pred_arr, zero_division=0)
-        
-        metrics_by_model[config_name] = {
-            'precision': precision,
-            'recall': recall,
-            'f1': f1,
-            'avg_cost': np.mean(costs) if costs else 0,
-            'avg_time': np.mean(times) if times else 0,
-            'total_jobs': len(config_reviews)
-        }
-    
-    return metrics_by_model
+    if tensors is None:
+        tensors = build_detection_tensors(reviews, ground_truth, all_criteria_ids)
+    return compute_metrics_from_tensors(tensors, all_criteria_ids)
 
 
 def print_metrics_table(metrics: Dict[str, Dict]):
@@ -127,7 +237,7 @@ def print_metrics_table(metrics: Dict[str, Dict]):
     print()
     
     # Header
-    header = f"{'Model':<20} {'F1-Score':>10} {'Précision':>10} {'Rappel':>10} {'Coût ($)':>12} {'Temps (s)':>12} {'Jobs':>8}"
+    header = f"{'Model':<20} {'F1-Score':>10} {'Macro-F1':>10} {'Précision':>10} {'Rappel':>10} {'Coût ($)':>12} {'Temps (s)':>12} {'Jobs':>8}"
     print(header)
     print("-" * 100)
     
@@ -138,6 +248,7 @@ def print_metrics_table(metrics: Dict[str, Dict]):
         row = (
             f"{config_name:<20} "
             f"{m['f1']:>10.4f} "
+            f"{m['macro_f1']:>10.4f} "
             f"{m['precision']:>10.4f} "
             f"{m['recall']:>10.4f} "
             f"${m['avg_cost']:>11.5f} "
@@ -152,7 +263,8 @@ def print_metrics_table(metrics: Dict[str, Dict]):
 
 def compute_detailed_errors(
     reviews: List[Dict],
-    ground_truth: Dict[int, Set[int]]
+    ground_truth: Dict[int, Set[int]],
+    tensors: Optional[DetectionTensors] = None
 ) -> Dict[str, Dict]:
     """
     Calcule les erreurs détaillées par modèle.
@@ -165,41 +277,31 @@ def compute_detailed_errors(
             'true_negatives': int
         }
     """
-    errors_by_model = defaultdict(lambda: {
-        'false_positives': [],
-        'false_negatives': [],
-        'true_positives': 0,
-        'true_negatives': 0
-    })
-    
-    for review in reviews:
-        config_name = review['config_name']
-        job_id = review['job_id']
-        
-        # Ground truth
-        gt_criteria = ground_truth.get(job_id, set())
-        
-        # Prédictions
-        detected_criteria = set()
-        review_result = review.get('review_result', {})
-        if review_result and 'evaluation_grid' in review_result:
-            for criterion in review_result['evaluation_grid']:
-                detected_criteria.add(criterion['id'])
-        
-        # Analyser les erreurs
-        false_positives = detected_criteria - gt_criteria
-        false_negatives = gt_criteria - detected_criteria
-        true_positives = len(detected_criteria & gt_criteria)
-        
-        for fp in false_positives:
-            errors_by_model[config_name]['false_positives'].append((job_id, fp))
-        
-        for fn in false_negatives:
-            errors_by_model[config_name]['false_negatives'].append((job_id, fn))
-        
-        errors_by_model[config_name]['true_positives'] += true_positives
+    if tensors is None:
+        tensors = build_detection_tensors(reviews, ground_truth)
+    return compute_errors_from_tensors(tensors)
+
+
+def compute_errors_from_tensors(tensors: DetectionTensors) -> Dict[str, Dict]:
+    """Calcule les erreurs détaillées par modèle à partir des tenseurs."""
+    mask = tensors.reviewed[:, :, None]
+    predicted = tensors.predicted & mask
+    truth = tensors.truth[None, :, :] & mask
+    job_ids = np.asarray(tensors.job_ids)
+    criteria_ids = np.asarray(tensors.criteria_ids)
+    
+    errors_by_model = {}
+    for c, config_name in enumerate(tensors.config_names):
+        fp_j, fp_k = np.nonzero(predicted[c] & ~truth[c])
+        fn_j, fn_k = np.nonzero(~predicted[c] & truth[c])
+        errors_by_model[config_name] = {
+            'false_positives': list(zip(job_ids[fp_j].tolist(), criteria_ids[fp_k].tolist())),
+            'false_negatives': list(zip(job_ids[fn_j].tolist(), criteria_ids[fn_k].tolist())),
+            'true_positives': int((predicted[c] & truth[c]).sum()),
+            'true_negatives': int((~predicted[c] & ~truth[c] & mask[c]).sum())
+        }
     
-    return dict(errors_by_model)
+    return errors_by_model
 
 
 def print_error_summary(errors: Dict[str, Dict]):
@@ -260,19 +362,22 @@ def analyze_generation(generation_id: int):
     
     # Charger les données
     print("📥 Chargement des données...")
-    reviews = load_batch_results(generation_id)
+    index = load_detection_index(generation_id)
     ground_truth = load_ground_truth(generation_id)
     
     # Tous les critères possibles (1-24)
     all_criteria_ids = set(range(1, 25))
     
-    print(f"   ✅ {len(reviews)} reviews chargées")
+    print(f"   ✅ {int(index.reviewed.sum())} reviews chargées")
     print(f"   ✅ {len(ground_truth)} jobs avec ground truth")
     print()
     
+    # Construire les tenseurs une seule fois pour toutes les analyses
+    tensors = tensors_from_index(index, ground_truth, all_criteria_ids)
+    
     # Calculer les métriques
     print("📊 Calcul des métriques...")
-    metrics = compute_metrics_per_model(reviews, ground_truth, all_criteria_ids)
+    metrics = compute_metrics_from_tensors(tensors, all_criteria_ids)
     print()
     
     # Afficher le tableau
@@ -280,7 +385,7 @@ def analyze_generation(generation_id: int):
     
     # Calculer et afficher les erreurs
     print("🔍 Analyse des erreurs...")
-    errors = compute_detailed_errors(reviews, ground_truth)
+    errors = compute_errors_from_tensors(tensors)
     print_error_summary(errors)
     
     # Sauvegarder les résultats
@@ -3,76 +3,399 @@ Script pour exécuter des reviews en batch sur plusieurs jobs avec différentes
 """
 
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 
 from jobseeker_agent.scraper.job_manager import load_raw_jobs
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
 from jobseeker_agent.reviewer.agents.reviewer import review
+from jobseeker_agent.reviewer.batch_api import DEFAULT_POLL_INTERVAL, BatchProvider, run_offline_reviews
 from jobseeker_agent.utils.paths import get_data_path
 
 
+# Verrou pour les écritures concurrentes dans le fichier de résultats
+_RESULTS_LOCK = threading.Lock()
+
+
 def get_batch_results_path(generation_id: int) -> Path:
-    """Retourne le chemin vers le fichier JSON des résultats de batch."""
+    """Retourne le chemin vers le fichier JSONL des résultats de batch."""
     batch_dir = get_data_path() / "reviewer" / "tests" / str(generation_id)
     batch_dir.mkdir(parents=True, exist_ok=True)
-    return batch_dir / "batch_results.json"
+    return batch_dir / "batch_results.jsonl"
+
+
+def get_legacy_batch_results_path(generation_id: int) -> Path:
+    """Retourne le chemin vers l'ancien fichier JSON des résultats de batch."""
+    return get_batch_results_path(generation_id).with_suffix(".json")
+
+
+def get_batch_index_path(generation_id: int) -> Path:
+    """Retourne le chemin vers l'index (job_id, config_name) -> offsets du fichier JSONL."""
+    return get_batch_results_path(generation_id).with_suffix(".index.json")
+
+
+def _read_legacy_batch_results(legacy_path: Path) -> List[Dict[str, Any]]:
+    """Lit l'ancien format JSON (liste plate, ou dict avec "jobs")."""
+    with open(legacy_path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError:
+            return []
+    # Si c'est l'ancien format (dict avec "jobs"), convertir
+    if isinstance(data, dict) and "jobs" in data:
+        reviews = []
+        for job_data in data.get("jobs", []):
+            job_id = job_data.get("job_id")
+            for config_name, config_result in job_data.get("configs", {}).items():
+                reviews.append({
+                    "job_id": job_id,
+                    "config_name": config_name,
+                    **config_result
+                })
+        return reviews
+    # Sinon, c'est déjà une liste
+    return data if isinstance(data, list) else []
+
+
+def _migrate_legacy_batch_results(generation_id: int) -> None:
+    """Convertit l'ancien fichier JSON en JSONL s'il n'a pas encore été migré."""
+    batch_path = get_batch_results_path(generation_id)
+    legacy_path = get_legacy_batch_results_path(generation_id)
+    if batch_path.exists() or not legacy_path.exists():
+        return
+    print(f"🔄 Migrating {legacy_path.name} to {batch_path.name}...")
+    _write_batch_results(_read_legacy_batch_results(legacy_path), generation_id)
+
+
+def _write_batch_results(reviews: List[Dict[str, Any]], generation_id: int) -> None:
+    """Réécrit entièrement le fichier JSONL (écriture atomique) et son index."""
+    batch_path = get_batch_results_path(generation_id)
+    tmp_path = batch_path.with_suffix(".jsonl.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for review_entry in reviews:
+            f.write(json.dumps(review_entry, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, batch_path)
+    get_batch_index_path(generation_id).unlink(missing_ok=True)
+
+
+def _scan_offsets(batch_path: Path, start: int, index: Dict[Tuple[int, str], List[int]]) -> int:
+    """Indexe les lignes du fichier à partir de l'offset `start`. Retourne l'offset de fin."""
+    with open(batch_path, "rb") as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Ligne en cours d'écriture : on la réindexera plus tard
+                break
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                    key = (entry.get("job_id"), entry.get("config_name"))
+                    index.setdefault(key, []).append(offset)
+                except json.JSONDecodeError:
+                    print(f"⚠️ Ignoring corrupted line at offset {offset} in {batch_path.name}")
+            offset += len(line)
+    return offset
 
 
-def load_batch_results(generation_id: int) -> List[Dict[str, Any]]:
-    """Charge les résultats de batch depuis le fichier JSON.
+def load_batch_index(generation_id: int) -> Dict[Tuple[int, str], List[int]]:
+    """
+    Charge l'index (job_id, config_name) -> offsets des lignes du fichier JSONL.
     
-    Returns:
-        Liste plate de reviews, chaque élément contient job_id, config_name, etc.
+    L'index est persisté à côté du fichier avec la taille indexée : seules les
+    lignes ajoutées depuis sont relues.
     """
+    _migrate_legacy_batch_results(generation_id)
     batch_path = get_batch_results_path(generation_id)
     if not batch_path.exists():
-        return []
+        return {}
     
-    with open(batch_path, "r", encoding="utf-8") as f:
+    index_path = get_batch_index_path(generation_id)
+    index: Dict[Tuple[int, str], List[int]] = {}
+    indexed_size = 0
+    if index_path.exists():
         try:
-            data = json.load(f)
-            # Si c'est l'ancien format (dict avec "jobs"), convertir
-            if isinstance(data, dict) and "jobs" in data:
-                # Convertir l'ancien format vers le nouveau
-                reviews = []
-                for job_data in data.get("jobs", []):
-                    job_id = job_data.get("job_id")
-                    for config_name, config_result in job_data.get("configs", {}).items():
-                        review_entry = {
-                            "job_id": job_id,
-                            "config_name": config_name,
-                            **config_result
-                        }
-                        reviews.append(review_entry)
-                return reviews
-            # Sinon, c'est déjà une liste
-            return data if isinstance(data, list) else []
-        except json.JSONDecodeError:
-            return []
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            indexed_size = data["size"]
+            for entry in data["entries"]:
+                index[(entry["job_id"], entry["config_name"])] = entry["offsets"]
+        except (json.JSONDecodeError, KeyError):
+            index, indexed_size = {}, 0
+    
+    file_size = batch_path.stat().st_size
+    if indexed_size > file_size:
+        # Le fichier a été réécrit sans mettre l'index à jour : on repart de zéro
+        index, indexed_size = {}, 0
+    if indexed_size < file_size:
+        indexed_size = _scan_offsets(batch_path, indexed_size, index)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "size": indexed_size,
+                "entries": [
+                    {"job_id": job_id, "config_name": config_name, "offsets": offsets}
+                    for (job_id, config_name), offsets in index.items()
+                ]
+            }, f)
+    return index
+
+
+def iter_batch_results(
+    generation_id: int,
+    config_names: Optional[Iterable[str]] = None,
+    job_ids: Optional[Iterable[int]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parcourt les résultats de batch en streaming, dans l'ordre d'écriture.
+    
+    Args:
+        generation_id: ID de génération
+        config_names: Si fourni, ne retourne que ces configurations
+        job_ids: Si fourni, ne retourne que ces jobs
+    
+    Si un filtre est fourni, seules les lignes correspondantes sont lues grâce à l'index.
+    """
+    _migrate_legacy_batch_results(generation_id)
+    batch_path = get_batch_results_path(generation_id)
+    if not batch_path.exists():
+        return
+    
+    if config_names is None and job_ids is None:
+        with open(batch_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        return
+    
+    config_filter = set(config_names) if config_names is not None else None
+    job_filter = set(job_ids) if job_ids is not None else None
+    offsets = sorted(
+        offset
+        for (job_id, config_name), key_offsets in load_batch_index(generation_id).items()
+        if (job_filter is None or job_id in job_filter)
+        and (config_filter is None or config_name in config_filter)
+        for offset in key_offsets
+    )
+    with open(batch_path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            yield json.loads(f.readline())
+
+
+def load_batch_results(
+    generation_id: int,
+    config_names: Optional[Iterable[str]] = None,
+    job_ids: Optional[Iterable[int]] = None
+) -> List[Dict[str, Any]]:
+    """Charge les résultats de batch depuis le fichier JSONL.
+    
+    Returns:
+        Liste plate de reviews, chaque élément contient job_id, config_name, etc.
+    """
+    return list(iter_batch_results(generation_id, config_names=config_names, job_ids=job_ids))
+
+
+def append_batch_result(review_entry: Dict[str, Any], generation_id: int) -> None:
+    """Ajoute une review à la fin du fichier JSONL (coût constant, quelle que soit la taille du batch)."""
+    with _RESULTS_LOCK:
+        _migrate_legacy_batch_results(generation_id)
+        batch_path = get_batch_results_path(generation_id)
+        with open(batch_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(review_entry, ensure_ascii=False) + "\n")
 
 
 def save_batch_results(reviews: List[Dict[str, Any]], generation_id: int) -> None:
-    """Sauvegarde les résultats de batch dans le fichier JSON.
+    """Réécrit entièrement les résultats de batch.
     
     Args:
         reviews: Liste plate de reviews à sauvegarder
         generation_id: ID de génération pour déterminer le chemin
     """
-    batch_path = get_batch_results_path(generation_id)
-    with open(batch_path, "w", encoding="utf-8") as f:
-        json.dump(reviews, f, indent=4, ensure_ascii=False)
+    with _RESULTS_LOCK:
+        _write_batch_results(reviews, generation_id)
+
+
+def compact_batch_results(generation_id: int) -> Tuple[int, int]:
+    """
+    Compacte le fichier JSONL : ne garde que la dernière review réussie de chaque
+    couple (job_id, config_name), et retire les erreurs.
+    
+    Returns:
+        (nombre d'entrées conservées, nombre d'entrées retirées)
+    """
+    with _RESULTS_LOCK:
+        latest = {}
+        total = 0
+        for review_entry in iter_batch_results(generation_id):
+            total += 1
+            if review_entry.get("error"):
+                continue
+            latest[(review_entry.get("job_id"), review_entry.get("config_name"))] = review_entry
+        kept = list(latest.values())
+        _write_batch_results(kept, generation_id)
+    print(f"🧹 Compacted generation {generation_id}: kept {len(kept)}, removed {total - len(kept)}")
+    return len(kept), total - len(kept)
+
+
+def _run_single_review(
+    job: Dict[str, Any],
+    job_details: Dict[str, Any],
+    config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Exécute une review pour un couple job/config et retourne l'entrée de batch (succès ou erreur)."""
+    job_id = job["id"]
+    config_name = config["name"]
+    review_entry = {
+        "job_id": job_id,
+        "config_name": config_name,
+        "model": config["model"],
+        "with_correction": config.get("with_correction", True),
+        "reasoning_level": config.get("reasoning_level"),
+    }
+    try:
+        review_result = review(
+            job=job,
+            job_details=job_details,
+            model=config["model"],
+            with_correction=config.get("with_correction", True),
+            reasoning_level=config.get("reasoning_level")
+        )
+        # Extraire les métadonnées et le résultat de review
+        metadata = review_result.pop("metadata", {})
+        review_entry["review_result"] = review_result  # evaluation_grid, score, id
+        review_entry["metadata"] = metadata  # input_tokens, output_tokens, total_tokens, total_cost, execution_time, etc.
+    except Exception as e:
+        print(f"   ❌ Error processing job {job_id} with config '{config_name}': {e}")
+        review_entry["error"] = str(e)
+        review_entry["review_result"] = None
+        review_entry["metadata"] = None
+    return review_entry
+
+
+class BatchProgress:
+    """Suivi thread-safe de l'avancement d'un batch (progression, coût, ETA)."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.total_cost = 0.0
+        self.start_time = time.time()
+        self._lock = threading.Lock()
+
+    def skip(self, count: int) -> None:
+        """Retire du total des reviews qui ne seront pas exécutées."""
+        with self._lock:
+            self.total -= count
+
+    def update(self, review_entry: Dict[str, Any]) -> None:
+        """Enregistre une review terminée et affiche l'avancement."""
+        with self._lock:
+            self.completed += 1
+            metadata = review_entry.get("metadata") or {}
+            if review_entry.get("error"):
+                self.failed += 1
+            else:
+                self.total_cost += metadata.get("total_cost", 0)
+
+            elapsed = time.time() - self.start_time
+            remaining = self.total - self.completed
+            eta = elapsed / self.completed * remaining
+            status = "❌" if review_entry.get("error") else "✅"
+            print(f"{status} [{self.completed}/{self.total}] Job {review_entry['job_id']} "
+                  f"with '{review_entry['config_name']}' - "
+                  f"Cost: ${metadata.get('total_cost', 0):.4f}, "
+                  f"Time: {metadata.get('execution_time', 0):.2f}s | "
+                  f"Total: ${self.total_cost:.4f}, Failed: {self.failed}, ETA: {eta:.0f}s")
+
+
+def _run_offline_batch_review(
+    pending_by_job: Dict[int, List[Dict[str, Any]]],
+    fetch_details,
+    generation_id: int,
+    reviews: List[Dict[str, Any]],
+    progress: BatchProgress,
+    max_fetch_workers: int,
+    batch_provider: Optional[BatchProvider],
+    poll_interval: float
+) -> None:
+    """Mode offline de run_batch_review : un batch fournisseur par configuration."""
+    with ThreadPoolExecutor(max_workers=max_fetch_workers) as fetch_pool:
+        fetched = list(fetch_pool.map(fetch_details, pending_by_job))
+    details_by_job = {}
+    for job, job_details in fetched:
+        if job_details is None:
+            print(f"⚠️ Could not extract details for job {job['id']}. Skipping.")
+            progress.skip(len(pending_by_job[job["id"]]))
+            continue
+        details_by_job[job["id"]] = (job, job_details)
+    
+    configs_by_name = {}
+    jobs_by_config = {}
+    for job_id, (job, _) in details_by_job.items():
+        for config in pending_by_job[job_id]:
+            configs_by_name[config["name"]] = config
+            jobs_by_config.setdefault(config["name"], []).append(job_id)
+    
+    for config_name, job_ids in jobs_by_config.items():
+        config = configs_by_name[config_name]
+        print(f"📦 Submitting {len(job_ids)} reviews with '{config_name}' as an offline batch...")
+        results = run_offline_reviews(
+            [details_by_job[job_id][0] for job_id in job_ids],
+            [details_by_job[job_id][1] for job_id in job_ids],
+            model=config["model"],
+            with_correction=config.get("with_correction", True),
+            reasoning_level=config.get("reasoning_level"),
+            provider=batch_provider,
+            poll_interval=poll_interval,
+        )
+        for job_id in job_ids:
+            review_entry = {
+                "job_id": job_id,
+                "config_name": config_name,
+                "model": config["model"],
+                "with_correction": config.get("with_correction", True),
+                "reasoning_level": config.get("reasoning_level"),
+            }
+            review_result = results.get(job_id)
+            if review_result is None:
+                review_entry["error"] = "Request failed in offline batch"
+                review_entry["review_result"] = None
+                review_entry["metadata"] = None
+            else:
+                review_entry["metadata"] = review_result.pop("metadata", {})
+                review_entry["review_result"] = review_result
+            reviews.append(review_entry)
+            append_batch_result(review_entry, generation_id)
+            progress.update(review_entry)
 
 
 def run_batch_review(
     job_ids: List[int],
     configs: List[Dict[str, Any]],
     generation_id: int,
-    skip_existing: bool = True
+    skip_existing: bool = True,
+    max_fetch_workers: int = 8,
+    max_concurrency_per_model: Union[int, Dict[str, int]] = 4,
+    offline: bool = False,
+    batch_provider: Optional[BatchProvider] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL
 ) -> List[Dict[str, Any]]:
     """
     Exécute des reviews en batch sur plusieurs jobs avec différentes configurations LLM.
     
+    Les détails des jobs sont récupérés en parallèle, et chaque couple (job, config)
+    est envoyé dès que les détails de son job sont disponibles, avec une limite de
+    requêtes simultanées par modèle.
+    
     Args:
         job_ids: Liste des IDs de jobs à reviewer
         configs: Liste de configurations, chaque config doit contenir:
@@ -82,6 +405,15 @@ def run_batch_review(
             - "reasoning_level": niveau de raisonnement (optionnel)
         generation_id: ID de génération pour organiser les résultats
         skip_existing: Si True, skip les combinaisons job/config déjà traitées
+        max_fetch_workers: Nombre de pages LinkedIn récupérées en parallèle
+        max_concurrency_per_model: Nombre max de reviews simultanées par modèle,
+            soit un entier commun, soit un dict {model: limite} (défaut 4 pour les
+            modèles absents du dict)
+        offline: Si True, les reviews de chaque configuration sont soumises en un
+            seul batch au fournisseur (voir batch_api), à prix réduit mais sans
+            garantie de délai
+        batch_provider: Fournisseur de batch en mode offline (OpenAI par défaut)
+        poll_interval: Intervalle de suivi du batch en mode offline (secondes)
     
     Returns:
         Liste plate de reviews, chaque élément contient:
@@ -110,91 +442,84 @@ def run_batch_review(
     all_jobs = load_raw_jobs()
     jobs_map = {job["id"]: job for job in all_jobs}
     
-    # Dict pour stocker les détails de job déjà extraits (évite de réextraire)
-    job_details_cache = {}
-    
-    # Traiter chaque combinaison job/config
+    # Construire la liste des combinaisons à traiter, groupées par job
+    pending_by_job = {}
     for job_id in job_ids:
         if job_id not in jobs_map:
             print(f"⚠️ Job ID {job_id} not found in raw_jobs. Skipping.")
             continue
-        
-        job = jobs_map[job_id]
-        
-        # Extraire les détails du job une seule fois (mise en cache)
-        if job_id not in job_details_cache:
-            print(f"📋 Extracting details for job {job_id}...")
-            job_details = extract_job_details(job["job_link"])
-            
-            if not job_details or not job_details.get("description"):
-                print(f"⚠️ Could not extract details for job {job_id}. Skipping.")
-                continue
-            
-            job_details_cache[job_id] = job_details
-        else:
-            job_details = job_details_cache[job_id]
-        
-        # Traiter chaque configuration
+        pending_configs = []
         for config in configs:
-            config_name = config["name"]
-            
-            # Vérifier si déjà traité
-            if skip_existing and (job_id, config_name) in processed_combinations:
-                print(f"⏭️  Job {job_id} with config '{config_name}' already processed. Skipping.")
+            if skip_existing and (job_id, config["name"]) in processed_combinations:
+                print(f"⏭️  Job {job_id} with config '{config['name']}' already processed. Skipping.")
                 continue
-            
-            print(f"\n🔄 Processing job {job_id} with config '{config_name}'...")
-            print(f"   Model: {config['model']}, Correction: {config.get('with_correction', True)}")
-            
-            try:
-                # Exécuter la review
-                review_result = review(
-                    job=job,
-                    job_details=job_details,
-                    model=config["model"],
-                    with_correction=config.get("with_correction", True),
-                    reasoning_level=config.get("reasoning_level")
-                )
-                
-                # Extraire les métadonnées et le résultat de review
-                metadata = review_result.pop("metadata", {})
-                
-                # Créer l'entrée de review
-                review_entry = {
-                    "job_id": job_id,
-                    "config_name": config_name,
-                    "model": config["model"],
-                    "with_correction": config.get("with_correction", True),
-                    "reasoning_level": config.get("reasoning_level"),
-                    "review_result": review_result,  # evaluation_grid, score, id
-                    "metadata": metadata  # input_tokens, output_tokens, total_tokens, total_cost, execution_time, etc.
-                }
-                
-                # Ajouter à la liste
-                reviews.append(review_entry)
-                
-                # Sauvegarder de manière incrémentale
-                save_batch_results(reviews, generation_id)
-                
-                print(f"   ✅ Completed - Cost: ${metadata.get('total_cost', 0):.4f}, "
-                      f"Time: {metadata.get('execution_time', 0):.2f}s, "
-                      f"Tokens: {metadata.get('total_tokens', 0)}")
-                
-            except Exception as e:
-                print(f"   ❌ Error processing job {job_id} with config '{config_name}': {e}")
-                # Stocker l'erreur dans les résultats
-                review_entry = {
-                    "job_id": job_id,
-                    "config_name": config_name,
-                    "model": config["model"],
-                    "with_correction": config.get("with_correction", True),
-                    "reasoning_level": config.get("reasoning_level"),
-                    "error": str(e),
-                    "review_result": None,
-                    "metadata": None
-                }
-                reviews.append(review_entry)
-                save_batch_results(reviews, generation_id)
+            pending_configs.append(config)
+        if pending_configs:
+            pending_by_job[job_id] = pending_configs
+    
+    total = sum(len(c) for c in pending_by_job.values())
+    if total == 0:
+        print("✅ Nothing left to process.")
+        return reviews
+    
+    # Un pool par modèle pour limiter la concurrence de chacun
+    def model_limit(model: str) -> int:
+        if isinstance(max_concurrency_per_model, dict):
+            return max_concurrency_per_model.get(model, 4)
+        return max_concurrency_per_model
+    
+    progress = BatchProgress(total)
+    reviews_lock = threading.Lock()
+    
+    def review_and_save(job, job_details, config):
+        review_entry = _run_single_review(job, job_details, config)
+        with reviews_lock:
+            reviews.append(review_entry)
+        # Sauvegarder de manière incrémentale (ajout en fin de fichier)
+        append_batch_result(review_entry, generation_id)
+        progress.update(review_entry)
+    
+    def fetch_details(job_id):
+        job = jobs_map[job_id]
+        print(f"📋 Extracting details for job {job_id}...")
+        job_details = extract_job_details(job["job_link"])
+        if not job_details or not job_details.get("description"):
+            return job, None
+        return job, compact_job_details(job, job_details)
+    
+    if offline:
+        _run_offline_batch_review(
+            pending_by_job, fetch_details, generation_id, reviews, progress,
+            max_fetch_workers, batch_provider, poll_interval
+        )
+        return reviews
+    
+    models = {config["model"] for configs_ in pending_by_job.values() for config in configs_}
+    review_pools = {model: ThreadPoolExecutor(max_workers=model_limit(model)) for model in models}
+    
+    print(f"🚀 {total} reviews to run on {len(pending_by_job)} jobs "
+          f"({', '.join(f'{m}: {model_limit(m)}' for m in sorted(models))} concurrent)")
+    
+    review_futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_fetch_workers) as fetch_pool:
+            fetch_futures = [fetch_pool.submit(fetch_details, job_id) for job_id in pending_by_job]
+            # Dispatcher les reviews d'un job dès que ses détails sont disponibles
+            for future in as_completed(fetch_futures):
+                job, job_details = future.result()
+                if job_details is None:
+                    print(f"⚠️ Could not extract details for job {job['id']}. Skipping.")
+                    progress.skip(len(pending_by_job[job["id"]]))
+                    continue
+                for config in pending_by_job[job["id"]]:
+                    review_futures.append(
+                        review_pools[config["model"]].submit(review_and_save, job, job_details, config)
+                    )
+        for future in as_completed(review_futures):
+            future.result()
+    finally:
+        for pool in review_pools.values():
+            pool.shutdown(wait=True)
     
     return reviews
 
@@ -5,11 +5,11 @@ Aide à créer la ground truth en validant les détections automatiques.
 
 import json
 from pathlib import Path
-from collections import defaultdict
 from typing import Dict, List, Set
 
-from jobseeker_agent.reviewer.evaluation.batch_review import load_batch_results
-from jobseeker_agent.utils.paths import get_data_path, load_full_job
+from jobseeker_agent.reviewer.evaluation.detections import load_detection_index
+from jobseeker_agent.scraper.descriptions import iter_full_jobs
+from jobseeker_agent.utils.paths import get_data_path
 
 
 # Liste des critères avec leurs descriptions (ordre original)
@@ -44,40 +44,6 @@ CRITERIA_LIST = [
 CRITERIA_MAP = {c["id"]: c["description"] for c in CRITERIA_LIST}
 
 
-def aggregate_detections(reviews: List[Dict]) -> Dict[int, Dict[str, List[Dict]]]:
-    """
-    Agrège les détections de critères par job.
-    
-    Returns:
-        Dict[job_id][criterion_id] = {
-            'count': nombre de LLMs qui l'ont détecté,
-            'detected_by': liste des configs qui l'ont détecté,
-            'evidences': liste des evidences fournies
-        }
-    """
-    aggregations = defaultdict(lambda: defaultdict(lambda: {
-        'count': 0,
-        'detected_by': [],
-        'evidences': []
-    }))
-    
-    for review in reviews:
-        job_id = review['job_id']
-        config_name = review['config_name']
-        review_result = review.get('review_result', {})
-        
-        if review_result and 'evaluation_grid' in review_result:
-            for criterion in review_result['evaluation_grid']:
-                criterion_id = criterion['id']
-                evidence = criterion.get('evidence', '')
-                
-                aggregations[job_id][criterion_id]['count'] += 1
-                aggregations[job_id][criterion_id]['detected_by'].append(config_name)
-                aggregations[job_id][criterion_id]['evidences'].append(evidence)
-    
-    return dict(aggregations)
-
-
 def get_criteria_sorted(aggregations: Dict[int, Dict]) -> List[int]:
     """
     Retourne les critères triés :
@@ -98,31 +64,28 @@ def get_criteria_sorted(aggregations: Dict[int, Dict]) -> List[int]:
 def create_html_interface(generation_id: int, output_path: Path):
     """Crée une interface HTML interactive pour valider les critères."""
     
-    reviews = load_batch_results(generation_id)
-    if not reviews:
+    index = load_detection_index(generation_id)
+    if not index.job_ids:
         print(f"❌ Aucun résultat trouvé pour generation {generation_id}")
         return
     
-    # Extraire les job_ids uniques
-    job_ids = sorted(set(review['job_id'] for review in reviews))
+    job_ids = index.job_ids
     
     print(f"📋 {len(job_ids)} jobs à valider")
     
     # Charger les jobs complets avec descriptions
     print("📥 Chargement des descriptions des jobs...")
     jobs_map = {}
-    for job_id in job_ids:
-        try:
-            job = load_full_job(job_id)
-            jobs_map[job_id] = job
-        except Exception as e:
-            print(f"⚠️  Erreur chargement job {job_id}: {e}")
+    for job_id, job, error in iter_full_jobs(job_ids):
+        if job is None:
+            print(f"⚠️  Erreur chargement job {job_id}: {error}")
             # Utiliser un job vide en fallback
-            jobs_map[job_id] = {'id': job_id, 'title': 'Unknown', 'company': 'Unknown', 'location': 'Unknown', 'description': 'Could not load description'}
+            job = {'id': job_id, 'title': 'Unknown', 'company': 'Unknown', 'location': 'Unknown', 'description': 'Could not load description'}
+        jobs_map[job_id] = job
     print(f"✅ {len(jobs_map)} jobs chargés")
     
-    # Agréger les détections
-    aggregations_by_job = aggregate_detections(reviews)
+    # Détections agrégées par job et par critère
+    aggregations_by_job = index.to_aggregations()
     
     # Générer le HTML
     html_content = """
@@ -0,0 +1,227 @@
+"""
+Index des détections de critères d'une génération.
+
+Construit, à partir des résultats de batch, une matrice jobs × critères × configs
+des détections, avec pour chaque détection un offset vers son evidence. L'index est
+mis en cache sur disque et reconstruit uniquement quand le fichier de résultats change
+(checksum). Les outils d'évaluation (ground truth, analyse des performances) le
+consomment directement au lieu de réagréger les reviews à chaque lancement.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from jobseeker_agent.reviewer.evaluation.batch_review import get_batch_results_path, load_batch_results
+
+
+# Offset utilisé quand un critère n'a pas été détecté
+NO_EVIDENCE = -1
+
+
+@dataclass
+class DetectionIndex:
+    """
+    Détections des configs sur les jobs d'une génération.
+
+    - detected[j, k, c]: la config c a détecté le critère k sur le job j
+    - evidence_offsets[j, k, c]: index de l'evidence dans `evidences` (NO_EVIDENCE sinon)
+    - reviewed[j, c]: la config c a une review (sans erreur) pour le job j
+    - costs[j, c], times[j, c]: coût et temps d'exécution de ces reviews
+
+    Seule la dernière review réussie de chaque couple (job, config) est prise en compte.
+    """
+    checksum: Optional[str]
+    job_ids: List[int]
+    criteria_ids: List[int]
+    config_names: List[str]
+    detected: np.ndarray
+    evidence_offsets: np.ndarray
+    evidences: List[str]
+    reviewed: np.ndarray
+    costs: np.ndarray
+    times: np.ndarray
+
+    def detection_counts(self) -> np.ndarray:
+        """Nombre de configs ayant détecté chaque critère: (jobs, critères)."""
+        return self.detected.sum(axis=2)
+
+    def to_aggregations(self) -> Dict[int, Dict[int, Dict[str, Any]]]:
+        """
+        Convertit l'index au format d'agrégation historique des outils de ground truth.
+
+        Returns:
+            Dict[job_id][criterion_id] = {
+                'count': nombre de LLMs qui l'ont détecté,
+                'detected_by': liste des configs qui l'ont détecté,
+                'evidences': liste des evidences fournies
+            }
+        """
+        aggregations = {}
+        counts = self.detection_counts()
+        for j, k in zip(*np.nonzero(counts)):
+            configs = np.flatnonzero(self.detected[j, k])
+            job_aggregations = aggregations.setdefault(self.job_ids[j], {})
+            job_aggregations[self.criteria_ids[k]] = {
+                'count': int(counts[j, k]),
+                'detected_by': [self.config_names[c] for c in configs],
+                'evidences': [self.evidences[self.evidence_offsets[j, k, c]] for c in configs],
+            }
+        return aggregations
+
+
+def build_detection_index(reviews: List[Dict[str, Any]], checksum: Optional[str] = None) -> DetectionIndex:
+    """Construit l'index des détections à partir des reviews de batch."""
+    job_ids = sorted({r['job_id'] for r in reviews})
+    config_names = sorted({r['config_name'] for r in reviews})
+
+    # Garder la dernière review réussie de chaque couple (job, config)
+    latest = {}
+    for review in reviews:
+        if review.get('error') or not review.get('review_result'):
+            continue
+        latest[(review['job_id'], review['config_name'])] = review
+
+    criteria_ids = sorted({
+        criterion['id']
+        for review in latest.values()
+        for criterion in review['review_result'].get('evaluation_grid', [])
+    })
+
+    job_index = {job_id: j for j, job_id in enumerate(job_ids)}
+    criterion_index = {cid: k for k, cid in enumerate(criteria_ids)}
+    config_index = {name: c for c, name in enumerate(config_names)}
+
+    # Collecter les coordonnées puis remplir les tableaux en une seule affectation
+    rev_j, rev_c, costs_list, times_list = [], [], [], []
+    det_j, det_k, det_c = [], [], []
+    evidences = []
+    for (job_id, config_name), review in latest.items():
+        j, c = job_index[job_id], config_index[config_name]
+        metadata = review.get('metadata') or {}
+        rev_j.append(j)
+        rev_c.append(c)
+        costs_list.append(metadata.get('total_cost', 0))
+        times_list.append(metadata.get('execution_time', 0))
+        for criterion in review['review_result'].get('evaluation_grid', []):
+            det_j.append(j)
+            det_k.append(criterion_index[criterion['id']])
+            det_c.append(c)
+            evidences.append(criterion.get('evidence', ''))
+
+    shape = (len(job_ids), len(config_names))
+    reviewed = np.zeros(shape, dtype=bool)
+    costs = np.zeros(shape)
+    times = np.zeros(shape)
+    reviewed[rev_j, rev_c] = True
+    costs[rev_j, rev_c] = costs_list
+    times[rev_j, rev_c] = times_list
+
+    cube = (len(job_ids), len(criteria_ids), len(config_names))
+    detected = np.zeros(cube, dtype=bool)
+    evidence_offsets = np.full(cube, NO_EVIDENCE, dtype=np.int32)
+    detected[det_j, det_k, det_c] = True
+    evidence_offsets[det_j, det_k, det_c] = np.arange(len(evidences), dtype=np.int32)
+
+    return DetectionIndex(
+        checksum, job_ids, criteria_ids, config_names,
+        detected, evidence_offsets, evidences, reviewed, costs, times
+    )
+
+
+def get_detection_index_paths(generation_id: int) -> Tuple[Path, Path]:
+    """Retourne les chemins du cache de l'index (tableaux .npz, métadonnées .json)."""
+    batch_path = get_batch_results_path(generation_id)
+    return batch_path.with_name("detections.npz"), batch_path.with_name("detections.json")
+
+
+def _file_checksum(path: Path) -> Optional[str]:
+    """SHA-256 du fichier, ou None s'il n'existe pas."""
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cached_index(generation_id: int, checksum: str) -> Optional[DetectionIndex]:
+    """Charge l'index en cache s'il correspond au checksum du fichier de résultats."""
+    arrays_path, meta_path = get_detection_index_paths(generation_id)
+    if not arrays_path.exists() or not meta_path.exists():
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("checksum") != checksum:
+            return None
+        with np.load(arrays_path) as arrays:
+            return DetectionIndex(
+                checksum=checksum,
+                job_ids=meta["job_ids"],
+                criteria_ids=meta["criteria_ids"],
+                config_names=meta["config_names"],
+                detected=arrays["detected"],
+                evidence_offsets=arrays["evidence_offsets"],
+                evidences=meta["evidences"],
+                reviewed=arrays["reviewed"],
+                costs=arrays["costs"],
+                times=arrays["times"],
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_detection_index(index: DetectionIndex, generation_id: int) -> None:
+    """Écrit l'index en cache (les métadonnées en dernier : elles valident le cache)."""
+    arrays_path, meta_path = get_detection_index_paths(generation_id)
+    tmp_arrays = arrays_path.with_suffix(".npz.tmp")
+    with open(tmp_arrays, "wb") as f:
+        np.savez_compressed(
+            f,
+            detected=index.detected,
+            evidence_offsets=index.evidence_offsets,
+            reviewed=index.reviewed,
+            costs=index.costs,
+            times=index.times,
+        )
+    os.replace(tmp_arrays, arrays_path)
+
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    with open(tmp_meta, "w", encoding="utf-8") as f:
+        json.dump({
+            "checksum": index.checksum,
+            "job_ids": index.job_ids,
+            "criteria_ids": index.criteria_ids,
+            "config_names": index.config_names,
+            "evidences": index.evidences,
+        }, f, ensure_ascii=False)
+    os.replace(tmp_meta, meta_path)
+
+
+def load_detection_index(generation_id: int) -> DetectionIndex:
+    """
+    Retourne l'index des détections d'une génération.
+
+    Utilise le cache disque si le fichier de résultats n'a pas changé depuis sa
+    construction, sinon reconstruit l'index depuis les résultats et le met en cache.
+    """
+    batch_path = get_batch_results_path(generation_id)
+    checksum = _file_checksum(batch_path)
+    if checksum is not None:
+        index = _load_cached_index(generation_id, checksum)
+        if index is not None:
+            return index
+
+    # load_batch_results migre aussi l'ancien format JSON, d'où le checksum recalculé
+    reviews = load_batch_results(generation_id)
+    index = build_detection_index(reviews, _file_checksum(batch_path))
+    if index.checksum is not None:
+        save_detection_index(index, generation_id)
+    return index
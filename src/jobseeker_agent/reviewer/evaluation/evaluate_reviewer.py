@@ -6,6 +6,7 @@ each generation is associated with a different llm model, prompt, and eventually
 
 from jobseeker_agent.utils.paths import load_raw_jobs, save_test_reviews, load_reviews, load_labels
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
 from jobseeker_agent.reviewer.agents.reviewer import review
 
 def print_review(job_id, generation_id: int):
@@ -64,6 +65,7 @@ def main(generation_id: int, model=str):
             continue
 
         job_details = extract_job_details(job["job_link"])
+        job_details = compact_job_details(job, job_details)
         result = review(job, job_details, model=model)
 
         reviews.append(result)
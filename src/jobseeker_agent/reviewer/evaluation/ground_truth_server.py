@@ -5,12 +5,13 @@ Lance une interface web pour valider les critères et sauvegarde directement dan
 
 from flask import Flask, render_template_string, jsonify, request
 import json
+import threading
 from pathlib import Path
-from collections import defaultdict
 from typing import Dict, List
 
-from jobseeker_agent.reviewer.evaluation.batch_review import load_batch_results
-from jobseeker_agent.utils.paths import get_data_path, load_full_job
+from jobseeker_agent.reviewer.evaluation.detections import load_detection_index
+from jobseeker_agent.scraper.descriptions import iter_full_jobs
+from jobseeker_agent.utils.paths import get_data_path
 
 
 # Liste des critères avec leurs descriptions (ordre original)
@@ -44,36 +45,13 @@ CRITERIA_LIST = [
 CRITERIA_MAP = {c["id"]: c["description"] for c in CRITERIA_LIST}
 
 
-def aggregate_detections(reviews: List[Dict]) -> Dict[int, Dict[str, List[Dict]]]:
-    """Agrège les détections de critères par job."""
-    aggregations = defaultdict(lambda: defaultdict(lambda: {
-        'count': 0,
-        'detected_by': [],
-        'evidences': []
-    }))
-    
-    for review in reviews:
-        job_id = review['job_id']
-        config_name = review['config_name']
-        review_result = review.get('review_result', {})
-        
-        if review_result and 'evaluation_grid' in review_result:
-            for criterion in review_result['evaluation_grid']:
-                criterion_id = criterion['id']
-                evidence = criterion.get('evidence', '')
-                
-                aggregations[job_id][criterion_id]['count'] += 1
-                aggregations[job_id][criterion_id]['detected_by'].append(config_name)
-                aggregations[job_id][criterion_id]['evidences'].append(evidence)
-    
-    return dict(aggregations)
-
-
 app = Flask(__name__)
 
 # Variables globales pour stocker l'état
 GENERATION_ID = None
 JOB_DATA = None
+# Jobs complets, remplis au fur et à mesure par le thread de chargement
+JOBS_MAP: Dict[int, Dict] = {}
 
 
 HTML_TEMPLATE = """
@@ -365,6 +343,28 @@ HTML_TEMPLATE = """
         
         let currentJobIndex = 0;
         const selectedCriteria = {};
+        const jobsCache = {};
+        const pendingJobs = {};
+        
+        // Les descriptions sont chargées en arrière-plan par le serveur :
+        // on les récupère à la demande et on réessaie tant qu'elles ne sont pas prêtes
+        async function fetchJob(jobId) {
+            if (jobsCache[jobId]) return jobsCache[jobId];
+            if (!pendingJobs[jobId]) {
+                pendingJobs[jobId] = (async () => {
+                    while (true) {
+                        const response = await fetch(`/job/${jobId}`);
+                        const result = await response.json();
+                        if (result.ready) {
+                            jobsCache[jobId] = result.job;
+                            return result.job;
+                        }
+                        await new Promise(resolve => setTimeout(resolve, 1000));
+                    }
+                })();
+            }
+            return pendingJobs[jobId];
+        }
         
         function getCurrentJobId() {
             return jobData.jobs[currentJobIndex];
@@ -391,11 +391,24 @@ HTML_TEMPLATE = """
         function renderJob() {
             const jobId = getCurrentJobId();
             const aggregations = jobData.aggregations[jobId] || {};
-            const jobInfo = jobData.jobs_map[jobId];
+            const jobInfo = jobsCache[jobId];
             const sortedCriteriaIds = getCriteriaSorted(jobId);
             
+            if (!jobInfo) {
+                fetchJob(jobId).then(() => {
+                    if (getCurrentJobId() === jobId) renderJob();
+                });
+            }
+            // Précharger le job suivant
+            const nextJobId = jobData.jobs[currentJobIndex + 1];
+            if (nextJobId !== undefined) fetchJob(nextJobId);
+            
             // Rendre la description du job
-            const jobDescHtml = `
+            const jobDescHtml = !jobInfo ? `
+                <div class="job-desc-panel">
+                    <div class="job-title">⏳ Chargement du job ${jobId}...</div>
+                </div>
+            ` : `
                 <div class="job-desc-panel">
                     <div class="job-title">${jobInfo.title || 'Unknown'}</div>
                     <div class="job-meta">
@@ -555,6 +568,15 @@ def index():
     )
 
 
+@app.route('/job/<int:job_id>')
+def get_job(job_id):
+    """Retourne un job complet s'il est déjà chargé, sinon indique qu'il est en cours de chargement."""
+    job = JOBS_MAP.get(job_id)
+    if job is None:
+        return jsonify({'ready': False, 'loaded': len(JOBS_MAP), 'total': len(JOB_DATA['jobs'])})
+    return jsonify({'ready': True, 'job': job})
+
+
 @app.route('/save_ground_truth', methods=['POST'])
 def save_ground_truth():
     """Endpoint pour sauvegarder la ground truth."""
@@ -578,6 +600,23 @@ def save_ground_truth():
     })
 
 
+def load_jobs_in_background(job_ids: List[int], max_workers: int = 8):
+    """Charge les jobs complets en parallèle et les rend disponibles dès qu'ils arrivent."""
+    print(f"📥 Chargement des descriptions de {len(job_ids)} jobs en arrière-plan...")
+    for job_id, job, error in iter_full_jobs(job_ids, max_workers=max_workers):
+        if job is None:
+            print(f"⚠️  Erreur chargement job {job_id}: {error}")
+            job = {
+                'id': job_id,
+                'title': 'Unknown',
+                'company': 'Unknown',
+                'location': 'Unknown',
+                'description': 'Could not load description'
+            }
+        JOBS_MAP[job_id] = job
+    print(f"✅ {len(JOBS_MAP)} jobs chargés")
+
+
 def launch_validation_interface(generation_id: int, port: int = 5000):
     """Lance l'interface de validation pour une génération donnée."""
     global GENERATION_ID, JOB_DATA
@@ -588,42 +627,25 @@ def launch_validation_interface(generation_id: int, port: int = 5000):
     print(f"🎨 Chargement des données - Generation {generation_id}")
     print("=" * 60)
     
-    # Charger les reviews
-    reviews = load_batch_results(generation_id)
-    if not reviews:
+    # Charger l'index des détections (mis en cache sur disque)
+    index = load_detection_index(generation_id)
+    if not index.job_ids:
         print(f"❌ Aucun résultat trouvé pour generation {generation_id}")
         return
     
-    # Extraire les job_ids uniques
-    job_ids = sorted(set(review['job_id'] for review in reviews))
+    job_ids = index.job_ids
     print(f"📋 {len(job_ids)} jobs à valider")
     
-    # Charger les jobs complets avec descriptions
-    print("📥 Chargement des descriptions des jobs...")
-    jobs_map = {}
-    for job_id in job_ids:
-        try:
-            job = load_full_job(job_id)
-            jobs_map[job_id] = job
-        except Exception as e:
-            print(f"⚠️  Erreur chargement job {job_id}: {e}")
-            jobs_map[job_id] = {
-                'id': job_id,
-                'title': 'Unknown',
-                'company': 'Unknown',
-                'location': 'Unknown',
-                'description': 'Could not load description'
-            }
-    
-    print(f"✅ {len(jobs_map)} jobs chargés")
+    # Charger les descriptions en arrière-plan : le serveur démarre sans attendre
+    JOBS_MAP.clear()
+    threading.Thread(target=load_jobs_in_background, args=(job_ids,), daemon=True).start()
     
-    # Agréger les détections
-    aggregations_by_job = aggregate_detections(reviews)
+    # Détections agrégées par job et par critère
+    aggregations_by_job = index.to_aggregations()
     
     JOB_DATA = {
         'jobs': job_ids,
         'aggregations': aggregations_by_job,
-        'jobs_map': jobs_map,
         'generation_id': generation_id
     }
     
@@ -641,7 +663,8 @@ def launch_validation_interface(generation_id: int, port: int = 5000):
     print(f"      {output_path}")
     print()
     
-    app.run(debug=True, port=port)
+    # Pas de reloader : il relancerait le processus et donc le chargement des jobs
+    app.run(debug=True, port=port, use_reloader=False)
 
 
 def main():
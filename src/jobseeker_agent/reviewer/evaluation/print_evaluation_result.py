@@ -4,6 +4,7 @@ import webbrowser
 import tempfile
 import os
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
@@ -49,40 +50,98 @@ def load_and_merge_data(generation_id: int):
     return merged_data
 
 
+def _count_by_unique_score(scores, labels):
+    """Groups samples by unique score and counts positives/negatives for each one."""
+    scores = np.asarray(scores, dtype=float)
+    labels = np.asarray(labels, dtype=bool)
+    unique_scores, inverse = np.unique(scores, return_inverse=True)
+    positives = np.bincount(inverse, weights=labels, minlength=len(unique_scores))
+    negatives = np.bincount(inverse, weights=~labels, minlength=len(unique_scores))
+    return unique_scores, positives.astype(np.int64), negatives.astype(np.int64)
+
+
+def _candidate_thresholds(unique_scores):
+    """Midpoints between unique scores, plus one threshold below and one above them."""
+    return np.concatenate((
+        [unique_scores[0] - 0.1],
+        (unique_scores[:-1] + unique_scores[1:]) / 2,
+        [unique_scores[-1] + 0.1],
+    ))
+
+
+def _errors_per_threshold(positives, negatives):
+    """
+    Errors for each candidate threshold, from per-unique-score counts.
+
+    Threshold k sits just below unique score k: positives under it are false
+    negatives, negatives at or above it are false positives. Works on the last
+    axis, so a batch of bootstrap resamples is handled in one call.
+    """
+    zeros = np.zeros(positives.shape[:-1] + (1,), dtype=positives.dtype)
+    positives_below = np.concatenate((zeros, np.cumsum(positives, axis=-1)), axis=-1)
+    negatives_below = np.concatenate((zeros, np.cumsum(negatives, axis=-1)), axis=-1)
+    return positives_below + (negatives_below[..., -1:] - negatives_below)
+
+
+def sweep_thresholds(scores, labels):
+    """
+    Computes the classification error for every candidate threshold in O(n log n).
+
+    Returns:
+        (thresholds, errors) arrays; the first minimum of errors is the optimal threshold.
+    """
+    unique_scores, positives, negatives = _count_by_unique_score(scores, labels)
+    if len(unique_scores) == 0:
+        return np.empty(0), np.empty(0, dtype=np.int64)
+    return _candidate_thresholds(unique_scores), _errors_per_threshold(positives, negatives)
+
+
 def find_optimal_threshold(data):
-    """Finds the optimal score threshold to minimize classification error."""
+    """
+    Finds the optimal score threshold to minimize classification error.
+
+    Returns:
+        (threshold, min_errors, curve) where curve is the (thresholds, errors) sweep.
+    """
     if not data:
-        return None, 0
+        return None, 0, (np.empty(0), np.empty(0, dtype=np.int64))
+
+    thresholds, errors = sweep_thresholds(
+        [d["score"] for d in data], [d["interested"] for d in data]
+    )
+    best = int(np.argmin(errors))
+    return float(thresholds[best]), int(errors[best]), (thresholds, errors)
 
-    scores = [d["score"] for d in data]
-    labels = [d["interested"] for d in data]
 
-    unique_scores = sorted(list(set(scores)))
+def bootstrap_threshold_ci(data, n_resamples=1000, confidence=0.95, seed=None):
+    """
+    Bootstrap confidence interval for the optimal threshold.
 
-    if not unique_scores:
-        return None, len([l for l in labels if l])
+    Resamples are drawn as multinomial counts over the (unique score, label) cells,
+    so all resamples are swept at once with the same cumulative-count logic.
 
-    # Generate potential thresholds between unique scores
-    thresholds = [unique_scores[0] - 0.1]
-    for i in range(len(unique_scores) - 1):
-        thresholds.append((unique_scores[i] + unique_scores[i + 1]) / 2)
-    thresholds.append(unique_scores[-1] + 0.1)
+    Returns:
+        (low, high) bounds of the interval, or (None, None) if there is no data.
+    """
+    if not data:
+        return None, None
 
-    best_threshold = None
-    min_errors = float("inf")
+    unique_scores, positives, negatives = _count_by_unique_score(
+        [d["score"] for d in data], [d["interested"] for d in data]
+    )
+    thresholds = _candidate_thresholds(unique_scores)
+    m = len(unique_scores)
 
-    for threshold in thresholds:
-        errors = 0
-        for score, label in zip(scores, labels):
-            prediction = score >= threshold
-            if prediction != label:
-                errors += 1
+    cell_counts = np.concatenate((positives, negatives))
+    rng = np.random.default_rng(seed)
+    resampled = rng.multinomial(len(data), cell_counts / cell_counts.sum(), size=n_resamples)
 
-        if errors < min_errors:
-            min_errors = errors
-            best_threshold = threshold
+    errors = _errors_per_threshold(resampled[:, :m], resampled[:, m:])
+    best_thresholds = thresholds[np.argmin(errors, axis=1)]
 
-    return best_threshold, min_errors
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(best_thresholds, [alpha, 1 - alpha])
+    return float(low), float(high)
 
 
 def display_misclassified_job(job, prediction):
@@ -213,7 +272,7 @@ def main(generation_id: int):
     console.print(labels_table)
 
     console.print("\n[bold cyan]2. Finding optimal score threshold...[/bold cyan]")
-    threshold, min_errors = find_optimal_threshold(data)
+    threshold, min_errors, (curve_thresholds, curve_errors) = find_optimal_threshold(data)
 
     if threshold is None:
         console.print("[bold red]Could not determine an optimal threshold.[/bold red]")
@@ -221,14 +280,25 @@ def main(generation_id: int):
 
     accuracy = 1 - (min_errors / len(data))
 
+    ci_low, ci_high = bootstrap_threshold_ci(data)
+
     table = Table(title="Optimal Threshold Results")
     table.add_column("Metric", style="magenta")
     table.add_column("Value", style="green")
     table.add_row("Optimal Threshold", f"{threshold:.2f}")
+    table.add_row("95% Bootstrap CI", f"[{ci_low:.2f}, {ci_high:.2f}]")
     table.add_row("Minimum Errors", f"{min_errors} / {len(data)}")
     table.add_row("Accuracy", f"{accuracy:.2%}")
     console.print(table)
 
+    curve_table = Table(title="Errors vs Threshold")
+    curve_table.add_column("Threshold", style="magenta")
+    curve_table.add_column("Errors", style="green")
+    for t, e in zip(curve_thresholds, curve_errors):
+        style = "bold" if t == threshold else None
+        curve_table.add_row(f"{t:.2f}", str(e), style=style)
+    console.print(curve_table)
+
     console.print("\n[bold cyan]3. Finding confidently correct jobs...[/bold cyan]")
     confident_ids = find_confident_correct_jobs(data, threshold)
     if confident_ids:
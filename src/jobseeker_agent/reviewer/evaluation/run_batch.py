@@ -167,7 +167,7 @@ def main():
         print(f"💰 Average cost per review: ${total_cost / successful_reviews:.4f}")
         print(f"⏱️  Average time per review: {total_time / successful_reviews:.2f}s")
     print("=" * 60)
-    print(f"💾 Results saved to: data/reviewer/tests/{generation_id}/batch_results.json")
+    print(f"💾 Results saved to: data/reviewer/tests/{generation_id}/batch_results.jsonl")
     print()
 
 
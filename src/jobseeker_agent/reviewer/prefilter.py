@@ -0,0 +1,285 @@
+"""
+Pré-filtre local de pertinence, appliqué avant la review LLM.
+
+Score bon marché calculé sans appel LLM :
+- similarité cosinus TF-IDF (n-grammes hachés) entre la description et `profil_pro`,
+- règles par mots-clés tirées de la grille de critères du reviewer, pondérées par
+  les poids du prompt.
+
+Les jobs sous le seuil sont ignorés ou relégués en fin de file par `JobReviewer`.
+`get_prefilter` retourne une instance partagée par le processus, dont l'IDF est
+complété avec les nouvelles descriptions quand le stockage change.
+Lancer ce module affiche le rappel du filtre sur les reviews et labels existants
+pour chaque seuil, afin de choisir celui-ci.
+"""
+
+import math
+import re
+import threading
+import unicodedata
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jobseeker_agent.reviewer.scoring import get_default_weights
+from jobseeker_agent.scraper.descriptions import load_descriptions
+from jobseeker_agent.utils.paths import (
+    get_data_path,
+    get_descriptions_journal_path,
+    get_descriptions_json_path,
+    load_labels,
+    load_prompt,
+    load_raw_jobs,
+    load_reviews,
+)
+
+
+# Nombre de buckets pour le hachage des n-grammes
+HASH_BUCKETS = 1 << 20
+# Taille des n-grammes de caractères (à l'intérieur des mots)
+CHAR_NGRAM_SIZE = 4
+# Poids de la similarité (dans [0, 1]) face aux points des règles par mots-clés
+SIMILARITY_WEIGHT = 10.0
+# Seuil par défaut : en dessous, le job est ignoré ou relégué
+DEFAULT_THRESHOLD = -2.0
+# Score de review à partir duquel un job est considéré pertinent pour mesurer le rappel
+RELEVANT_REVIEW_SCORE = 2.0
+
+# Règles par mots-clés : id du critère de la grille -> motif cherché dans le titre, l'entreprise et la description
+KEYWORD_RULES = {
+    1: r"reinforcement learning|\brl\b|apprentissage par renforcement",
+    2: r"operations? research|recherche operationnelle|combinatorial optimi[sz]ation|\bmilp\b|mixed.integer|linear programming|\bsolvers?\b",
+    3: r"langchain|langgraph|agentic|\bai agents?\b|tool use|prompt engineering",
+    6: r"kubernetes|terraform|data warehouse|\betl\b|airflow|devops|infrastructure as code",
+    8: r"inference (speed|latency|optimi[sz]ation)|cloud costs?|gpu utili[sz]ation",
+    9: r"quantum",
+    11: r"\bmlops\b|large.scale training|distributed training",
+    12: r"\bph\.?d\b|doctora",
+    14: r"people manage|head of|engineering manager|director",
+    22: r"consultant|consulting",
+    23: r"defen[cs]e|military|armement",
+    24: r"robot",
+}
+_COMPILED_RULES = {cid: re.compile(pattern) for cid, pattern in KEYWORD_RULES.items()}
+
+
+def _normalize(text: str) -> str:
+    """Minuscules, sans accents."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def _features(text: str) -> Counter:
+    """Compte des n-grammes hachés : mots, bigrammes de mots et n-grammes de caractères."""
+    words = re.findall(r"\w+", text)
+    grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    for word in words:
+        if len(word) > CHAR_NGRAM_SIZE:
+            grams.extend(f"#{word[i:i + CHAR_NGRAM_SIZE]}" for i in range(len(word) - CHAR_NGRAM_SIZE + 1))
+    return Counter(zlib.crc32(g.encode()) % HASH_BUCKETS for g in grams)
+
+
+class RelevancePrefilter:
+    """Score de pertinence local d'un job par rapport au profil."""
+
+    def __init__(self, profile: Optional[str] = None, corpus: Optional[List[str]] = None):
+        """
+        Args:
+            profile: Texte du profil (profil_pro par défaut)
+            corpus: Descriptions servant à calculer l'IDF (descriptions stockées par défaut,
+                complétées ensuite par `refresh`)
+        """
+        if profile is None:
+            profile = load_prompt("profil_pro")
+        self._profile = _normalize(profile)
+        self._weights = get_default_weights()
+        # Fréquences documentaires, complétées au fil des descriptions ajoutées
+        self._lock = threading.Lock()
+        self._document_frequency = Counter()
+        self._n_documents = 0
+        self._job_ids = set()
+        self._profile_vector = self._vectorize(self._profile)
+        if corpus is None:
+            self.refresh()
+        else:
+            self.add_documents(corpus)
+
+    def add_documents(self, descriptions: Iterable[str]) -> None:
+        """Ajoute des descriptions au corpus de l'IDF."""
+        features = [_features(_normalize(description)).keys() for description in descriptions]
+        with self._lock:
+            for keys in features:
+                self._document_frequency.update(keys)
+            self._n_documents += len(features)
+            self._profile_vector = self._vectorize(self._profile)
+
+    def refresh(self) -> int:
+        """
+        Ajoute au corpus de l'IDF les descriptions stockées qui n'y sont pas encore.
+
+        Returns:
+            Le nombre de descriptions ajoutées
+        """
+        new_descriptions = {
+            job_id: entry["description"]
+            for job_id, entry in load_descriptions().items()
+            if job_id not in self._job_ids
+        }
+        if new_descriptions:
+            self._job_ids.update(new_descriptions)
+            self.add_documents(new_descriptions.values())
+        return len(new_descriptions)
+
+    def _idf(self, bucket: int) -> float:
+        # IDF lissé ; un n-gramme jamais vu dans le corpus a l'IDF maximal
+        return math.log((1 + self._n_documents) / (1 + self._document_frequency.get(bucket, 0))) + 1
+
+    def _vectorize(self, text: str) -> Dict[int, float]:
+        """Vecteur TF-IDF (tf sous-linéaire) normalisé."""
+        vector = {
+            bucket: (1 + math.log(count)) * self._idf(bucket)
+            for bucket, count in _features(text).items()
+        }
+        norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+        return {bucket: v / norm for bucket, v in vector.items()}
+
+    def similarity(self, text: str) -> float:
+        """Similarité cosinus entre un texte normalisé et le profil."""
+        with self._lock:
+            vector = self._vectorize(text)
+            profile = self._profile_vector
+        if len(vector) > len(profile):
+            vector, profile = profile, vector
+        return sum(v * profile.get(bucket, 0.0) for bucket, v in vector.items())
+
+    def matched_criteria(self, text: str) -> List[int]:
+        """Critères de la grille dont les mots-clés apparaissent dans un texte normalisé."""
+        return [cid for cid, pattern in _COMPILED_RULES.items() if pattern.search(text)]
+
+    def score(self, job: Dict[str, Any], job_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calcule le score de pré-filtrage d'un job.
+
+        Returns:
+            Dict avec 'score', 'similarity' et 'matched_criteria'
+        """
+        text = _normalize(f"{job.get('title', '')}\n{job.get('company', '')}\n{job_details['description']}")
+        similarity = self.similarity(text)
+        matched = self.matched_criteria(text)
+        keyword_score = sum(self._weights.get(cid, 0.0) for cid in matched)
+        return {
+            "score": SIMILARITY_WEIGHT * similarity + keyword_score,
+            "similarity": similarity,
+            "matched_criteria": matched,
+        }
+
+
+# Instance partagée du processus
+_PREFILTER_LOCK = threading.Lock()
+_PREFILTER: Optional[RelevancePrefilter] = None
+_PREFILTER_SIGNATURE = None
+
+
+def _descriptions_signature() -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime, taille) du fichier des descriptions et de son journal, None s'ils n'existent pas."""
+    signature = []
+    for path in (get_descriptions_json_path(), get_descriptions_journal_path()):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def get_prefilter() -> RelevancePrefilter:
+    """
+    Retourne le pré-filtre partagé du processus, construit au premier appel.
+
+    Quand les descriptions stockées ont changé depuis l'appel précédent, seules les
+    nouvelles descriptions sont ajoutées à l'IDF.
+    """
+    global _PREFILTER, _PREFILTER_SIGNATURE
+    with _PREFILTER_LOCK:
+        # Lue avant le chargement : une écriture concurrente déclenchera un nouveau refresh
+        signature = _descriptions_signature()
+        if _PREFILTER is None:
+            _PREFILTER = RelevancePrefilter()
+        elif signature != _PREFILTER_SIGNATURE:
+            _PREFILTER.refresh()
+        _PREFILTER_SIGNATURE = signature
+        return _PREFILTER
+
+
+def _load_all_labels() -> Dict[int, bool]:
+    """Labels manuels de toutes les générations (le dernier label d'un job l'emporte)."""
+    labels = {}
+    tests_dir = get_data_path() / "reviewer" / "tests"
+    if not tests_dir.exists():
+        return labels
+    for generation_dir in sorted(tests_dir.iterdir(), key=lambda p: p.name):
+        if generation_dir.is_dir() and generation_dir.name.isdigit() and (generation_dir / "labels.json").exists():
+            for label in load_labels(int(generation_dir.name)):
+                labels[label["id"]] = label["interested"]
+    return labels
+
+
+def evaluate_prefilter(
+    thresholds: List[float],
+    prefilter: Optional[RelevancePrefilter] = None,
+    relevant_review_score: float = RELEVANT_REVIEW_SCORE
+) -> List[Dict[str, Any]]:
+    """
+    Mesure le rappel du pré-filtre sur les jobs dont la description est stockée.
+
+    Un job est pertinent si sa review a un score >= relevant_review_score, ou s'il
+    est labellisé "interested". Pour chaque seuil, on compte les jobs pertinents
+    qui auraient été filtrés et la part des jobs qui n'aurait pas été envoyée au LLM.
+
+    Returns:
+        Une entrée par seuil avec 'threshold', 'skipped_ratio', 'review_recall', 'label_recall'
+    """
+    if prefilter is None:
+        prefilter = RelevancePrefilter()
+    descriptions = load_descriptions()
+    raw_jobs_map = {job["id"]: job for job in load_raw_jobs()}
+    review_scores = {int(r["id"]): float(r.get("score") or 0) for r in load_reviews()}
+    labels = _load_all_labels()
+
+    scores = {
+        job_id: prefilter.score(raw_jobs_map.get(job_id, entry), entry)["score"]
+        for job_id, entry in descriptions.items()
+    }
+    relevant_by_review = [j for j in scores if review_scores.get(j, -math.inf) >= relevant_review_score]
+    relevant_by_label = [j for j in scores if labels.get(j)]
+
+    def recall(relevant: List[int], threshold: float) -> Optional[float]:
+        if not relevant:
+            return None
+        return sum(scores[j] >= threshold for j in relevant) / len(relevant)
+
+    return [
+        {
+            "threshold": threshold,
+            "skipped_ratio": sum(s < threshold for s in scores.values()) / len(scores) if scores else 0.0,
+            "review_recall": recall(relevant_by_review, threshold),
+            "label_recall": recall(relevant_by_label, threshold),
+            "jobs": len(scores),
+            "relevant_by_review": len(relevant_by_review),
+            "relevant_by_label": len(relevant_by_label),
+        }
+        for threshold in thresholds
+    ]
+
+
+if __name__ == "__main__":
+    results = evaluate_prefilter([t / 2 for t in range(-12, 9)])
+    if results:
+        print(f"📋 {results[0]['jobs']} jobs avec description stockée "
+              f"({results[0]['relevant_by_review']} pertinents d'après les reviews, "
+              f"{results[0]['relevant_by_label']} d'après les labels)")
+    print(f"{'Seuil':>8} {'Ignorés':>10} {'Rappel reviews':>16} {'Rappel labels':>15}")
+    for r in results:
+        review_recall = f"{r['review_recall']:.1%}" if r["review_recall"] is not None else "n/a"
+        label_recall = f"{r['label_recall']:.1%}" if r["label_recall"] is not None else "n/a"
+        print(f"{r['threshold']:>8.1f} {r['skipped_ratio']:>10.1%} {review_recall:>16} {label_recall:>15}")
@@ -1,80 +1,577 @@
-import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
 from jobseeker_agent.utils.paths import (
     load_raw_jobs,
     load_reviews,
     save_reviews,
     load_processed_jobs,
     save_processed_jobs,
+    load_prefiltered_jobs,
+    save_prefiltered_jobs,
 )
 from jobseeker_agent.reviewer.agents.reviewer import review as review_agent
+from jobseeker_agent.reviewer.agents.batch_reviewer import MAX_BATCH_SIZE, plan_batches, review_batch
+from jobseeker_agent.reviewer.batch_api import DEFAULT_POLL_INTERVAL, run_offline_reviews
+from jobseeker_agent.reviewer.synthesis import render_synthesis
+from jobseeker_agent.reviewer.prefilter import DEFAULT_THRESHOLD, get_prefilter
+from jobseeker_agent.reviewer.scoring import apply_saved_weights
+from jobseeker_agent.reviewer.work_queue import get_review_queue
+from jobseeker_agent.utils.events import REVIEW_SAVED, publish
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
+
+
+# Modes du pré-filtre :
+# - "off": tous les jobs partent en review LLM
+# - "defer": les jobs sous le seuil ne sont reviewés qu'une fois tous les autres traités
+# - "skip": les jobs sous le seuil sont marqués comme traités sans review
+PREFILTER_MODES = ("off", "defer", "skip")
+
+# Pipeline : nombre de jobs dont les détails sont récupérés d'avance, et d'appels LLM simultanés
+DEFAULT_PREFETCH = 4
+DEFAULT_LLM_WORKERS = 2
+
+# Une passe s'arrête après ce nombre d'échecs consécutifs d'une même étape (récupération
+# des détails ou appel LLM) : les jobs restants sont laissés dans la file
+MAX_CONSECUTIVE_FAILURES = 3
+
+# Sérialise les écritures de reviews.json / processed_jobs.json / prefiltered_jobs.json entre workers
+_SAVE_LOCK = threading.Lock()
+
+
+class _PoppedJobs:
+    """
+    Jobs retirés de la file partagée pendant une passe de review.
+
+    En sortie de bloc (fin normale, erreur ou annulation), ceux qui n'ont été ni
+    enregistrés, ni marqués comme traités par le pré-filtre, ni relégués retournent
+    dans la file (détails introuvables, appel LLM en échec, doublons en attente...).
+    """
+
+    def __init__(self, reviewer, pop):
+        self._reviewer = reviewer
+        self._pop = pop
+        self.jobs = {}
+
+    def pop(self):
+        job = self._pop()
+        if job is not None:
+            self.jobs[job["id"]] = job
+        return job
+
+    def pop_deferred(self):
+        job, job_details = self._reviewer.queue.pop_deferred()
+        if job is not None:
+            self.jobs[job["id"]] = job
+        return job, job_details
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        queue = self._reviewer.queue
+        for job_id, job in self.jobs.items():
+            if job_id not in self._reviewer.processed_job_ids and job_id not in queue:
+                queue.add(job)
+        return False
+
+
+class _FailureBudget:
+    """Compte les échecs consécutifs d'une étape ; épuisé (définitivement) après `limit` échecs d'affilée."""
+
+    def __init__(self, step, limit=MAX_CONSECUTIVE_FAILURES):
+        self.step = step
+        self.limit = limit
+        self.failures = 0
+
+    def record(self, ok):
+        if not self.exhausted:
+            self.failures = 0 if ok else self.failures + 1
+
+    @property
+    def exhausted(self):
+        return self.failures >= self.limit
+
+    def report(self):
+        if self.exhausted:
+            print(f"❌ {self.failures} consecutive {self.step} failures: stopping, remaining jobs are left in the queue.")
 
 
 class JobReviewer:
-    def __init__(self):
+    def __init__(self, prefilter_mode: str = "defer", prefilter_threshold: float = DEFAULT_THRESHOLD):
+        if prefilter_mode not in PREFILTER_MODES:
+            raise ValueError(f"Unknown prefilter mode: {prefilter_mode}")
         self.raw_jobs = load_raw_jobs()
         self.processed_job_ids = set(load_processed_jobs())
         self.reviews = load_reviews()
+        # File partagée entre tous les reviewers du processus
+        self.queue = get_review_queue()
+        # Review de référence de chaque groupe de quasi-doublons (clé : id du job canonique)
+        self.group_reviews = {}
+        canonical_ids = {job["id"]: self._canonical_id(job) for job in self.raw_jobs}
+        for review in self.reviews:
+            self.group_reviews.setdefault(canonical_ids.get(review["id"], review["id"]), review)
+        self.prefilter_mode = prefilter_mode
+        self.prefilter_threshold = prefilter_threshold
+        self.prefilter = get_prefilter() if prefilter_mode != "off" else None
+
+    def _fetch_job_details(self, job):
+        job_details = extract_job_details(job["job_link"])
+        if not job_details:
+            print(f"Failed to retrieve details for job {job['id']}. Skipping.")
+            return None
+        return compact_job_details(job, job_details)
 
-    def _get_unprocessed_jobs(self):
-        return [
-            job
-            for job in self.raw_jobs
-            if job["id"] not in self.processed_job_ids and job.get("status") != "Closed"
-        ]
+    def _passes_prefilter(self, job, job_details):
+        """Applique le pré-filtre ; les jobs sous le seuil sont relégués ou ignorés."""
+        if self.prefilter is None:
+            return True
+        result = self.prefilter.score(job, job_details)
+        if result["score"] >= self.prefilter_threshold:
+            return True
 
-    def review_random_job(self, model, with_correction=True, reasoning_level=None):
-        unprocessed_jobs = self._get_unprocessed_jobs()
-        if not unprocessed_jobs:
-            print("All jobs have been reviewed.")
-            return
+        if self.prefilter_mode == "defer":
+            print(f"⏬ Job {job['id']} deferred by prefilter (score {result['score']:.2f}).")
+            # Relégué dans la file partagée : repris par ce reviewer ou un suivant une fois la file épuisée
+            self.queue.defer(job, result["score"], job_details)
+        else:
+            print(f"⏭️  Job {job['id']} skipped by prefilter (score {result['score']:.2f}).")
+            # Relecture sous verrou, comme _save_review : les threads de récupération filtrent en parallèle
+            with _SAVE_LOCK:
+                self.processed_job_ids.update(load_processed_jobs())
+                self.processed_job_ids.add(job["id"])
+                save_processed_jobs(list(self.processed_job_ids))
+                prefiltered_jobs = load_prefiltered_jobs()
+                prefiltered_jobs.append({
+                    "id": job["id"],
+                    "score": result["score"],
+                    "similarity": result["similarity"],
+                    "matched_criteria": result["matched_criteria"],
+                    "date": date.today().isoformat(),
+                })
+                save_prefiltered_jobs(prefiltered_jobs)
+        return False
 
-        job_to_review = random.choice(unprocessed_jobs)
-        job_id = job_to_review["id"]
+    @staticmethod
+    def _canonical_id(job):
+        duplicate_of = job.get("duplicate_of")
+        return duplicate_of if duplicate_of is not None else job["id"]
 
-        print(f"Reviewing job {job_id}...")
-        job_details = extract_job_details(job_to_review["job_link"])
-        if not job_details:
-            print(f"Failed to retrieve details for job {job_id}. Skipping.")
-            return
+    def _inherit_review(self, job):
+        """
+        Copie la review déjà faite pour une offre du même groupe de quasi-doublons
+        (l'offre canonique ou un autre de ses doublons), sans appel LLM.
+
+        Returns:
+            La review héritée, ou None si aucune offre du groupe n'a encore été reviewée
+        """
+        group_review = self.group_reviews.get(self._canonical_id(job))
+        if group_review is None:
+            return None
+        source_id = group_review["id"]
 
-        review = review_agent(job_to_review, job_details, model, with_correction, reasoning_level)
+        review = {
+            **group_review,
+            "id": job["id"],
+            "duplicate_of": source_id,
+            "metadata": {
+                **(group_review.get("metadata") or {}),
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_tokens": 0,
+                "total_cost": 0.0,
+                "execution_time": 0.0,
+                "inherited_from": source_id,
+            },
+        }
+        self._save_review(job, review)
+        print(f"🔗 Job {job['id']} is a near-duplicate of job {source_id}: review copied.")
+        return review
 
-        self.reviews.append(review)
-        self.processed_job_ids.add(job_id)
+    def _next_job(self, popped):
+        """
+        Retire le prochain job de la file avec `popped` et récupère ses détails,
+        en copiant la review des quasi-doublons et en passant les jobs écartés par le pré-filtre.
 
-        save_reviews(self.reviews)
-        save_processed_jobs(list(self.processed_job_ids))
+        Returns:
+            (job, job_details), (job, None) si les détails n'ont pas pu être récupérés,
+            ou (None, None) s'il n'y a plus de job à reviewer.
+        """
+        while True:
+            job = popped.pop()
+            if job is None:
+                return popped.pop_deferred()
+            if job["id"] in self.processed_job_ids:
+                continue
+            if self._inherit_review(job) is not None:
+                continue
+            job_details = self._fetch_job_details(job)
+            if job_details is None or self._passes_prefilter(job, job_details):
+                return job, job_details
 
-        print(f"Review for job {job_id} saved.")
+    def _review_and_save(self, job, job_details, model, with_correction, reasoning_level):
+        review = review_agent(job, job_details, model, with_correction, reasoning_level)
+        apply_saved_weights([review])
+        self._save_review(job, review)
+        print(f"Review for job {job['id']} saved.")
         return review
 
-    def review_next_latest(self, model, with_correction=True, reasoning_level=None):
-        unprocessed_jobs = self._get_unprocessed_jobs()
-        if not unprocessed_jobs:
-            print("All jobs have been reviewed.")
-            return
+    def _save_review(self, job, review):
+        self.group_reviews.setdefault(self._canonical_id(job), review)
+        render_synthesis(review)
+        # Relecture sous verrou : d'autres workers ont pu enregistrer des reviews entre-temps
+        with _SAVE_LOCK:
+            self.reviews = load_reviews()
+            self.reviews.append(review)
+            self.processed_job_ids.update(load_processed_jobs())
+            self.processed_job_ids.add(job["id"])
+
+            save_reviews(self.reviews)
+            save_processed_jobs(list(self.processed_job_ids))
+        publish(REVIEW_SAVED, review=review)
+
+    def review_random_job(self, model, with_correction=True, reasoning_level=None):
+        with _PoppedJobs(self, self.queue.pop_random) as popped:
+            job_to_review, job_details = self._next_job(popped)
+            if job_to_review is None:
+                print("All jobs have been reviewed.")
+                return
+            if job_details is None:
+                return
+
+            print(f"Reviewing job {job_to_review['id']}...")
+            return self._review_and_save(job_to_review, job_details, model, with_correction, reasoning_level)
 
+    def review_next_latest(self, model, with_correction=True, reasoning_level=None):
         # Pick most recent by highest id
-        job_to_review = sorted(unprocessed_jobs, key=lambda j: j.get("id", 0), reverse=True)[0]
-        job_id = job_to_review["id"]
+        with _PoppedJobs(self, self.queue.pop_latest) as popped:
+            job_to_review, job_details = self._next_job(popped)
+            if job_to_review is None:
+                print("All jobs have been reviewed.")
+                return
+            if job_details is None:
+                return
 
-        print(f"Reviewing job {job_id} (latest-first)...")
-        job_details = extract_job_details(job_to_review["job_link"])
-        if not job_details:
-            print(f"Failed to retrieve details for job {job_id}. Skipping.")
-            return
+            print(f"Reviewing job {job_to_review['id']} (latest-first)...")
+            return self._review_and_save(job_to_review, job_details, model, with_correction, reasoning_level)
 
-        review = review_agent(job_to_review, job_details, model, with_correction, reasoning_level)
+    def review_next_priority(self, model, with_correction=True, reasoning_level=None):
+        # Pick highest priority, most recent first among equal priorities
+        with _PoppedJobs(self, self.queue.pop_priority) as popped:
+            job_to_review, job_details = self._next_job(popped)
+            if job_to_review is None:
+                print("All jobs have been reviewed.")
+                return
+            if job_details is None:
+                return
 
-        self.reviews.append(review)
-        self.processed_job_ids.add(job_id)
+            print(f"Reviewing job {job_to_review['id']} (priority {self.queue.get_priority(job_to_review['id'])})...")
+            return self._review_and_save(job_to_review, job_details, model, with_correction, reasoning_level)
 
-        save_reviews(self.reviews)
-        save_processed_jobs(list(self.processed_job_ids))
+    def review_pipelined(
+        self,
+        n: int,
+        model: str,
+        with_correction=True,
+        reasoning_level=None,
+        order: str = "random",
+        prefetch: int = DEFAULT_PREFETCH,
+        llm_workers: int = DEFAULT_LLM_WORKERS,
+        progress_callback=None,
+    ):
+        """
+        Reviewe jusqu'à n jobs en recouvrant la récupération des détails et les appels LLM.
 
-        print(f"Review for job {job_id} saved.")
-        return review
+        Les détails des `prefetch` prochains jobs sont récupérés pendant que jusqu'à
+        `llm_workers` reviews sont en cours. Un job dont les détails n'ont pas pu être
+        récupérés est passé. Les quasi-doublons d'un job en cours de review attendent sa
+        fin pour hériter de sa review. Les jobs retirés de la file mais non enregistrés
+        (détails introuvables, appel LLM en échec, annulation) y retournent en fin de passe.
+        La passe s'arrête après MAX_CONSECUTIVE_FAILURES récupérations ou appels LLM
+        en échec d'affilée (page refusée, clé d'API invalide, quota épuisé...).
+
+        Args:
+            order: "random", "latest" ou "priority"
+            progress_callback: Optionnel, appelé avec (nombre de reviews enregistrées, review)
+
+        Returns:
+            La liste des reviews enregistrées (héritées comprises)
+        """
+        pops = {"random": self.queue.pop_random, "latest": self.queue.pop_latest, "priority": self.queue.pop_priority}
+        if order not in pops:
+            raise ValueError(f"Unknown review order: {order}")
+        popped = _PoppedJobs(self, pops[order])
+
+        saved = []
+        fetching = {}  # future -> job
+        reviewing = {}  # future -> job
+        ready = []  # (job, job_details) en attente d'un appel LLM
+        in_flight_groups = set()
+        postponed = []  # doublons d'un job en cours de review
+        queue_exhausted = False
+        fetch_failures = _FailureBudget("fetch")
+        review_failures = _FailureBudget("review")
+
+        def aborted():
+            return fetch_failures.exhausted or review_failures.exhausted
+
+        def record(review):
+            saved.append(review)
+            if progress_callback:
+                progress_callback(len(saved), review)
+
+        def started():
+            return len(saved) + len(reviewing) + len(ready) + len(fetching)
+
+        def next_candidate():
+            """Prochain job à récupérer : doublons en attente d'abord, puis la file."""
+            nonlocal queue_exhausted
+            for i, job in enumerate(postponed):
+                if self._canonical_id(job) not in in_flight_groups:
+                    return postponed.pop(i)
+            while not queue_exhausted:
+                job = popped.pop()
+                if job is None:
+                    queue_exhausted = True
+                elif job["id"] not in self.processed_job_ids:
+                    return job
+            return None
+
+        # Doublons restés en attente et jobs non enregistrés retournent dans la file à la sortie
+        with popped, ThreadPoolExecutor(max_workers=prefetch) as fetch_pool, ThreadPoolExecutor(max_workers=llm_workers) as llm_pool:
+            while True:
+                # Remplir la fenêtre de préchargement
+                while not aborted() and started() < n and len(fetching) + len(ready) < prefetch:
+                    job = next_candidate()
+                    if job is None:
+                        break
+                    if self._canonical_id(job) in in_flight_groups:
+                        postponed.append(job)
+                        continue
+                    review = self._inherit_review(job)
+                    if review is not None:
+                        record(review)
+                        continue
+                    in_flight_groups.add(self._canonical_id(job))
+                    fetching[fetch_pool.submit(self._fetch_job_details, job)] = job
+
+                # Une fois la file épuisée, reviewer les jobs relégués par le pré-filtre
+                if not aborted() and not fetching and not ready and not reviewing and started() < n:
+                    job, job_details = popped.pop_deferred()
+                    if job is not None:
+                        ready.append((job, job_details))
+
+                # Lancer les appels LLM
+                while ready and not aborted() and len(reviewing) < llm_workers:
+                    job, job_details = ready.pop(0)
+                    print(f"Reviewing job {job['id']}...")
+                    future = llm_pool.submit(review_agent, job, job_details, model, with_correction, reasoning_level)
+                    reviewing[future] = job
+
+                if not fetching and not reviewing:
+                    break
+
+                done, _ = wait(list(fetching) + list(reviewing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        job = fetching.pop(future)
+                        try:
+                            job_details = future.result()
+                        except Exception as e:
+                            print(f"Failed to retrieve details for job {job['id']}: {e}. Skipping.")
+                            job_details = None
+                        fetch_failures.record(job_details is not None)
+                        if job_details is not None and self._passes_prefilter(job, job_details):
+                            ready.append((job, job_details))
+                        else:
+                            in_flight_groups.discard(self._canonical_id(job))
+                    else:
+                        job = reviewing.pop(future)
+                        in_flight_groups.discard(self._canonical_id(job))
+                        try:
+                            review = future.result()
+                        except Exception as e:
+                            # Le job retourne dans la file en fin de passe
+                            print(f"Review of job {job['id']} failed: {e}. Skipping.")
+                            review_failures.record(False)
+                            continue
+                        review_failures.record(True)
+                        apply_saved_weights([review])
+                        self._save_review(job, review)
+                        print(f"Review for job {job['id']} saved.")
+                        record(review)
+        fetch_failures.report()
+        review_failures.report()
+        return saved
+
+    def _collect_wave(self, popped, count, postponed, record, fetch_failures):
+        """
+        Sélectionne une vague d'au plus `count` jobs à reviewer ensemble, sans deux offres
+        du même groupe de doublons, et récupère leurs détails en parallèle.
+        Les doublons déjà reviewés héritent de leur review (passée à `record`).
+        Chaque récupération est comptée dans `fetch_failures` (un `_FailureBudget`).
+
+        Returns:
+            (liste de (job, job_details), doublons à reprendre à la vague suivante),
+            ou (None, postponed) s'il ne reste plus aucun job
+        """
+        candidates, groups = [], set()
+        pending, postponed = postponed, []
+        while len(candidates) < count:
+            job = pending.pop(0) if pending else popped.pop()
+            if job is None:
+                break
+            if job["id"] in self.processed_job_ids:
+                continue
+            review = self._inherit_review(job)
+            if review is not None:
+                record(review)
+                count -= 1
+                continue
+            if self._canonical_id(job) in groups:
+                postponed.append(job)
+                continue
+            groups.add(self._canonical_id(job))
+            candidates.append(job)
+        postponed = pending + postponed
+
+        ready = []
+        with ThreadPoolExecutor(max_workers=DEFAULT_PREFETCH) as fetch_pool:
+            for job, job_details in zip(candidates, fetch_pool.map(self._fetch_job_details, candidates)):
+                fetch_failures.record(job_details is not None)
+                if job_details is not None and self._passes_prefilter(job, job_details):
+                    ready.append((job, job_details))
+
+        # File épuisée : reviewer les jobs relégués par le pré-filtre
+        if not candidates and not postponed:
+            while len(ready) < count:
+                job, job_details = popped.pop_deferred()
+                if job is None:
+                    break
+                ready.append((job, job_details))
+            if not ready:
+                return None, postponed
+        return ready, postponed
+
+    def review_batched(
+        self,
+        n: int,
+        model: str,
+        with_correction=True,
+        reasoning_level=None,
+        order: str = "random",
+        max_batch_size: int = MAX_BATCH_SIZE,
+        progress_callback=None,
+    ):
+        """
+        Reviewe jusqu'à n jobs en regroupant plusieurs offres par requête LLM.
+
+        Les jobs sont retirés de la file par vagues, leurs détails récupérés en parallèle,
+        puis découpés en lots adaptés au contexte du modèle (voir `plan_batches`).
+        La passe s'arrête après MAX_CONSECUTIVE_FAILURES récupérations en échec d'affilée.
+
+        Args:
+            order: "random", "latest" ou "priority"
+            max_batch_size: Nombre maximal d'offres par requête
+            progress_callback: Optionnel, appelé avec (nombre de reviews enregistrées, review)
+
+        Returns:
+            La liste des reviews enregistrées (héritées comprises)
+        """
+        pops = {"random": self.queue.pop_random, "latest": self.queue.pop_latest, "priority": self.queue.pop_priority}
+        if order not in pops:
+            raise ValueError(f"Unknown review order: {order}")
+
+        saved = []
+        postponed = []  # doublons d'une offre du lot en cours
+        fetch_failures = _FailureBudget("fetch")
+
+        def record(review):
+            saved.append(review)
+            if progress_callback:
+                progress_callback(len(saved), review)
+
+        # Doublons restés en attente et jobs non enregistrés retournent dans la file à la sortie
+        with _PoppedJobs(self, pops[order]) as popped:
+            while len(saved) < n and not fetch_failures.exhausted:
+                ready, postponed = self._collect_wave(popped, n - len(saved), postponed, record, fetch_failures)
+                if ready is None:
+                    break
+                jobs = [job for job, _ in ready]
+                jobs_details = [job_details for _, job_details in ready]
+                for batch in plan_batches(jobs, jobs_details, model, with_correction, max_batch_size):
+                    print(f"Reviewing jobs {[jobs[i]['id'] for i in batch]} in one request...")
+                    reviews = review_batch([jobs[i] for i in batch], [jobs_details[i] for i in batch], model, with_correction, reasoning_level)
+                    for i, review in zip(batch, reviews):
+                        apply_saved_weights([review])
+                        self._save_review(jobs[i], review)
+                        print(f"Review for job {jobs[i]['id']} saved.")
+                        record(review)
+        fetch_failures.report()
+        return saved
+
+    def review_offline(
+        self,
+        n: int,
+        model: str,
+        with_correction=True,
+        reasoning_level=None,
+        order: str = "random",
+        provider=None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        Reviewe jusqu'à n jobs via l'API de batch du fournisseur (voir batch_api) :
+        les requêtes sont soumises en une fois, à prix réduit, et le résultat est attendu.
+        Les jobs dont la requête a échoué retournent dans la file. Un batch interrompu par
+        un redémarrage se reprend avec `batch_api.resume_review_batch`.
+
+        Returns:
+            La liste des reviews enregistrées (héritées comprises)
+        """
+        pops = {"random": self.queue.pop_random, "latest": self.queue.pop_latest, "priority": self.queue.pop_priority}
+        if order not in pops:
+            raise ValueError(f"Unknown review order: {order}")
+
+        saved = []
+        # Doublons en attente et jobs sans résultat retournent dans la file à la sortie
+        with _PoppedJobs(self, pops[order]) as popped:
+            ready, _ = self._collect_wave(popped, n, [], saved.append, _FailureBudget("fetch"))
+            if ready:
+                jobs = [job for job, _ in ready]
+                results = run_offline_reviews(
+                    jobs, [job_details for _, job_details in ready], model, with_correction, reasoning_level,
+                    provider=provider, poll_interval=poll_interval,
+                )
+                saved += self.save_offline_reviews(jobs, results)
+                print(f"Offline batch done: {len(saved)} reviews saved.")
+        return saved
+
+    def save_offline_reviews(self, jobs, results):
+        """
+        Enregistre les reviews d'un batch hors ligne comme les autres modes
+        (pondération, synthèse, reviews.json, jobs traités, événement REVIEW_SAVED).
+
+        Args:
+            jobs: Jobs du batch
+            results: job_id -> review, tel que retourné par `wait_for_review_batch`
+
+        Returns:
+            La liste des reviews enregistrées (les jobs déjà traités sont ignorés)
+        """
+        saved = []
+        for job in jobs:
+            review = results.get(job["id"])
+            if review is None:
+                print(f"⚠️  No result for job {job['id']} in the offline batch.")
+                continue
+            if job["id"] in self.processed_job_ids:
+                continue
+            apply_saved_weights([review])
+            self._save_review(job, review)
+            saved.append(review)
+        return saved
 
     def review_n_jobs(self, n: int, model: str, with_correction=True, reasoning_level=None):
         for i in range(n):
@@ -86,4 +583,4 @@ class JobReviewer:
 
 if __name__ == "__main__":
     reviewer = JobReviewer()
-    reviewer.review_n_jobs(300, "gpt-4.1")
+    reviewer.review_pipelined(300, "gpt-4.1")
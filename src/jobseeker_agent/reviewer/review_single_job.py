@@ -1,6 +1,8 @@
 from jobseeker_agent.utils.paths import load_raw_job
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.scraper.descriptions import compact_job_details
 from jobseeker_agent.reviewer.agents.reviewer import review
+from jobseeker_agent.reviewer.synthesis import render_synthesis
 from jobseeker_agent.utils.paths import save_reviews, load_reviews
 
 
@@ -11,7 +13,9 @@ def review_single_job(job_id: int):
         print(f"No job found for ID {job_id}")
         return
     job_details = extract_job_details(job["job_link"])
+    job_details = compact_job_details(job, job_details)
     result = review(job, job_details)
+    render_synthesis(result)
     reviews = load_reviews()
     reviews.append(result)
     save_reviews(reviews)
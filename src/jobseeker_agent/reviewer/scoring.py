@@ -0,0 +1,182 @@
+"""
+Recalcul des scores des reviews à partir de leurs grilles d'évaluation.
+
+Le score d'une review est la somme des scores des critères détectés par le LLM,
+avec les poids écrits dans le prompt. Ce module sépare les détections (stockées
+dans `evaluation_grid`) des poids, et recalcule les scores de toutes les reviews
+sous un nouveau vecteur de poids, sans appel LLM :
+
+    score = intensité (jobs × critères) @ poids (critères)
+
+où l'intensité d'un critère est le score donné par le LLM divisé par le poids du
+prompt (1 en général, 1.5 pour "+1 more if..." sur le critère 3, 0.5 pour la
+variante "secondaire" du critère 4...).
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from jobseeker_agent.utils.paths import load_criteria_weights
+
+
+REVIEWER_PROMPT_PATH = Path(__file__).resolve().parent / "agents" / "reviewer.md"
+
+# "- [12] Requires a PhD ...: (+1.5)" -> (12, "+1.5") ; le premier (±x) de la ligne est le poids
+_CRITERION_LINE = re.compile(r"^- \[(\d+)\]\s*(.*?)\(([+-]\d+(?:\.\d+)?)", re.MULTILINE)
+
+_DEFAULT_WEIGHTS: Optional[Dict[int, float]] = None
+
+
+def parse_prompt_weights(prompt: str) -> Dict[int, float]:
+    """Extrait les poids des critères de la grille d'un prompt."""
+    return {int(cid): float(weight) for cid, _, weight in _CRITERION_LINE.findall(prompt)}
+
+
+def get_default_weights() -> Dict[int, float]:
+    """Poids des critères tels qu'écrits dans le prompt du reviewer."""
+    global _DEFAULT_WEIGHTS
+    if _DEFAULT_WEIGHTS is None:
+        _DEFAULT_WEIGHTS = parse_prompt_weights(REVIEWER_PROMPT_PATH.read_text(encoding="utf-8"))
+    return _DEFAULT_WEIGHTS
+
+
+def get_criteria_weights() -> Dict[int, float]:
+    """Poids effectifs : ceux du prompt, surchargés par les poids enregistrés."""
+    return {**get_default_weights(), **load_criteria_weights()}
+
+
+@dataclass
+class ScoringMatrix:
+    """
+    Intensités des critères détectés pour un ensemble de reviews.
+
+    - intensity[j, k]: score du LLM pour le critère k du job j, divisé par le poids de référence
+    - reference_weights[k]: poids du prompt (1 pour les critères inconnus ou de poids nul,
+      l'intensité est alors le score lui-même)
+    - scores[j]: score actuel de la review
+    """
+    job_ids: List[int]
+    criteria_ids: List[int]
+    intensity: np.ndarray
+    reference_weights: np.ndarray
+    scores: np.ndarray
+
+    def weight_vector(self, weights: Dict[int, float]) -> np.ndarray:
+        """Vecteur de poids aligné sur les critères ; les critères absents gardent leur poids de référence."""
+        return np.array([
+            weights.get(cid, self.reference_weights[k]) for k, cid in enumerate(self.criteria_ids)
+        ], dtype=float)
+
+
+def build_scoring_matrix(
+    reviews: List[Dict[str, Any]],
+    reference_weights: Optional[Dict[int, float]] = None
+) -> ScoringMatrix:
+    """Construit la matrice des intensités à partir des grilles d'évaluation des reviews."""
+    if reference_weights is None:
+        reference_weights = get_default_weights()
+
+    job_ids = [int(r["id"]) for r in reviews]
+    criteria_ids = sorted(
+        set(reference_weights)
+        | {int(c["id"]) for r in reviews for c in r.get("evaluation_grid") or []}
+    )
+    criterion_index = {cid: k for k, cid in enumerate(criteria_ids)}
+
+    rows, cols, values = [], [], []
+    for j, review in enumerate(reviews):
+        for criterion in review.get("evaluation_grid") or []:
+            rows.append(j)
+            cols.append(criterion_index[int(criterion["id"])])
+            values.append(float(criterion.get("score") or 0))
+
+    reference = np.array([reference_weights.get(cid) or 1.0 for cid in criteria_ids], dtype=float)
+    intensity = np.zeros((len(job_ids), len(criteria_ids)))
+    # add.at : un critère listé deux fois dans une grille compte deux fois, comme dans la somme du LLM
+    np.add.at(intensity, (rows, cols), np.asarray(values) / reference[cols])
+
+    scores = np.array([float(r.get("score") or 0) for r in reviews])
+    return ScoringMatrix(job_ids, criteria_ids, intensity, reference, scores)
+
+
+def rescore(matrix: ScoringMatrix, weights: Dict[int, float]) -> np.ndarray:
+    """Recalcule les scores de tous les jobs sous un vecteur de poids."""
+    return matrix.intensity @ matrix.weight_vector(weights)
+
+
+def rank(scores: np.ndarray) -> np.ndarray:
+    """Rang (0 = premier) de chaque job dans un classement par score décroissant, comme le dashboard."""
+    order = np.argsort(-scores, kind="stable")
+    ranks = np.empty(len(scores), dtype=int)
+    ranks[order] = np.arange(len(scores))
+    return ranks
+
+
+def what_if(
+    reviews: List[Dict[str, Any]],
+    weights: Dict[int, float],
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compare le classement actuel des reviews à celui obtenu avec de nouveaux poids.
+
+    Args:
+        reviews: Reviews classées (avec 'id', 'score', 'evaluation_grid')
+        weights: Poids à tester (les critères absents gardent leur poids du prompt)
+        limit: Nombre de jobs à retourner (top du nouveau classement)
+
+    Returns:
+        Dict avec 'jobs' (triés par nouveau rang) et 'moved' (nombre de jobs qui changent de rang)
+    """
+    matrix = build_scoring_matrix(reviews)
+    new_scores = rescore(matrix, weights)
+    old_ranks = rank(matrix.scores)
+    new_ranks = rank(new_scores)
+
+    order = np.argsort(new_ranks)[:limit]
+    jobs = [
+        {
+            "id": matrix.job_ids[j],
+            "title": reviews[j].get("title"),
+            "company": reviews[j].get("company"),
+            "old_score": float(matrix.scores[j]),
+            "new_score": float(new_scores[j]),
+            "old_rank": int(old_ranks[j]) + 1,
+            "new_rank": int(new_ranks[j]) + 1,
+            "rank_change": int(old_ranks[j] - new_ranks[j]),
+        }
+        for j in order
+    ]
+    return {"jobs": jobs, "moved": int((old_ranks != new_ranks).sum())}
+
+
+def apply_weights(reviews: List[Dict[str, Any]], weights: Dict[int, float]) -> int:
+    """
+    Remplace le score des reviews par leur score recalculé avec les poids donnés.
+
+    Le score d'origine du LLM est conservé dans 'llm_score' au premier recalcul.
+
+    Returns:
+        Nombre de reviews dont le score a changé
+    """
+    if not reviews:
+        return 0
+    new_scores = rescore(build_scoring_matrix(reviews), weights)
+    changed = 0
+    for review, new_score in zip(reviews, new_scores.tolist()):
+        review.setdefault("llm_score", review.get("score"))
+        if review.get("score") != new_score:
+            changed += 1
+        review["score"] = new_score
+    return changed
+
+
+def apply_saved_weights(reviews: List[Dict[str, Any]]) -> int:
+    """Recalcule le score des reviews si des poids personnalisés ont été enregistrés."""
+    if not load_criteria_weights():
+        return 0
+    return apply_weights(reviews, get_criteria_weights())
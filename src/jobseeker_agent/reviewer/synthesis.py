@@ -0,0 +1,79 @@
+"""
+Rendu HTML de la synthèse des reviews (champ "synthesis_and_decision").
+
+Le Markdown est converti une seule fois, à l'écriture de la review : le HTML est
+stocké dans la review ("synthesis_html") avec le hash du Markdown source
+("synthesis_hash"). Le dashboard sert le HTML stocké tant que le hash correspond.
+
+Usage (rendu des reviews existantes) :
+    python -m jobseeker_agent.reviewer.synthesis
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from jobseeker_agent.utils.paths import load_reviews, save_reviews
+
+
+SYNTHESIS_FIELD = "synthesis_and_decision"
+HTML_FIELD = "synthesis_html"
+HASH_FIELD = "synthesis_hash"
+
+
+def synthesis_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def markdown_to_html(text: str) -> str:
+    # Import local : markdown n'est nécessaire qu'en présence d'une synthèse
+    import markdown
+    return markdown.markdown(text)
+
+
+def render_synthesis(review: Dict[str, Any]) -> bool:
+    """
+    Stocke le HTML de la synthèse dans la review si elle n'est pas déjà rendue.
+
+    Returns:
+        True si la review a été modifiée
+    """
+    text = review.get(SYNTHESIS_FIELD)
+    if not text:
+        return False
+    digest = synthesis_hash(text)
+    if review.get(HASH_FIELD) == digest and HTML_FIELD in review:
+        return False
+    review[HTML_FIELD] = markdown_to_html(text)
+    review[HASH_FIELD] = digest
+    return True
+
+
+def get_synthesis_html(review: Dict[str, Any]) -> Optional[str]:
+    """HTML stocké de la synthèse, ou None s'il est absent ou périmé (Markdown modifié depuis)."""
+    text = review.get(SYNTHESIS_FIELD)
+    if not text or HTML_FIELD not in review:
+        return None
+    if review.get(HASH_FIELD) != synthesis_hash(text):
+        return None
+    return review[HTML_FIELD]
+
+
+def backfill_synthesis_html(reviews: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    Rend la synthèse des reviews existantes et les sauvegarde.
+
+    Returns:
+        Nombre de reviews mises à jour
+    """
+    save = reviews is None
+    if reviews is None:
+        reviews = load_reviews()
+    updated = sum(render_synthesis(review) for review in reviews)
+    if save and updated:
+        save_reviews(reviews)
+    return updated
+
+
+if __name__ == "__main__":
+    updated = backfill_synthesis_html()
+    print(f"✅ {updated} review syntheses rendered to HTML.")
@@ -0,0 +1,198 @@
+"""
+File des jobs à reviewer.
+
+Maintient l'ensemble des jobs reviewables (ouverts et pas encore traités) et
+permet d'en retirer un au hasard, le plus récent, ou le plus prioritaire, en
+O(1) / O(log n), sans reconstruire la liste des jobs non traités à chaque appel.
+La file est construite une fois puis tenue à jour par les événements d'ingestion,
+de fermeture et de review ; plusieurs workers peuvent la consommer en parallèle.
+Les priorités sont persistées sur disque. Les jobs relégués par le pré-filtre
+restent dans la file, à part, et ne sont servis qu'une fois les autres épuisés.
+"""
+
+import heapq
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from jobseeker_agent.utils.events import JOB_ADDED, JOB_CLOSED, REVIEW_SAVED, subscribe
+from jobseeker_agent.utils.paths import (
+    load_processed_jobs,
+    load_raw_jobs,
+    load_review_priorities,
+    save_review_priorities,
+)
+
+
+class ReviewQueue:
+    """
+    Ensemble des jobs à reviewer, avec trois ordres de sortie.
+
+    - aléatoire : liste + index des positions (retrait par échange avec le dernier élément)
+    - plus récent d'abord : tas sur l'id décroissant
+    - priorité : tas sur (priorité, id) décroissants
+
+    Les tas utilisent la suppression paresseuse : une entrée dont le job n'est plus
+    dans la file (ou dont la priorité a changé) est ignorée au moment du pop.
+    Les jobs relégués ne sont servis que par `pop_deferred`, et ne comptent pas dans len().
+    """
+
+    def __init__(self, jobs: Optional[List[Dict[str, Any]]] = None, priorities: Optional[Dict[int, float]] = None):
+        self._lock = threading.Lock()
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        self._ids: List[int] = []
+        self._positions: Dict[int, int] = {}
+        self._latest_heap: List[int] = []
+        self._priority_heap: List[tuple] = []
+        self._priorities: Dict[int, float] = dict(priorities or {})
+        # Jobs relégués par le pré-filtre : job_id -> (score, job, job_details)
+        self._deferred: Dict[int, tuple] = {}
+        for job in jobs or []:
+            self._add(job)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, job_id: int) -> bool:
+        return job_id in self._jobs or job_id in self._deferred
+
+    def _add(self, job: Dict[str, Any]) -> None:
+        job_id = job["id"]
+        if job_id in self._jobs:
+            self._jobs[job_id] = job
+            return
+        if job_id in self._deferred:
+            return
+        self._jobs[job_id] = job
+        self._positions[job_id] = len(self._ids)
+        self._ids.append(job_id)
+        heapq.heappush(self._latest_heap, -job_id)
+        heapq.heappush(self._priority_heap, (-self._priorities.get(job_id, 0.0), -job_id))
+
+    def _remove(self, job_id: int) -> Optional[Dict[str, Any]]:
+        self._deferred.pop(job_id, None)
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        # Retrait O(1) de la liste : le dernier élément prend la place du job retiré
+        position = self._positions.pop(job_id)
+        last_id = self._ids.pop()
+        if last_id != job_id:
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+        self._compact_heaps()
+        return job
+
+    def _compact_heaps(self) -> None:
+        """Reconstruit les tas quand les entrées périmées dominent."""
+        if len(self._latest_heap) > 2 * len(self._ids) + 64:
+            self._latest_heap = [-job_id for job_id in self._ids]
+            heapq.heapify(self._latest_heap)
+        if len(self._priority_heap) > 2 * len(self._ids) + 64:
+            self._priority_heap = [(-self._priorities.get(job_id, 0.0), -job_id) for job_id in self._ids]
+            heapq.heapify(self._priority_heap)
+
+    def add(self, job: Dict[str, Any]) -> None:
+        """Ajoute un job reviewable (ignoré s'il est fermé)."""
+        if job.get("status") == "Closed":
+            return
+        with self._lock:
+            self._add(job)
+
+    def remove(self, job_id: int) -> None:
+        """Retire un job de la file (reviewé, fermé...)."""
+        with self._lock:
+            self._remove(job_id)
+
+    def pop_random(self) -> Optional[Dict[str, Any]]:
+        """Retire et retourne un job au hasard, ou None si la file est vide."""
+        with self._lock:
+            if not self._ids:
+                return None
+            return self._remove(random.choice(self._ids))
+
+    def pop_latest(self) -> Optional[Dict[str, Any]]:
+        """Retire et retourne le job le plus récent (id le plus élevé)."""
+        with self._lock:
+            while self._latest_heap:
+                job_id = -heapq.heappop(self._latest_heap)
+                if job_id in self._jobs:
+                    return self._remove(job_id)
+            return None
+
+    def pop_priority(self) -> Optional[Dict[str, Any]]:
+        """Retire et retourne le job de plus haute priorité (le plus récent à priorité égale)."""
+        with self._lock:
+            while self._priority_heap:
+                negative_priority, negative_id = heapq.heappop(self._priority_heap)
+                job_id = -negative_id
+                if job_id in self._jobs and -negative_priority == self._priorities.get(job_id, 0.0):
+                    return self._remove(job_id)
+            return None
+
+    def defer(self, job: Dict[str, Any], score: float, job_details: Optional[Dict[str, Any]] = None) -> None:
+        """Relègue un job écarté par le pré-filtre, avec ses détails déjà récupérés (ignoré s'il est fermé)."""
+        if job.get("status") == "Closed":
+            return
+        with self._lock:
+            self._remove(job["id"])
+            self._deferred[job["id"]] = (score, job, job_details)
+
+    def pop_deferred(self) -> tuple:
+        """Retire et retourne (job, job_details) du job relégué le mieux noté, ou (None, None)."""
+        with self._lock:
+            if not self._deferred:
+                return None, None
+            job_id = max(self._deferred, key=lambda j: self._deferred[j][0])
+            _, job, job_details = self._deferred.pop(job_id)
+            return job, job_details
+
+    def set_priority(self, job_id: int, priority: float) -> None:
+        """Change la priorité d'un job (persistée)."""
+        with self._lock:
+            self._priorities[job_id] = priority
+            if job_id in self._jobs:
+                heapq.heappush(self._priority_heap, (-priority, -job_id))
+            priorities = dict(self._priorities)
+        save_review_priorities(priorities)
+
+    def get_priority(self, job_id: int) -> float:
+        return self._priorities.get(job_id, 0.0)
+
+
+_QUEUE_LOCK = threading.Lock()
+_QUEUE: Optional[ReviewQueue] = None
+
+
+def build_review_queue() -> ReviewQueue:
+    """Construit la file à partir des jobs bruts et des jobs déjà traités."""
+    processed_job_ids = set(load_processed_jobs())
+    jobs = [
+        job for job in load_raw_jobs()
+        if job["id"] not in processed_job_ids and job.get("status") != "Closed"
+    ]
+    return ReviewQueue(jobs, load_review_priorities())
+
+
+def _on_job_added(job: Dict[str, Any]) -> None:
+    _QUEUE.add(job)
+
+
+def _on_job_closed(job_id: int) -> None:
+    _QUEUE.remove(job_id)
+
+
+def _on_review_saved(review: Dict[str, Any]) -> None:
+    _QUEUE.remove(review["id"])
+
+
+def get_review_queue() -> ReviewQueue:
+    """Retourne la file partagée du processus, construite au premier appel puis tenue à jour par les événements."""
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            _QUEUE = build_review_queue()
+            subscribe(JOB_ADDED, _on_job_added)
+            subscribe(JOB_CLOSED, _on_job_closed)
+            subscribe(REVIEW_SAVED, _on_review_saved)
+        return _QUEUE
@@ -0,0 +1,234 @@
+"""
+Détection des offres quasi-dupliquées (MinHash + LSH).
+
+Une même offre est souvent republiée sous une nouvelle URL LinkedIn, dans une
+autre ville ou par un cabinet de recrutement. Ce module calcule une signature
+MinHash sur les shingles de la description (plus le titre et l'entreprise) et
+maintient un index LSH par bandes, mis à jour à l'ingestion. Une offre dont la
+similarité estimée avec une offre existante dépasse le seuil est rattachée à
+l'offre canonique (`duplicate_of`) et hérite de sa review.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from jobseeker_agent.scraper.descriptions import _shingles, _words, load_descriptions, split_paragraphs
+from jobseeker_agent.utils.paths import get_minhash_index_path
+
+
+# Nombre de permutations MinHash (longueur des signatures)
+NUM_PERMUTATIONS = 128
+# Découpage LSH : BANDS bandes de NUM_PERMUTATIONS // BANDS lignes.
+# Avec 16 bandes de 8 lignes, deux offres deviennent candidates à partir de ~70% de similarité.
+BANDS = 16
+# Similarité de Jaccard estimée à partir de laquelle deux offres sont des doublons
+DUPLICATE_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_ROWS = NUM_PERMUTATIONS // BANDS
+
+# Coefficients des permutations (a, b < 2^31 : a * x + b tient dans un uint64 pour x < 2^32)
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def job_shingles(job: Dict[str, Any], description: str) -> List[int]:
+    """Shingles d'une offre : n-grammes de mots de la description, du titre et de l'entreprise."""
+    shingles = set()
+    for paragraph in split_paragraphs(description):
+        shingles |= _shingles(_words(paragraph))
+    shingles |= _shingles(["title:"] + _words(job.get("title") or ""))
+    shingles |= _shingles(["company:"] + _words(job.get("company") or ""))
+    return sorted(shingles)
+
+
+def minhash_signature(shingles: Iterable[int]) -> np.ndarray:
+    """Signature MinHash (NUM_PERMUTATIONS valeurs) d'un ensemble de shingles hachés sur 32 bits."""
+    values = np.fromiter(shingles, dtype=np.uint64)
+    if len(values) == 0:
+        return np.full(NUM_PERMUTATIONS, _MAX_HASH, dtype=np.uint64)
+    hashed = (values[:, None] * _PERM_A[None, :] + _PERM_B[None, :]) % _MERSENNE_PRIME
+    return (hashed & _MAX_HASH).min(axis=0)
+
+
+def estimate_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Similarité de Jaccard estimée : part des permutations où les signatures coïncident."""
+    return float((signature_a == signature_b).mean())
+
+
+class MinHashIndex:
+    """Index LSH des signatures MinHash des offres."""
+
+    def __init__(self):
+        self.job_ids: List[int] = []
+        self._signatures: List[np.ndarray] = []
+        self._positions: Dict[int, int] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def __contains__(self, job_id: int) -> bool:
+        return job_id in self._positions
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[b * _ROWS:(b + 1) * _ROWS].tobytes() for b in range(BANDS)]
+
+    def add(self, job_id: int, signature: np.ndarray) -> None:
+        """Ajoute la signature d'une offre (ignorée si l'offre est déjà indexée)."""
+        if job_id in self._positions:
+            return
+        self._positions[job_id] = len(self.job_ids)
+        self.job_ids.append(job_id)
+        self._signatures.append(signature)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(job_id)
+
+    def query(self, signature: np.ndarray, threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[int, float]]:
+        """
+        Retourne les offres indexées dont la similarité estimée dépasse le seuil.
+
+        Returns:
+            Liste de (job_id, similarité), de la plus similaire à la moins similaire
+        """
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+        matches = []
+        for job_id in candidates:
+            similarity = estimate_similarity(signature, self._signatures[self._positions[job_id]])
+            if similarity >= threshold:
+                matches.append((job_id, similarity))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches
+
+    def signatures(self) -> np.ndarray:
+        """Matrice (offres, permutations) des signatures indexées."""
+        if not self._signatures:
+            return np.empty((0, NUM_PERMUTATIONS), dtype=np.uint64)
+        return np.stack(self._signatures)
+
+
+# Cache en mémoire de l'index
+_LOCK = threading.Lock()
+_INDEX: Optional[MinHashIndex] = None
+# Offres indexées depuis la dernière sauvegarde (register_job avec save=False)
+_DIRTY = False
+
+
+def load_minhash_index() -> MinHashIndex:
+    """Charge l'index depuis le disque (les buckets LSH sont reconstruits)."""
+    index = MinHashIndex()
+    path = get_minhash_index_path()
+    if not path.exists():
+        return index
+    with np.load(path) as data:
+        for job_id, signature in zip(data["job_ids"].tolist(), data["signatures"]):
+            index.add(job_id, signature)
+    return index
+
+
+def save_minhash_index(index: MinHashIndex) -> None:
+    """Sauvegarde les signatures de l'index."""
+    path = get_minhash_index_path()
+    with open(path, "wb") as f:
+        np.savez(f, job_ids=np.asarray(index.job_ids, dtype=np.int64), signatures=index.signatures())
+
+
+def _get_index() -> MinHashIndex:
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = load_minhash_index()
+    return _INDEX
+
+
+def register_job(
+    job: Dict[str, Any],
+    description: str,
+    jobs_by_id: Optional[Dict[int, Dict[str, Any]]] = None,
+    save: bool = True
+) -> Optional[Tuple[int, float]]:
+    """
+    Indexe une offre et cherche si elle duplique une offre déjà indexée.
+
+    Args:
+        job: Offre (au moins 'id', 'title', 'company')
+        description: Description de l'offre
+        jobs_by_id: Offres existantes, pour remonter au job canonique d'un doublon
+        save: Si False, ne réécrit pas l'index sur disque (ingestion en masse, suivie de `flush_minhash_index`)
+
+    Returns:
+        (id du job canonique, similarité), ou None si l'offre n'est pas un doublon
+    """
+    global _DIRTY
+    signature = minhash_signature(job_shingles(job, description))
+    with _LOCK:
+        index = _get_index()
+        matches = [m for m in index.query(signature) if m[0] != job["id"]]
+        index.add(job["id"], signature)
+        if save:
+            save_minhash_index(index)
+        _DIRTY = not save
+    if not matches:
+        return None
+
+    canonical_id, similarity = matches[0]
+    # Toujours rattacher à la racine du groupe de doublons
+    if jobs_by_id:
+        seen = set()
+        while jobs_by_id.get(canonical_id, {}).get("duplicate_of") is not None and canonical_id not in seen:
+            seen.add(canonical_id)
+            canonical_id = jobs_by_id[canonical_id]["duplicate_of"]
+    return canonical_id, similarity
+
+
+def flush_minhash_index() -> None:
+    """Écrit l'index sur disque s'il a reçu des offres depuis la dernière sauvegarde."""
+    global _DIRTY
+    with _LOCK:
+        if _INDEX is not None and _DIRTY:
+            save_minhash_index(_INDEX)
+            _DIRTY = False
+
+
+def rebuild_minhash_index() -> Tuple[int, int]:
+    """
+    Reconstruit l'index à partir de toutes les descriptions stockées, dans l'ordre
+    d'ingestion, et rattache les doublons qui ne l'étaient pas encore.
+
+    Returns:
+        (nombre d'offres indexées, nombre de doublons nouvellement rattachés)
+    """
+    # Import local : job_manager utilise ce module à l'ingestion
+    from jobseeker_agent.scraper.job_manager import load_raw_jobs, save_raw_jobs
+
+    global _INDEX, _DIRTY
+    jobs = load_raw_jobs()
+    jobs_by_id = {job["id"]: job for job in jobs}
+    index = MinHashIndex()
+    linked = 0
+    for job_id, entry in sorted(load_descriptions().items()):
+        job = jobs_by_id.get(job_id, entry)
+        signature = minhash_signature(job_shingles(job, entry["description"]))
+        matches = index.query(signature)
+        if matches and job_id in jobs_by_id and job.get("duplicate_of") is None:
+            canonical_id = matches[0][0]
+            job["duplicate_of"] = jobs_by_id.get(canonical_id, {}).get("duplicate_of", canonical_id) or canonical_id
+            linked += 1
+        index.add(job_id, signature)
+    if linked:
+        save_raw_jobs(jobs)
+    with _LOCK:
+        save_minhash_index(index)
+        _INDEX, _DIRTY = index, False
+    return len(index), linked
+
+
+if __name__ == "__main__":
+    count, linked = rebuild_minhash_index()
+    print(f"📋 Index MinHash reconstruit sur {count} descriptions")
+    print(f"🔗 {linked} doublons rattachés à leur offre canonique")
@@ -0,0 +1,388 @@
+"""
+Stockage local des descriptions d'offres et suppression du boilerplate.
+
+Les descriptions LinkedIn contiennent des blocs répétés d'une offre à l'autre
+(présentation de l'entreprise, clauses EEO, listes d'avantages...). Ce module
+construit un index de shingles sur les descriptions stockées et retire les
+paragraphes récurrents, chez une même entreprise ou dans tout le corpus, avant
+que la description ne soit envoyée aux LLMs.
+
+Chaque description enregistrée est ajoutée à un journal JSON Lines plutôt que de
+réécrire tout descriptions.json ; le journal est repris dans le fichier principal
+lorsqu'il dépasse JOURNAL_COMPACTION_SIZE entrées (ou par `flush_descriptions`).
+"""
+
+import json
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from jobseeker_agent.scraper.extract_job_details import extract_job_details
+from jobseeker_agent.utils.llm import estimate_tokens
+from jobseeker_agent.utils.paths import get_descriptions_json_path, get_descriptions_journal_path, load_raw_jobs
+
+
+# Taille des shingles (en mots)
+SHINGLE_SIZE = 5
+# Les paragraphes plus courts (titres de section, puces) sont toujours conservés
+MIN_PARAGRAPH_WORDS = 8
+# Part de shingles récurrents à partir de laquelle un paragraphe est du boilerplate
+RECURRING_SHINGLE_RATIO = 0.8
+# Un shingle est récurrent dans le corpus s'il apparaît chez au moins N entreprises
+MIN_CORPUS_COMPANIES = 5
+# Si la compaction retire plus que ça, on garde la description brute
+MIN_KEPT_RATIO = 0.25
+# Nombre d'entrées du journal au-delà duquel il est repris dans descriptions.json
+JOURNAL_COMPACTION_SIZE = 500
+
+_RECURRING = True
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Découpe une description en paragraphes (séparés par une ligne vide)."""
+    return [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _shingles(words: List[str]) -> Set[int]:
+    """Calcule les shingles (n-grammes de mots hachés) d'un paragraphe."""
+    if len(words) < SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(words).encode())} if words else set()
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def _normalize_key(value: Optional[str]) -> str:
+    return " ".join(_words(value or ""))
+
+
+class BoilerplateIndex:
+    """
+    Index de shingles sur les descriptions stockées.
+
+    Pour rester compact en mémoire, chaque shingle ne garde que le minimum
+    nécessaire : le premier intitulé vu (puis un marqueur "récurrent") au niveau
+    de l'entreprise, et l'ensemble des entreprises (puis un marqueur) au niveau
+    du corpus.
+    """
+
+    def __init__(self):
+        self._indexed_ids: Set[int] = set()
+        self._company_shingles: Dict[tuple, Any] = {}
+        self._corpus_shingles: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._indexed_ids)
+
+    def add(self, job_id: int, company: str, title: str, description: str) -> None:
+        """Ajoute une description à l'index (ignorée si le job est déjà indexé)."""
+        if job_id in self._indexed_ids:
+            return
+        self._indexed_ids.add(job_id)
+
+        company_key = _normalize_key(company)
+        title_key = _normalize_key(title)
+        shingles = set()
+        for paragraph in split_paragraphs(description):
+            shingles |= _shingles(_words(paragraph))
+
+        for shingle in shingles:
+            key = (company_key, shingle)
+            seen_title = self._company_shingles.get(key)
+            if seen_title is None:
+                self._company_shingles[key] = title_key
+            elif seen_title is not _RECURRING and seen_title != title_key:
+                # Un shingle est récurrent chez une entreprise dès qu'il apparaît sous un
+                # deuxième intitulé (les republications d'une même offre ne comptent pas)
+                self._company_shingles[key] = _RECURRING
+
+            companies = self._corpus_shingles.get(shingle)
+            if companies is None:
+                self._corpus_shingles[shingle] = {company_key}
+            elif companies is not _RECURRING:
+                companies.add(company_key)
+                if len(companies) >= MIN_CORPUS_COMPANIES:
+                    self._corpus_shingles[shingle] = _RECURRING
+
+    def is_recurring(self, company_key: str, shingle: int) -> bool:
+        """Indique si un shingle est récurrent chez l'entreprise ou dans le corpus."""
+        return (
+            self._company_shingles.get((company_key, shingle)) is _RECURRING
+            or self._corpus_shingles.get(shingle) is _RECURRING
+        )
+
+    def compact(self, company: str, description: str) -> str:
+        """Retire les paragraphes récurrents d'une description."""
+        company_key = _normalize_key(company)
+        kept = []
+        for paragraph in split_paragraphs(description):
+            words = _words(paragraph)
+            if len(words) < MIN_PARAGRAPH_WORDS:
+                kept.append(paragraph)
+                continue
+            shingles = _shingles(words)
+            recurring = sum(1 for s in shingles if self.is_recurring(company_key, s))
+            if recurring / len(shingles) < RECURRING_SHINGLE_RATIO:
+                kept.append(paragraph)
+
+        compacted = "\n\n".join(kept)
+        if len(compacted) < MIN_KEPT_RATIO * len(description):
+            # Probablement la même offre publiée sous un autre intitulé : on ne touche à rien
+            return description
+        return compacted
+
+
+# Cache en mémoire du fichier de descriptions et de l'index associé
+_LOCK = threading.Lock()
+_STORE: Optional[Dict[int, Dict[str, Any]]] = None
+_INDEX: Optional[BoilerplateIndex] = None
+# Entrées écrites dans le journal depuis la dernière sauvegarde complète
+_JOURNAL_SIZE = 0
+
+
+def load_descriptions() -> Dict[int, Dict[str, Any]]:
+    """Charge les descriptions stockées (fichier JSON puis entrées du journal).
+
+    Returns:
+        Dict[job_id] = entrée de description (brute, compactée, tokens, ...)
+    """
+    descriptions = {}
+    path = get_descriptions_json_path()
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                entries = json.load(f)
+            except json.JSONDecodeError:
+                entries = []
+        descriptions = {int(entry["id"]): entry for entry in entries}
+    for entry in _load_journal():
+        descriptions[int(entry["id"])] = entry
+    return descriptions
+
+
+def _load_journal() -> List[Dict[str, Any]]:
+    path = get_descriptions_journal_path()
+    if not path.exists():
+        return []
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Dernière ligne tronquée par un arrêt en cours d'écriture
+                continue
+    return entries
+
+
+def save_descriptions(descriptions: Dict[int, Dict[str, Any]]) -> None:
+    """Sauvegarde toutes les descriptions dans le fichier JSON et vide le journal."""
+    path = get_descriptions_json_path()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(list(descriptions.values()), f, indent=4, ensure_ascii=False)
+    get_descriptions_journal_path().unlink(missing_ok=True)
+
+
+def _append_description(entry: Dict[str, Any]) -> None:
+    """Ajoute une entrée au journal des descriptions."""
+    with open(get_descriptions_journal_path(), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def _get_store() -> Dict[int, Dict[str, Any]]:
+    """Retourne le cache des descriptions, en construisant l'index au premier appel."""
+    global _STORE, _INDEX, _JOURNAL_SIZE
+    if _STORE is None:
+        _STORE = load_descriptions()
+        _JOURNAL_SIZE = len(_load_journal())
+        _INDEX = BoilerplateIndex()
+        for entry in _STORE.values():
+            _INDEX.add(entry["id"], entry.get("company"), entry.get("title"), entry["description"])
+    return _STORE
+
+
+def get_stored_description(job_id: int) -> Optional[Dict[str, Any]]:
+    """Retourne l'entrée stockée pour un job, ou None si la description n'a jamais été récupérée."""
+    with _LOCK:
+        return _get_store().get(job_id)
+
+
+def record_description(job: Dict[str, Any], job_details: Dict[str, Any], save: bool = True) -> Dict[str, Any]:
+    """
+    Stocke la description brute d'un job et sa version compactée.
+
+    Args:
+        job: Job brut (au moins 'id', 'company', 'title')
+        job_details: Détails extraits de la page LinkedIn (au moins 'description')
+        save: Si False, n'écrit pas l'entrée sur disque (chargements en masse, suivis de `flush_descriptions`)
+
+    Returns:
+        L'entrée stockée
+    """
+    global _JOURNAL_SIZE
+    description = job_details["description"]
+    with _LOCK:
+        store = _get_store()
+        _INDEX.add(job["id"], job.get("company"), job.get("title"), description)
+        compact = _INDEX.compact(job.get("company"), description)
+        entry = {
+            "id": job["id"],
+            "company": job.get("company"),
+            "title": job.get("title"),
+            "description": description,
+            "compact_description": compact,
+            "raw_tokens": estimate_tokens(description),
+            "compact_tokens": estimate_tokens(compact),
+            "status": job_details.get("status"),
+            "workplace_type": job_details.get("workplace_type"),
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        store[job["id"]] = entry
+        if save:
+            _append_description(entry)
+            _JOURNAL_SIZE += 1
+            if _JOURNAL_SIZE >= JOURNAL_COMPACTION_SIZE:
+                save_descriptions(store)
+                _JOURNAL_SIZE = 0
+    return entry
+
+
+def flush_descriptions() -> None:
+    """Écrit le cache des descriptions sur disque (journal compris)."""
+    global _JOURNAL_SIZE
+    with _LOCK:
+        save_descriptions(_get_store())
+        _JOURNAL_SIZE = 0
+
+
+def compact_job_details(job: Dict[str, Any], job_details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Enregistre la description d'un job et retourne des détails prêts pour un prompt.
+
+    La description compactée remplace 'description' ; la version brute reste
+    disponible sous 'raw_description'.
+    """
+    entry = record_description(job, job_details)
+    saved = entry["raw_tokens"] - entry["compact_tokens"]
+    if saved > 0:
+        print(f"✂️  Job {job['id']}: {entry['raw_tokens']} → {entry['compact_tokens']} tokens "
+              f"({saved / entry['raw_tokens']:.0%} de boilerplate retiré)")
+    return {
+        **job_details,
+        "description": entry["compact_description"],
+        "raw_description": entry["description"],
+    }
+
+
+def get_job_details(job: Dict[str, Any], save: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Retourne les détails d'un job depuis le stockage local, ou depuis LinkedIn s'il n'y est pas.
+
+    Les descriptions récupérées en ligne sont enregistrées pour les appels suivants.
+
+    Returns:
+        Dict avec 'description', 'status', 'workplace_type', ou None si la page est invalide
+    """
+    entry = get_stored_description(job["id"])
+    if entry is None:
+        job_details = extract_job_details(job["job_link"])
+        if not job_details:
+            return None
+        entry = record_description(job, job_details, save=save)
+    return {
+        "description": entry["description"],
+        "status": entry.get("status"),
+        "workplace_type": entry.get("workplace_type"),
+    }
+
+
+def iter_full_jobs(
+    job_ids: Iterable[int], max_workers: int = 8
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Charge les jobs complets (job brut + détails) en parallèle, au fur et à mesure.
+
+    Les jobs bruts sont lus une seule fois ; les descriptions déjà stockées ne
+    déclenchent aucune requête réseau. Le fichier de descriptions est écrit une
+    seule fois, une fois tous les jobs chargés.
+
+    Yields:
+        (job_id, job complet ou None, message d'erreur ou None), dans l'ordre d'arrivée
+    """
+    raw_jobs_map = {job["id"]: job for job in load_raw_jobs()}
+
+    def load(job_id: int) -> Dict[str, Any]:
+        job = raw_jobs_map.get(job_id)
+        if job is None:
+            raise ValueError(f"Job with ID {job_id} not found")
+        job_details = get_job_details(job, save=False)
+        if job_details is None:
+            raise ValueError(f"Could not fetch details for job {job_id}")
+        return {**job, **job_details}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(load, job_id): job_id for job_id in job_ids}
+            for future in as_completed(futures):
+                job_id = futures[future]
+                try:
+                    yield job_id, future.result(), None
+                except Exception as e:
+                    yield job_id, None, str(e)
+    finally:
+        flush_descriptions()
+
+
+def token_reduction_report(descriptions: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Calcule la réduction de tokens obtenue sur les descriptions stockées."""
+    if descriptions is None:
+        with _LOCK:
+            descriptions = dict(_get_store())
+    raw_tokens = sum(d["raw_tokens"] for d in descriptions.values())
+    compact_tokens = sum(d["compact_tokens"] for d in descriptions.values())
+    return {
+        "descriptions": len(descriptions),
+        "raw_tokens": raw_tokens,
+        "compact_tokens": compact_tokens,
+        "saved_tokens": raw_tokens - compact_tokens,
+        "reduction": (raw_tokens - compact_tokens) / raw_tokens if raw_tokens else 0.0,
+    }
+
+
+def rebuild_compacted_descriptions() -> Dict[str, Any]:
+    """
+    Reconstruit l'index sur toutes les descriptions stockées et recalcule les versions compactées.
+
+    Les premières offres d'une entreprise sont compactées avant que l'index ne connaisse
+    son boilerplate : une reconstruction complète corrige ça.
+    """
+    global _STORE, _INDEX, _JOURNAL_SIZE
+    with _LOCK:
+        store = load_descriptions()
+        index = BoilerplateIndex()
+        for entry in store.values():
+            index.add(entry["id"], entry.get("company"), entry.get("title"), entry["description"])
+        for entry in store.values():
+            compact = index.compact(entry.get("company"), entry["description"])
+            entry["compact_description"] = compact
+            entry["raw_tokens"] = estimate_tokens(entry["description"])
+            entry["compact_tokens"] = estimate_tokens(compact)
+        save_descriptions(store)
+        _STORE, _INDEX, _JOURNAL_SIZE = store, index, 0
+    return token_reduction_report(store)
+
+
+if __name__ == "__main__":
+    report = rebuild_compacted_descriptions()
+    print(f"📋 {report['descriptions']} descriptions compactées")
+    print(f"   Tokens bruts:     {report['raw_tokens']}")
+    print(f"   Tokens compactés: {report['compact_tokens']}")
+    print(f"   Réduction:        {report['saved_tokens']} tokens ({report['reduction']:.1%})")
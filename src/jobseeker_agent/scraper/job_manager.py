@@ -5,6 +5,9 @@ from typing import Any, Dict, List, Optional
 from jobseeker_agent.utils.paths import get_raw_jobs_json_path
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
 from jobseeker_agent.scraper.date_parser import parse_relative_date
+from jobseeker_agent.scraper.dedup import register_job
+from jobseeker_agent.scraper.descriptions import record_description
+from jobseeker_agent.utils.events import JOB_ADDED, publish
 
 
 def load_raw_jobs() -> List[Dict[str, Any]]:
@@ -34,14 +37,23 @@ def save_raw_jobs(jobs: List[Dict[str, Any]]) -> None:
         json.dump(jobs, f, indent=4, ensure_ascii=False)
 
 
-def add_new_job(job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def add_new_job(
+    job_data: Dict[str, Any],
+    jobs_by_id: Optional[Dict[int, Dict[str, Any]]] = None,
+    save_index: bool = True
+) -> Optional[Dict[str, Any]]:
     """Ajoute une nouvelle offre d'emploi si elle n'existe pas déjà.
 
-    L'offre est identifiée par son URL pour éviter les doublons.
-    Un identifiant unique est ajouté à l'offre.
+    L'offre est identifiée par son URL pour éviter les doublons. Les quasi-doublons
+    (même offre republiée sous une autre URL) sont conservés mais rattachés à l'offre
+    canonique via 'duplicate_of'. Un identifiant unique est ajouté à l'offre.
 
     Args:
         job_data (Dict[str, Any]): Les données de l'offre d'emploi.
+        jobs_by_id (Optional[Dict[int, Dict[str, Any]]]): Offres existantes par ID, construites une
+            fois pour tout un scraping et complétées avec l'offre ajoutée. Reconstruites si None.
+        save_index (bool): Si False, l'index MinHash n'est pas réécrit ; appeler
+            `flush_minhash_index` en fin de scraping.
 
     Returns:
         Optional[Dict[str, Any]]: L'offre d'emploi ajoutée avec son ID, ou None si l'offre existait déjà.
@@ -72,8 +84,23 @@ def add_new_job(job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     
     # Ajouter le nouvel emploi
     new_job = {"id": new_id, **job_data}
+
+    # Stocker la description et rattacher l'offre à son original si c'est un quasi-doublon
+    if analysis_results:
+        record_description(new_job, analysis_results)
+        if jobs_by_id is None:
+            jobs_by_id = {job["id"]: job for job in jobs}
+        duplicate = register_job(new_job, analysis_results["description"], jobs_by_id, save=save_index)
+        if duplicate:
+            canonical_id, similarity = duplicate
+            new_job["duplicate_of"] = canonical_id
+            print(f"🔗 Job {new_id} is a near-duplicate of job {canonical_id} (similarity {similarity:.0%})")
+
     jobs.append(new_job)
+    if jobs_by_id is not None:
+        jobs_by_id[new_id] = new_job
     
     save_raw_jobs(jobs)
+    publish(JOB_ADDED, job=new_job)
     
     return new_job
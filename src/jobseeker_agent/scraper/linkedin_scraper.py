@@ -10,7 +10,8 @@ from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
 from jobseeker_agent.scraper.linkedin_query import QueryBuilder
-from jobseeker_agent.scraper.job_manager import add_new_job
+from jobseeker_agent.scraper.dedup import flush_minhash_index
+from jobseeker_agent.scraper.job_manager import add_new_job, load_raw_jobs
 
 
 @dataclass
@@ -65,6 +66,8 @@ class LinkedInJobsScraper:
         new_jobs_count = 0
         total_jobs_processed = 0
         start = 0
+        # Built once for the whole scrape; the MinHash index is saved once at the end
+        jobs_by_id = {job["id"]: job for job in load_raw_jobs()}
 
         while total_jobs_processed < max_jobs:
             try:
@@ -89,7 +92,7 @@ class LinkedInJobsScraper:
                             "job_link": job_data.job_link,
                             "posted_date": job_data.posted_date,
                         }
-                        added_job = add_new_job(job_dict)
+                        added_job = add_new_job(job_dict, jobs_by_id, save_index=False)
                         if added_job:
                             new_jobs_count += 1
                             print(f"Added new job: {job_data.title}")
@@ -107,6 +110,7 @@ class LinkedInJobsScraper:
             except Exception as e:
                 print(f"Scraping error: {str(e)}")
                 break
+        flush_minhash_index()
         return new_jobs_count
 
     def _build_search_url(
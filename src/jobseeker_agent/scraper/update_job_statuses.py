@@ -1,6 +1,7 @@
 import json
 from jobseeker_agent.scraper.extract_job_details import extract_job_details
 from jobseeker_agent.scraper.job_manager import load_raw_jobs, save_raw_jobs
+from jobseeker_agent.utils.events import JOB_CLOSED, publish
 from tqdm import tqdm
 
 def update_job_statuses(status_callback=None):
@@ -18,6 +19,7 @@ def update_job_statuses(status_callback=None):
     total_jobs = len(jobs_to_check)
     
     updated_jobs = []
+    closed_job_ids = []
     jobs_updated_count = 0
 
     print(f"Starting job status update for {total_jobs} jobs (skipping {len(raw_jobs) - total_jobs} already closed)...")
@@ -43,6 +45,7 @@ def update_job_statuses(status_callback=None):
 
         if is_closed and original_status != 'Closed':
             job['status'] = 'Closed'
+            closed_job_ids.append(job.get('id'))
             jobs_updated_count += 1
             if not analysis_result:
                 print(f"Updating job {job.get('id')} to 'Closed' because its page could not be accessed: {job.get('title')}")
@@ -52,6 +55,8 @@ def update_job_statuses(status_callback=None):
         updated_jobs.append(job)
 
     save_raw_jobs(updated_jobs)
+    for job_id in closed_job_ids:
+        publish(JOB_CLOSED, job_id=job_id)
 
     print("\nUpdate process finished.")
     print(f"Total jobs updated to 'Closed': {jobs_updated_count}")
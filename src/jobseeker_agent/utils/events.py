@@ -0,0 +1,50 @@
+"""
+Bus d'événements en mémoire (publish/subscribe) entre les modules.
+
+Permet au scraper, au reviewer et à l'interface de se tenir au courant des
+changements sans dépendre les uns des autres : le scraper publie "job_added",
+les abonnés (file de review, vues du dashboard...) mettent à jour leur état.
+Les callbacks sont appelés de façon synchrone, dans le thread qui publie.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+
+# Un job a été ajouté à raw_jobs (payload: job)
+JOB_ADDED = "job_added"
+# Un job est passé au statut "Closed" (payload: job_id)
+JOB_CLOSED = "job_closed"
+# Une review a été enregistrée dans reviews.json (payload: review)
+REVIEW_SAVED = "review_saved"
+# Le statut de traitement d'un job (postulé / pas intéressé) a changé (payload: status)
+JOB_STATUS_CHANGED = "job_status_changed"
+
+_LOCK = threading.Lock()
+_SUBSCRIBERS: Dict[str, List[Callable[..., Any]]] = defaultdict(list)
+
+
+def subscribe(event: str, callback: Callable[..., Any]) -> None:
+    """Abonne un callback à un événement ; il sera appelé avec le payload en arguments nommés."""
+    with _LOCK:
+        if callback not in _SUBSCRIBERS[event]:
+            _SUBSCRIBERS[event].append(callback)
+
+
+def unsubscribe(event: str, callback: Callable[..., Any]) -> None:
+    """Désabonne un callback."""
+    with _LOCK:
+        if callback in _SUBSCRIBERS[event]:
+            _SUBSCRIBERS[event].remove(callback)
+
+
+def publish(event: str, **payload: Any) -> None:
+    """Notifie tous les abonnés d'un événement. L'erreur d'un abonné n'interrompt pas les autres."""
+    with _LOCK:
+        callbacks = list(_SUBSCRIBERS[event])
+    for callback in callbacks:
+        try:
+            callback(**payload)
+        except Exception as e:
+            print(f"⚠️  Error in '{event}' subscriber {getattr(callback, '__name__', callback)}: {e}")
@@ -0,0 +1,266 @@
+"""
+Faux modèle de chat, sans appel réseau, pour les benchmarks et les tests.
+
+`get_llm("fake:<nom>")` retourne un `FakeChatModel` qui imite l'interface utilisée
+dans le projet (`invoke`, `with_structured_output`) :
+- les sorties structurées respectent le schéma demandé (TypedDict converti en JSON Schema),
+- les sorties sont déterministes : elles ne dépendent que du nom du modèle, de la graine et des messages,
+- la latence et le taux d'erreur sont configurables,
+- l'usage en tokens est estimé et remonté aux callbacks (UsageMetadataCallbackHandler),
+- les champs enregistrés avec `register_field_values` puisent leurs valeurs dans le prompt
+  (clés d'expériences et compétences du CV pour le ranker, job_id des offres d'un lot...),
+  pour que la sortie soit exploitable par la suite du pipeline. Les autres champs texte
+  sont des mots au hasard : ils respectent le schéma, pas le sens.
+
+Configuration dans le nom du modèle, façon query string :
+    fake:reviewer?latency=0.8&jitter=0.3&distribution=lognormal&error_rate=0.05&seed=1
+
+- latency: latence médiane en secondes (0 par défaut)
+- jitter: dispersion (écart-type du log pour "lognormal", demi-largeur relative pour "uniform")
+- distribution: "fixed", "uniform" ou "lognormal"
+- error_rate: probabilité qu'un appel lève FakeLLMError
+- seed: graine combinée au contenu des messages
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl
+
+from langchain.schema import AIMessage
+
+from jobseeker_agent.utils.llm import estimate_tokens, get_json_schema
+
+
+FAKE_PREFIX = "fake:"
+DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+_USAGE_LOCK = threading.Lock()
+
+_WORDS = (
+    "python optimization research team product data model pipeline agent planning "
+    "robotics defense cloud evaluation experience remote senior machine learning "
+    "operations solver reinforcement language startup scientist engineer"
+).split()
+
+
+# Nom de champ -> fonction (texte du prompt -> valeurs plausibles du champ)
+_FIELD_VALUES: Dict[str, Callable[[str], List[Any]]] = {}
+
+
+class FakeLLMError(RuntimeError):
+    """Erreur simulée par le faux modèle."""
+
+
+def register_field_values(field: str, extractor: Callable[[str], List[Any]]) -> None:
+    """
+    Fait puiser au faux modèle les valeurs d'un champ de sortie structurée dans le prompt.
+
+    Un champ liste reçoit une permutation des valeurs, un champ scalaire l'une d'elles ;
+    un tableau d'objets dont un champ scalaire est enregistré contient un objet par valeur
+    (ex. une review par job_id présent dans le prompt). Sans valeur trouvée dans le prompt,
+    le champ est généré au hasard.
+    """
+    _FIELD_VALUES[field] = extractor
+
+
+def _field_values(text: str) -> Dict[str, List[Any]]:
+    values = {}
+    for field, extractor in _FIELD_VALUES.items():
+        field_values = extractor(text)
+        if field_values:
+            values[field] = list(field_values)
+    return values
+
+
+def _key_field(items: Dict[str, Any], field_values: Dict[str, List[Any]]) -> Optional[str]:
+    """Champ scalaire enregistré des objets d'un tableau, qui détermine ses éléments."""
+    if items.get("type") != "object":
+        return None
+    for name, prop in (items.get("properties") or {}).items():
+        if name in field_values and prop.get("type") != "array":
+            return name
+    return None
+
+
+def parse_fake_model_name(model_name: str) -> Dict[str, Any]:
+    """Décode "fake:<nom>?param=valeur&..." en configuration."""
+    name, _, query = model_name[len(FAKE_PREFIX):].partition("?")
+    params = dict(parse_qsl(query))
+    config = {
+        "name": name or "default",
+        "latency": float(params.get("latency", 0.0)),
+        "jitter": float(params.get("jitter", 0.0)),
+        "distribution": params.get("distribution", "lognormal" if "jitter" in params else "fixed"),
+        "error_rate": float(params.get("error_rate", 0.0)),
+        "seed": int(params.get("seed", 0)),
+    }
+    if config["distribution"] not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown latency distribution: {config['distribution']}")
+    return config
+
+
+def _message_text(message: Any) -> str:
+    if isinstance(message, str):
+        return message
+    if isinstance(message, dict):
+        return str(message.get("content", ""))
+    return str(getattr(message, "content", ""))
+
+
+def fake_from_json_schema(
+    schema: Dict[str, Any],
+    rng: random.Random,
+    depth: int = 0,
+    field_values: Optional[Dict[str, List[Any]]] = None,
+) -> Any:
+    """
+    Génère une valeur valide pour un JSON Schema (sous-ensemble produit par get_json_schema).
+
+    Args:
+        field_values: Nom de champ -> valeurs à utiliser (voir `register_field_values`)
+    """
+    field_values = field_values or {}
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    if "anyOf" in schema:
+        options = [s for s in schema["anyOf"] if s.get("type") != "null"] or schema["anyOf"]
+        return fake_from_json_schema(rng.choice(options), rng, depth, field_values)
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        if "properties" in schema:
+            output = {}
+            for name, prop in schema["properties"].items():
+                values = field_values.get(name)
+                if values and prop.get("type") == "array":
+                    output[name] = rng.sample(values, len(values))
+                elif values:
+                    output[name] = rng.choice(values)
+                else:
+                    output[name] = fake_from_json_schema(prop, rng, depth + 1, field_values)
+            return output
+        # Dict[str, X] : quelques clés arbitraires
+        return {f"{rng.choice(_WORDS)}_{i}": rng.choice(_WORDS) for i in range(rng.randint(1, 3))}
+    if schema_type == "array":
+        items = schema.get("items", {})
+        key = _key_field(items, field_values)
+        if key is not None:
+            elements = []
+            for value in field_values[key]:
+                element = fake_from_json_schema(items, rng, depth + 1, field_values)
+                element[key] = value
+                elements.append(element)
+            return elements
+        count = rng.randint(1, 4) if depth < 4 else 0
+        return [fake_from_json_schema(items, rng, depth + 1, field_values) for _ in range(count)]
+    if schema_type == "integer":
+        return rng.randint(1, 25)
+    if schema_type == "number":
+        return round(rng.uniform(-3, 3), 1)
+    if schema_type == "boolean":
+        return rng.random() < 0.5
+    if schema_type == "null":
+        return None
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 12)))
+
+
+def _fake_text(rng: random.Random, words: int = 250) -> str:
+    sentences = []
+    while words > 0:
+        length = min(words, rng.randint(8, 20))
+        sentence = " ".join(rng.choice(_WORDS) for _ in range(length))
+        sentences.append(sentence[0].upper() + sentence[1:] + ".")
+        words -= length
+    return " ".join(sentences)
+
+
+class FakeChatModel:
+    """Faux modèle de chat (voir le docstring du module)."""
+
+    def __init__(self, model_name: str, schema: Any = None, json_schema: Optional[Dict[str, Any]] = None):
+        self.model_name = model_name
+        self.config = parse_fake_model_name(model_name)
+        self.schema = schema
+        self.json_schema = json_schema if json_schema is not None else (get_json_schema(schema) if schema is not None else None)
+
+    def with_structured_output(self, schema: Any) -> "FakeChatModel":
+        return FakeChatModel(self.model_name, schema=schema)
+
+    def _rng(self, messages: List[Any]) -> random.Random:
+        text = "\n".join(_message_text(m) for m in messages)
+        return random.Random(zlib.crc32(f"{self.config['name']}|{self.config['seed']}|{text}".encode()))
+
+    def _latency(self, rng: random.Random) -> float:
+        latency, jitter = self.config["latency"], self.config["jitter"]
+        if self.config["distribution"] == "uniform":
+            return max(0.0, rng.uniform(latency * (1 - jitter), latency * (1 + jitter)))
+        if self.config["distribution"] == "lognormal" and latency > 0:
+            return rng.lognormvariate(math.log(latency), jitter)
+        return latency
+
+    def generate(self, messages: List[Any]) -> Dict[str, Any]:
+        """
+        Produit la réponse (sans attendre ni lever d'erreur).
+
+        Returns:
+            Dict avec 'output' (dict structuré ou texte), 'latency', 'failed' et 'usage'
+        """
+        rng = self._rng(messages)
+        latency = self._latency(rng)
+        failed = rng.random() < self.config["error_rate"]
+        if self.json_schema is not None:
+            text = "\n".join(_message_text(m) for m in messages)
+            output = fake_from_json_schema(self.json_schema, rng, field_values=_field_values(text))
+            output_text = json.dumps(output)
+        else:
+            output = output_text = _fake_text(rng)
+        input_tokens = sum(estimate_tokens(_message_text(m)) for m in messages)
+        output_tokens = estimate_tokens(output_text)
+        return {
+            "output": output,
+            "latency": latency,
+            "failed": failed,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens},
+        }
+
+    def _report_usage(self, usage: Dict[str, int], config: Optional[Dict[str, Any]]) -> None:
+        """Cumule l'usage dans les callbacks qui le suivent (UsageMetadataCallbackHandler)."""
+        for callback in (config or {}).get("callbacks") or []:
+            usage_metadata = getattr(callback, "usage_metadata", None)
+            if not isinstance(usage_metadata, dict):
+                continue
+            with _USAGE_LOCK:
+                current = usage_metadata.get(self.model_name) or {}
+                usage_metadata[self.model_name] = {
+                    key: current.get(key, 0) + value for key, value in usage.items()
+                }
+
+    def invoke(self, messages: Any, config: Optional[Dict[str, Any]] = None) -> Any:
+        if not isinstance(messages, list):
+            messages = [messages]
+        result = self.generate(messages)
+        if result["latency"] > 0:
+            time.sleep(result["latency"])
+        self._report_usage(result["usage"], config)
+        if result["failed"]:
+            raise FakeLLMError(f"Simulated failure of {self.model_name}")
+        if self.json_schema is not None:
+            return result["output"]
+        return AIMessage(content=result["output"], usage_metadata=result["usage"])
+
+
+def fake_batch_responder(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Réponse d'un faux modèle à une requête de batch (format chat completions, json_schema)."""
+    json_schema = ((body.get("response_format") or {}).get("json_schema") or {}).get("schema")
+    model_name = body.get("model", "")
+    if not model_name.startswith(FAKE_PREFIX):
+        model_name = FAKE_PREFIX + model_name
+    model = FakeChatModel(model_name, json_schema=json_schema or {})
+    result = model.generate(body.get("messages", []))
+    if result["failed"]:
+        raise FakeLLMError(f"Simulated failure of {model_name}")
+    return result["output"]
@@ -2,7 +2,8 @@
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_anthropic import ChatAnthropic
-from typing import Optional
+from typing import Any, Dict, Literal, Optional, Union, get_args, get_origin, get_type_hints
+from typing_extensions import Annotated, is_typeddict
 
 # Prix par million de tokens (input/output) - À mettre à jour régulièrement selon les prix actuels
 MODEL_PRICES = {
@@ -28,7 +29,98 @@ MODEL_PRICES = {
     "gemini-2.0-flash": {"input": 0.10, "output": 0.40},
     "gemini-2.5-flash": {"input": 0.10, "output": 0.40},
     "gemini-2.5-pro": {"input": 1.25, "output": 5.00},  # Estimation - à vérifier
+
+    # Faux modèles (benchmarks et tests, voir utils/fake_llm.py)
+    "fake:": {"input": 0.0, "output": 0.0},
+}
+
+
+# Fenêtre de contexte et nombre maximal de tokens de sortie (par préfixe de nom de modèle)
+MODEL_LIMITS = {
+    # OpenAI
+    "gpt-o4-mini": {"context": 200_000, "output": 100_000},
+    "gpt-4.1": {"context": 1_047_576, "output": 32_768},
+    "gpt-5": {"context": 400_000, "output": 128_000},
+
+    # Anthropic
+    "claude-3-5-sonnet": {"context": 200_000, "output": 8_192},
+    "claude-3": {"context": 200_000, "output": 4_096},
+
+    # Google Gemini
+    "gemini-1.5-pro": {"context": 2_097_152, "output": 8_192},
+    "gemini-1.5-flash": {"context": 1_048_576, "output": 8_192},
+    "gemini-2.0-flash": {"context": 1_048_576, "output": 8_192},
+    "gemini-2.5": {"context": 1_048_576, "output": 65_536},
+
+    # Faux modèles
+    "fake:": {"context": 1_000_000, "output": 100_000},
 }
+# Limites prudentes pour un modèle inconnu
+DEFAULT_MODEL_LIMITS = {"context": 128_000, "output": 4_096}
+
+
+def get_model_limits(model_name: str) -> dict:
+    """
+    Retourne la fenêtre de contexte et la limite de tokens de sortie d'un modèle.
+
+    Le préfixe connu le plus long l'emporte (ex: "gpt-4.1-mini" -> "gpt-4.1").
+    """
+    model_lower = model_name.lower()
+    matches = [known for known in MODEL_LIMITS if model_lower.startswith(known)]
+    if not matches:
+        return DEFAULT_MODEL_LIMITS
+    return MODEL_LIMITS[max(matches, key=len)]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimation grossière du nombre de tokens (~4 caractères par token)."""
+    return (len(text) + 3) // 4
+
+
+def get_json_schema(schema: Any) -> Dict[str, Any]:
+    """
+    Convertit un type Python (TypedDict annoté, List, Optional, Literal...) en JSON Schema,
+    tel qu'attendu par les API de sortie structurée.
+    """
+    origin = get_origin(schema)
+    if origin is Annotated:
+        base, *metadata = get_args(schema)
+        result = get_json_schema(base)
+        descriptions = [m for m in metadata if isinstance(m, str)]
+        if descriptions:
+            result["description"] = descriptions[-1]
+        return result
+    if is_typeddict(schema):
+        hints = get_type_hints(schema, include_extras=True)
+        result = {
+            "type": "object",
+            "properties": {name: get_json_schema(hint) for name, hint in hints.items()},
+            "required": sorted(getattr(schema, "__required_keys__", hints.keys())),
+            "additionalProperties": False,
+        }
+        if schema.__doc__:
+            result["description"] = schema.__doc__
+        return result
+    if origin in (list, tuple, set):
+        args = get_args(schema)
+        return {"type": "array", "items": get_json_schema(args[0]) if args else {}}
+    if origin is dict:
+        return {"type": "object"}
+    if origin is Union:
+        return {"anyOf": [get_json_schema(arg) for arg in get_args(schema)]}
+    if origin is Literal:
+        return {"enum": list(get_args(schema))}
+    if schema is type(None):
+        return {"type": "null"}
+    if schema is bool:
+        return {"type": "boolean"}
+    if schema is int:
+        return {"type": "integer"}
+    if schema is float:
+        return {"type": "number"}
+    if schema is str:
+        return {"type": "string"}
+    return {}
 
 
 def calculate_cost(model_name: str, input_tokens: int, output_tokens: int) -> float:
@@ -78,7 +170,13 @@ def get_llm(model_name: str, temperature: float = 0, reasoning: Optional[dict] =
     Returns:
         Instance du modèle de chat.
     """
-    if model_name.startswith("gpt"):
+    if model_name.startswith("fake:"):
+        # Import local : fake_llm dépend de ce module
+        from jobseeker_agent.utils.fake_llm import FakeChatModel
+        print(f"✅ Chargement du faux modèle : {model_name}")
+        return FakeChatModel(model_name)
+
+    elif model_name.startswith("gpt"):
         print(f"✅ Chargement du modèle OpenAI : {model_name}")
         return ChatOpenAI(model=model_name, temperature=temperature, reasoning=reasoning)
     
@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import os
 import inspect
 
 from typing import List, Dict, Any, Union
@@ -19,7 +20,7 @@ def load_cv_template(lang: str = "en") -> str:
     """Loads the CV template from the file."""
     if lang not in ["en", "fr"]:
         raise ValueError("Language not supported, please choose 'en' or 'fr'")
-    cv_path = get_data_path() / "resume" / "template" / f"cv-{lang}.tex"
+    cv_path = get_cv_template_path(lang)
     with open(cv_path, "r") as f:
         return f.read()
 
@@ -33,6 +34,18 @@ def load_cover_letter_template(lang: str = "en") -> str:
         return f.read()
 
 
+def get_cv_template_path(lang: str = "en") -> Path:
+    """Retourne le chemin vers le template LaTeX du CV."""
+    return get_data_path() / "resume" / "template" / f"cv-{lang}.tex"
+
+
+def get_latex_formats_dir() -> Path:
+    """Retourne le chemin vers le dossier des formats LaTeX précompilés des templates de CV."""
+    formats_dir = get_data_path() / "resume" / "template" / "formats"
+    formats_dir.mkdir(parents=True, exist_ok=True)
+    return formats_dir
+
+
 def get_reviewer_data_dir() -> Path:
     """Retourne le chemin vers le dossier reviewer."""
     reviewer_dir = get_data_path() / "reviewer"
@@ -60,6 +73,24 @@ def get_raw_jobs_json_path() -> Path:
     raw_jobs_dir.mkdir(parents=True, exist_ok=True)
     return raw_jobs_dir / "raw_jobs.json"
 
+def get_descriptions_json_path() -> Path:
+    """Retourne le chemin vers le fichier JSON des descriptions (brutes et compactées)."""
+    raw_jobs_dir = get_data_path() / "raw_jobs"
+    raw_jobs_dir.mkdir(parents=True, exist_ok=True)
+    return raw_jobs_dir / "descriptions.json"
+
+def get_descriptions_journal_path() -> Path:
+    """Retourne le chemin vers le journal (JSON Lines) des descriptions ajoutées depuis la dernière sauvegarde complète."""
+    raw_jobs_dir = get_data_path() / "raw_jobs"
+    raw_jobs_dir.mkdir(parents=True, exist_ok=True)
+    return raw_jobs_dir / "descriptions.journal.jsonl"
+
+def get_minhash_index_path() -> Path:
+    """Retourne le chemin vers l'index MinHash des offres (détection des doublons)."""
+    raw_jobs_dir = get_data_path() / "raw_jobs"
+    raw_jobs_dir.mkdir(parents=True, exist_ok=True)
+    return raw_jobs_dir / "minhash_index.npz"
+
 def get_reviews_json_path() -> Path:
     """Retourne le chemin vers le fichier JSON des reviews."""
     return get_reviewer_data_dir() / "reviews.json"
@@ -72,6 +103,38 @@ def get_processed_jobs_json_path() -> Path:
     """Retourne le chemin vers le fichier JSON des jobs traités."""
     return get_reviewer_data_dir() / "processed_jobs.json"
 
+def get_prefiltered_jobs_json_path() -> Path:
+    """Retourne le chemin vers le fichier JSON des jobs ignorés par le pré-filtre."""
+    return get_reviewer_data_dir() / "prefiltered_jobs.json"
+
+def get_review_batches_dir() -> Path:
+    """Retourne le chemin vers le dossier des batchs de review hors ligne."""
+    batches_dir = get_reviewer_data_dir() / "batches"
+    batches_dir.mkdir(parents=True, exist_ok=True)
+    return batches_dir
+
+def get_review_priorities_path() -> Path:
+    """Retourne le chemin vers le fichier JSON des priorités de review."""
+    return get_reviewer_data_dir() / "review_priorities.json"
+
+def get_interface_data_dir() -> Path:
+    """Retourne le chemin vers le dossier des données de l'interface."""
+    interface_dir = get_data_path() / "interface"
+    interface_dir.mkdir(parents=True, exist_ok=True)
+    return interface_dir
+
+def get_tasks_json_path() -> Path:
+    """Retourne le chemin vers le fichier JSON de la table des tâches de l'interface."""
+    return get_interface_data_dir() / "tasks.json"
+
+def get_task_statuses_json_path() -> Path:
+    """Retourne le chemin vers le fichier JSON des statuts des tâches de fond (scraping, review...)."""
+    return get_interface_data_dir() / "task_statuses.json"
+
+def get_criteria_weights_path() -> Path:
+    """Retourne le chemin vers le fichier JSON des poids des critères."""
+    return get_reviewer_data_dir() / "criteria_weights.json"
+
 def get_reviewer_labels_path(generation_id: int) -> Path:
     """Retourne le chemin vers le fichier JSON des labels."""
     labels_dir = get_data_path() / "reviewer" / "tests" / str(generation_id)
@@ -262,5 +325,97 @@ def save_processed_jobs(processed_jobs: List[int]) -> None:
         json.dump(processed_jobs, f, indent=4)
 
 
+def load_criteria_weights() -> Dict[int, float]:
+    """Charge les poids des critères personnalisés (vide si aucun n'a été enregistré)."""
+    weights_path = get_criteria_weights_path()
+    if not weights_path.exists():
+        return {}
+    with open(weights_path, "r") as f:
+        try:
+            return {int(w["id"]): float(w["weight"]) for w in json.load(f)}
+        except json.JSONDecodeError:
+            return {}
+
+def save_criteria_weights(weights: Dict[int, float]) -> None:
+    """Sauvegarde les poids des critères dans le fichier JSON."""
+    weights_path = get_criteria_weights_path()
+    with open(weights_path, "w") as f:
+        json.dump([{"id": cid, "weight": w} for cid, w in sorted(weights.items())], f, indent=4)
+
+
+def load_prefiltered_jobs() -> List[Dict[str, Any]]:
+    """Charge les jobs ignorés par le pré-filtre (id, score, date)."""
+    prefiltered_path = get_prefiltered_jobs_json_path()
+    if not prefiltered_path.exists():
+        return []
+    with open(prefiltered_path, "r") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return []
+
+def save_prefiltered_jobs(prefiltered_jobs: List[Dict[str, Any]]) -> None:
+    """Sauvegarde les jobs ignorés par le pré-filtre dans le fichier JSON."""
+    prefiltered_path = get_prefiltered_jobs_json_path()
+    with open(prefiltered_path, "w") as f:
+        json.dump(prefiltered_jobs, f, indent=4)
+
+
+def load_review_priorities() -> Dict[int, float]:
+    """Charge les priorités de review des jobs (vide si aucune n'a été définie)."""
+    priorities_path = get_review_priorities_path()
+    if not priorities_path.exists():
+        return {}
+    with open(priorities_path, "r") as f:
+        try:
+            return {int(p["id"]): float(p["priority"]) for p in json.load(f)}
+        except json.JSONDecodeError:
+            return {}
+
+def save_review_priorities(priorities: Dict[int, float]) -> None:
+    """Sauvegarde les priorités de review dans le fichier JSON."""
+    priorities_path = get_review_priorities_path()
+    with open(priorities_path, "w") as f:
+        json.dump([{"id": job_id, "priority": p} for job_id, p in sorted(priorities.items())], f, indent=4)
+
+
+def load_tasks() -> List[Dict[str, Any]]:
+    """Charge la table des tâches de l'interface (vide si le fichier n'existe pas)."""
+    tasks_path = get_tasks_json_path()
+    if not tasks_path.exists():
+        return []
+    with open(tasks_path, "r") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return []
+
+def save_tasks(tasks: List[Dict[str, Any]]) -> None:
+    """Sauvegarde la table des tâches de l'interface dans le fichier JSON."""
+    tasks_path = get_tasks_json_path()
+    with open(tasks_path, "w") as f:
+        json.dump(tasks, f, indent=4)
+
+
+def load_task_statuses() -> Dict[str, Dict[str, Any]]:
+    """Charge les statuts des tâches de fond (vide si le fichier n'existe pas ou est en cours d'écriture)."""
+    statuses_path = get_task_statuses_json_path()
+    if not statuses_path.exists():
+        return {}
+    with open(statuses_path, "r") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+def save_task_statuses(statuses: Dict[str, Dict[str, Any]]) -> None:
+    """Sauvegarde les statuts des tâches de fond (écriture atomique, lus par les autres processus)."""
+    statuses_path = get_task_statuses_json_path()
+    tmp_path = statuses_path.with_name(f".{statuses_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(statuses, f, indent=4, default=str)
+    os.replace(tmp_path, statuses_path)
+
+
 if __name__ == "__main__":
     print(get_linkedin_keywords_path())
\ No newline at end of file